@@ -804,6 +804,35 @@ class ControlDependenceGraph(ProgramGraph[ProgramGraphNode]):
                 result.update(self._retrieve_control_dependencies(pred, handled))
         return result
 
+    def compute_predicate_distances(self) -> dict[int, tuple[tuple[int, int], ...]]:
+        """Computes the lengths of the shortest paths between the predicate nodes.
+
+        Must be called after the predicates were registered, i.e., after the
+        instrumentation assigned the predicate ids to the nodes.
+
+        Returns:
+            For each predicate, the lengths of the shortest paths to its node from the
+            nodes of other predicates together with their predicate ids, ordered
+            by ascending length.  Predicates whose nodes do not reach its node are
+            omitted.
+        """
+        predicate_nodes = [
+            node for node in self._graph.nodes if node.predicate_id is not None
+        ]
+        distances: dict[int, list[tuple[int, int]]] = {
+            node.predicate_id: [] for node in predicate_nodes
+        }
+        for source in predicate_nodes:
+            for target, length in nx.single_source_shortest_path_length(
+                self._graph, source
+            ).items():
+                if target.predicate_id is not None and target is not source:
+                    distances[target.predicate_id].append((length, source.predicate_id))
+        return {
+            predicate_id: tuple(sorted(sources))
+            for predicate_id, sources in distances.items()
+        }
+
     def is_control_dependent_on_root(self, node: ProgramGraphNode) -> bool:
         """Does this node directly depend on entering the code object?
 
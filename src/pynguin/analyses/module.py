@@ -449,13 +449,16 @@ class TestCluster(abc.ABC):
         accessible: GenericCallableAccessibleObject,
         param_name: str,
         knowledge: tt.UsageTraceNode,
-    ) -> None:
+    ) -> bool:
         """Update the knowledge about the parameter of the given accessible.
 
         Args:
             accessible: the accessible that was observed.
             param_name: the parameter name for which we have new information.
             knowledge: the new information.
+
+        Returns:
+            Whether the knowledge about the parameter changed.
         """
 
 
@@ -538,6 +541,15 @@ class ModuleTestCluster(TestCluster):
         # Keep track of all callables, this is only for statistics purposes.
         self.__callables: OrderedSet[GenericCallableAccessibleObject] = OrderedSet()
 
+        # The results of get_generators_for and get_modifiers_for, which are
+        # computed on demand and invalidated when the generators or modifiers change.
+        self.__generators_index: dict[
+            ProperType, tuple[OrderedSet[GenericAccessibleObject], bool]
+        ] = {}
+        self.__modifiers_index: dict[
+            ProperType, OrderedSet[GenericAccessibleObject]
+        ] = {}
+
     def log_cluster_statistics(self) -> None:
         stats = TypeGuessingStats()
         for accessible in self.__accessible_objects_under_test:
@@ -608,12 +620,11 @@ class ModuleTestCluster(TestCluster):
         if old_type == new_type:
             # No change
             return
+        self.__invalidate_generators_for(accessible.generated_type())
         self._drop_generator(accessible)
-        # Must invalidate entire cache, because subtype relationship might also change
-        # the return values which are not new_type or old_type.
-        self.get_generators_for.cache_clear()
         self.get_all_generatable_types.cache_clear()
         accessible.inferred_signature.return_type = new_type
+        self.__invalidate_generators_for(new_type)
         self.__generators[new_type].add(accessible)
 
     def update_parameter_knowledge(
@@ -621,9 +632,9 @@ class ModuleTestCluster(TestCluster):
         accessible: GenericCallableAccessibleObject,
         param_name: str,
         knowledge: tt.UsageTraceNode,
-    ) -> None:
+    ) -> bool:
         # Store new data
-        accessible.inferred_signature.usage_trace[param_name].merge(knowledge)
+        return accessible.inferred_signature.usage_trace[param_name].merge(knowledge)
 
     @property
     def type_system(self) -> TypeSystem:
@@ -647,8 +658,19 @@ class ModuleTestCluster(TestCluster):
             is_primitive_type
         ):
             return
+        self.__invalidate_generators_for(generated_type)
         self.__generators[generated_type].add(generator)
 
+    def __invalidate_generators_for(self, generated_type: ProperType) -> None:
+        # Only the generators for the types that the generated type might be a subtype
+        # of change, when a generator for the generated type is added or removed.
+        self.__generators_index = {
+            typ: generators
+            for typ, generators in self.__generators_index.items()
+            if not isinstance(typ, AnyType)
+            and not self.__type_system.is_maybe_subtype(generated_type, typ)
+        }
+
     def add_accessible_object_under_test(
         self, objc: GenericAccessibleObject, data: _CallableData
     ) -> None:
@@ -659,6 +681,7 @@ class ModuleTestCluster(TestCluster):
         if isinstance(obj, GenericCallableAccessibleObject):
             self.__callables.add(obj)
 
+        self.__modifiers_index.clear()
         self.__modifiers[typ].add(obj)
 
     @property
@@ -674,9 +697,16 @@ class ModuleTestCluster(TestCluster):
     def num_accessible_objects_under_test(self) -> int:
         return len(self.__accessible_objects_under_test)
 
-    @functools.lru_cache(maxsize=1024)
     def get_generators_for(
         self, typ: ProperType
+    ) -> tuple[OrderedSet[GenericAccessibleObject], bool]:
+        if (generators := self.__generators_index.get(typ)) is None:
+            generators = self.__compute_generators_for(typ)
+            self.__generators_index[typ] = generators
+        return generators
+
+    def __compute_generators_for(
+        self, typ: ProperType
     ) -> tuple[OrderedSet[GenericAccessibleObject], bool]:
         if isinstance(typ, AnyType):
             # Just take everything when it's Any.
@@ -738,7 +768,10 @@ class ModuleTestCluster(TestCluster):
             raise NotImplementedError("This type shall not be used during runtime")
 
     def get_modifiers_for(self, typ: ProperType) -> OrderedSet[GenericAccessibleObject]:
-        return typ.accept(self._FindModifiers(self))
+        if (modifiers := self.__modifiers_index.get(typ)) is None:
+            modifiers = typ.accept(self._FindModifiers(self))
+            self.__modifiers_index[typ] = modifiers
+        return modifiers
 
     @property
     def generators(self) -> dict[ProperType, OrderedSet[GenericAccessibleObject]]:
@@ -829,8 +862,10 @@ class FilteredModuleTestCluster(TestCluster):
         accessible: GenericCallableAccessibleObject,
         param_name: str,
         knowledge: tt.UsageTraceNode,
-    ) -> None:
-        self.__delegate.update_parameter_knowledge(accessible, param_name, knowledge)
+    ) -> bool:
+        return self.__delegate.update_parameter_knowledge(
+            accessible, param_name, knowledge
+        )
 
     @property
     def linenos(self) -> int:
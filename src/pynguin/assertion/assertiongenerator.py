@@ -36,6 +36,8 @@ from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
 if TYPE_CHECKING:
+    import mutpy.operators as mo
+
     import pynguin.ga.testcasechromosome as tcc
     import pynguin.ga.testsuitechromosome as tsc
     import pynguin.testcase.testcase as tc
@@ -79,8 +81,10 @@ class AssertionGenerator(cv.ChromosomeVisitor):
         with self._plain_executor.temporarily_add_observer(
             ato.AssertionTraceObserver()
         ):
-            for test in test_cases:
-                self._add_assertions_for(test, self._plain_executor.execute(test))
+            for test, result in zip(
+                test_cases, self._plain_executor.execute_many(test_cases), strict=True
+            ):
+                self._add_assertions_for(test, result)
 
         # Perform filtering executions to remove trivially flaky assertions.
         with self._plain_executor.temporarily_add_observer(
@@ -90,10 +94,12 @@ class AssertionGenerator(cv.ChromosomeVisitor):
                 # Create a copy of the list that is shuffled.
                 shuffled_copy = list(test_cases)
                 randomness.RNG.shuffle(shuffled_copy)
-                for test in shuffled_copy:
-                    self.__remove_non_holding_assertions(
-                        test, self._plain_executor.execute(test)
-                    )
+                for test, result in zip(
+                    shuffled_copy,
+                    self._plain_executor.execute_many(shuffled_copy),
+                    strict=True,
+                ):
+                    self.__remove_non_holding_assertions(test, result)
 
     @staticmethod
     def __remove_non_holding_assertions(test: tc.TestCase, result: ex.ExecutionResult):
@@ -156,6 +162,10 @@ class _MutantInfo:
     # Was the mutant killed by any test?
     killed_by: list[int] = dataclasses.field(default_factory=list)
 
+    # The tests that do not reach the mutated lines, thus they were not executed
+    # on the mutant.
+    not_covered_by: list[int] = dataclasses.field(default_factory=list)
+
 
 @dataclasses.dataclass
 class _MutationSummary:
@@ -195,6 +205,15 @@ class _MutationSummary:
         """
         return [info for info in self.mutant_information if info.timed_out_by]
 
+    def get_skipped_executions(self) -> int:
+        """Get the number of executions that were skipped, because the executed test
+        does not reach the mutated lines.
+
+        Returns:
+            The number of skipped executions
+        """
+        return sum(len(info.not_covered_by) for info in self.mutant_information)
+
     def get_metrics(self) -> _MutationMetrics:
         """Provide mutation metrics.
 
@@ -276,11 +295,52 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
 
         # Evil hack to change the way mutpy creates mutated modules.
         mutpy.utils.create_module = self._create_module_with_instrumentation
-        self._mutated_modules = [x for x, _ in adapter.mutate_module()]
+        mutants = adapter.mutate_module()
+        self._mutated_modules = [x for x, _ in mutants]
+        self._mutated_lines = [
+            self.__lines_of_mutations(mutations) for _, mutations in mutants
+        ]
+        # The lines that were covered by each test case during the plain execution.
+        self._plain_covered_lines: list[set[int]] = []
+
+    @staticmethod
+    def __lines_of_mutations(mutations: list[mo.Mutation]) -> set[int] | None:
+        lines: set[int] = set()
+        for mutation in mutations:
+            lineno = getattr(mutation.node, "lineno", None)
+            if lineno is None:
+                # We do not know where the mutant differs.
+                return None
+            end_lineno = getattr(mutation.node, "end_lineno", None) or lineno
+            lines.update(range(lineno, end_lineno + 1))
+        return lines
+
+    def __covered_lines(self, trace: ex.ExecutionTrace) -> set[int]:
+        # Depending on the coverage metrics, the trace contains the covered lines,
+        # the executed code objects or the executed instructions.
+        tracer = self._plain_executor.tracer
+        code_objects = tracer.get_subject_properties().existing_code_objects
+        lines = set(tracer.lineids_to_linenos(trace.covered_line_ids))
+        for code_object_id in trace.executed_code_objects:
+            code_object = code_objects[code_object_id].code_object
+            lines.update(
+                lineno for _, _, lineno in code_object.co_lines() if lineno is not None
+            )
+        lines.update(instr.lineno for instr in trace.executed_instructions)
+        return lines
+
+    def _add_assertions_for(self, test_case: tc.TestCase, result: ex.ExecutionResult):
+        super()._add_assertions_for(test_case, result)
+        self._plain_covered_lines.append(self.__covered_lines(result.execution_trace))
 
     def _add_assertions(self, test_cases: list[tc.TestCase]):
+        self._plain_covered_lines = []
         super()._add_assertions(test_cases)
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]] = [
+        # Lines that are executed when the module is imported, e.g., global
+        # variables, might affect every test.  If we do not know them, we cannot
+        # decide whether a test reaches a mutant.
+        import_lines = self.__covered_lines(self._plain_executor.tracer.import_trace)
+        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult | None]]] = [
             (test, []) for test in test_cases
         ]
 
@@ -297,8 +357,29 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
                     module_name=config.configuration.module_name,
                     mutated_module=mutated_module,
                 )
-                for test, results in tests_and_results:
-                    results.append(self._mutation_executor.execute(test))
+                mutated_lines = self._mutated_lines[idx]
+                covering = [
+                    mutated_lines is None
+                    or not import_lines
+                    or not mutated_lines.isdisjoint(import_lines)
+                    or not mutated_lines.isdisjoint(covered_lines)
+                    for covered_lines in self._plain_covered_lines
+                ]
+                executed_results = iter(
+                    self._mutation_executor.execute_many(
+                        [
+                            test
+                            for test, covers in zip(test_cases, covering, strict=True)
+                            if covers
+                        ]
+                    )
+                )
+                for (_, results), covers in zip(
+                    tests_and_results, covering, strict=True
+                ):
+                    results.append(next(executed_results) if covers else None)
+        # Release the executing thread of the mutation executor.
+        self._mutation_executor.shutdown()
 
         summary = self.__compute_mutation_summary(
             len(self._mutated_modules), tests_and_results
@@ -308,7 +389,7 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
 
     @staticmethod
     def __remove_non_relevant_assertions(
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]],
+        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult | None]]],
         mutation_summary: _MutationSummary,
     ) -> None:
         for test, results in tests_and_results:
@@ -316,8 +397,8 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             for result, mut in zip(
                 results, mutation_summary.mutant_information, strict=True
             ):
-                # Ignore timed out executions
-                if len(mut.timed_out_by) == 0:
+                # Ignore timed out and skipped executions
+                if result is not None and len(mut.timed_out_by) == 0:
                     merged.merge(result.assertion_verification_trace)
             for stmt_idx, statement in enumerate(test.statements):
                 for assertion_idx, assertion in reversed(
@@ -329,7 +410,7 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
     @staticmethod
     def __compute_mutation_summary(
         number_of_mutants: int,
-        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult]]],
+        tests_and_results: list[tuple[tc.TestCase, list[ex.ExecutionResult | None]]],
     ) -> _MutationSummary:
         mutation_info = [_MutantInfo(i) for i in range(number_of_mutants)]
         for test_num, (_, results) in enumerate(tests_and_results):
@@ -337,7 +418,10 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             for info, result in zip(mutation_info, results, strict=True):
                 if info.timed_out_by:
                     continue
-                if result.timeout:
+                if result is None:
+                    # The test does not reach the mutant, thus it survives.
+                    info.not_covered_by.append(test_num)
+                elif result.timeout:
                     # Mutant caused timeout
                     info.timed_out_by.append(test_num)
                 elif (
@@ -364,6 +448,10 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             RuntimeVariable.NumberOfCreatedMutants, metrics.num_created_mutants
         )
         stat.track_output_variable(RuntimeVariable.MutationScore, metrics.get_score())
+        stat.track_output_variable(
+            RuntimeVariable.NumberOfSkippedMutantExecutions,
+            mutation_summary.get_skipped_executions(),
+        )
 
         for info in mutation_summary.mutant_information:
             if info.killed_by:
@@ -384,3 +472,7 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             len(survived),
             ", ".join(map(lambda x: str(x.mut_num), survived)),
         )
+        _LOGGER.info(
+            "Number of skipped executions of tests that do not reach a mutant: %i",
+            mutation_summary.get_skipped_executions(),
+        )
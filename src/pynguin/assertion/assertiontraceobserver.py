@@ -61,7 +61,8 @@ class AssertionTraceObserver(ex.ExecutionObserver):
         return self._assertion_local_state.trace.clone()
 
     def before_test_case_execution(self, test_case: tc.TestCase):
-        pass
+        self._assertion_local_state.trace = at.AssertionTrace()
+        self._assertion_local_state.watch_list = []
 
     def before_statement_execution(
         self, statement: st.Statement, node: ast.stmt, exec_ctx: ex.ExecutionContext
@@ -266,7 +267,7 @@ class AssertionVerificationObserver(ex.ExecutionObserver):
         self.state = AssertionVerificationObserver.AssertionExecutorLocalState()
 
     def before_test_case_execution(self, test_case: tc.TestCase):
-        pass
+        self.state.trace = at.AssertionVerificationTrace()
 
     def after_test_case_execution_inside_thread(
         self, test_case: tc.TestCase, result: ex.ExecutionResult
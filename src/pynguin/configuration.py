@@ -380,6 +380,20 @@ class TypeInferenceConfiguration:
     type_tracing: bool = False
     """Trace usage of parameters with unknown types to improve type guesses."""
 
+    adaptive_type_tracing: bool = False
+    """Only execute a test case a second time with proxies for type tracing, if the
+    knowledge about the parameters of the callables it calls still changes.  Each
+    time the knowledge about a callable does not change, the probability to trace
+    its calls again decays; it is reset once the knowledge changes."""
+
+    type_tracing_probability_decay: float = 0.5
+    """The factor by which the probability to trace the calls of a callable decays
+    with adaptive type tracing, expects values in [0,1]."""
+
+    type_tracing_min_probability: float = 0.05
+    """The minimum probability to trace the calls of a callable with adaptive type
+    tracing, expects values in [0,1]."""
+
     type4py: bool = False
     """Get type information from Type4Py."""
 
@@ -571,6 +585,62 @@ class StoppingConfiguration:
     (up to maximum_test_execution_timeout)."""
 
 
+@dataclasses.dataclass
+class ExecutionConfiguration:
+    """Configuration related to the execution of test cases."""
+
+    number_of_workers: int = 0
+    """The number of worker processes that are used to execute batches of test
+    cases, e.g., the offspring of a generation, in parallel.  The workers are forked
+    from the Pynguin process, which requires a platform that supports forking.
+    0 disables parallel execution."""
+
+    code_cache_size: int = 10_000
+    """The maximum number of code objects, compiled and instrumented from the executed
+    statements and assertions, that are cached by an executor.  Only code that is
+    instrumented for measuring the checked coverage is cached.  0 disables the
+    cache."""
+
+    compile_whole_test_cases: bool = False
+    """Compile each test case into a single code object, which is executed at once,
+    instead of compiling and executing each statement on its own.  The observers are
+    notified about the executed statements by callbacks from the compiled code.
+    This reduces the overhead of executing test cases with many cheap statements.
+    The mode is not used when the checked coverage is measured, because this
+    requires the instructions of each statement to be traced on their own."""
+
+    prefix_snapshot_cache_size: int = 0
+    """The maximum number of snapshots of the state after executing a prefix of a test
+    case that are cached by an executor.  A test case then only executes the
+    statements after its longest prefix for which a snapshot exists, e.g., the
+    statements that were changed by mutating a test case.  Snapshots are stored after
+    whole test cases and after the prefixes that test cases share with earlier ones.
+    A snapshot consists of a deep copy of the objects created by the prefix, thus
+    this only yields correct results if these objects survive copy.deepcopy and if
+    the statements do not modify global state, e.g., module attributes.  Snapshots
+    are only used if the executor does not need to observe every statement, e.g.,
+    for type tracing.  0 disables the snapshots."""
+
+    instrumentation_cache_dir: str = ""
+    """The directory of an on-disk cache for the instrumented module under test.  The
+    cache stores the instrumented code and the analysed control flow of the module,
+    such that subsequent runs with an unchanged module and the same coverage metrics
+    skip the instrumentation.  An empty string disables the cache."""
+
+    result_cache_size: int = 0
+    """The maximum number of execution results that are cached by an executor.  A
+    test case that is structurally equal to a cached test case reuses its result
+    instead of executing the module under test again.  A result is only reused after
+    a second execution of the test case had the same outcome, test cases with
+    different outcomes are always executed.  The cache is only used if the executor
+    does not need to observe every statement, e.g., for type tracing.  0 disables the
+    cache."""
+
+    result_cache_max_bytes: int = 256 * 1024 * 1024
+    """The maximum approximate size of the execution results, including their
+    traces, that are cached by an executor in bytes."""
+
+
 # pylint: disable=too-many-instance-attributes, pointless-string-statement
 @dataclasses.dataclass
 class Configuration:
@@ -598,6 +668,11 @@ class Configuration:
     )
     """Stopping configuration."""
 
+    execution: ExecutionConfiguration = dataclasses.field(
+        default_factory=ExecutionConfiguration
+    )
+    """Test-case execution configuration."""
+
     seeding: SeedingConfiguration = dataclasses.field(
         default_factory=SeedingConfiguration
     )
@@ -14,6 +14,7 @@ from typing import Any
 import pynguin.coverage.controlflowdistance as cfd
 import pynguin.ga.computations as ff
 
+from pynguin.utils.bitset import BitSet
 from pynguin.utils.orderedset import OrderedSet
 
 
@@ -399,6 +400,15 @@ class LineCoverageTestFitness(ff.TestCaseFitnessFunction):
             f"LineCoverageTestFitness(executor={self._executor}, " f"goal={self._goal})"
         )
 
+    @property
+    def goal(self) -> LineCoverageGoal:
+        """Provides the coverage goal of this fitness function.
+
+        Returns:
+            The attached coverage goal
+        """
+        return self._goal
+
 
 class StatementCheckedCoverageTestFitness(ff.TestCaseFitnessFunction):
     """A statement checked coverage fitness implementation for test cases."""
@@ -426,6 +436,101 @@ class StatementCheckedCoverageTestFitness(ff.TestCaseFitnessFunction):
             f"goal={self._goal})"
         )
 
+    @property
+    def goal(self) -> CheckedCoverageGoal:
+        """Provides the coverage goal of this fitness function.
+
+        Returns:
+            The attached coverage goal
+        """
+        return self._goal
+
+
+class CoverageGoalIndex:
+    """Determines the fitness functions whose coverage goals are covered by an
+    execution result.
+
+    Instead of checking each goal, only the code objects, predicates, and lines that
+    were executed are looked up, thus the effort depends on the size of the execution
+    trace instead of the number of goals.
+    """
+
+    def __init__(self) -> None:
+        self._code_objects: dict[int, list[ff.TestCaseFitnessFunction]] = {}
+        self._code_object_ids = BitSet()
+        self._branches: dict[tuple[int, bool], list[ff.TestCaseFitnessFunction]] = {}
+        self._lines: dict[int, list[ff.TestCaseFitnessFunction]] = {}
+        self._line_ids = BitSet()
+        self._checked_lines: dict[int, list[ff.TestCaseFitnessFunction]] = {}
+        self._checked_line_ids = BitSet()
+
+    def add(self, fitness_function: ff.TestCaseFitnessFunction) -> bool:
+        """Adds a fitness function to the index.
+
+        Args:
+            fitness_function: The fitness function
+
+        Returns:
+            Whether the fitness function was added, which is only the case for the
+            coverage fitness functions of this module.
+        """
+        if isinstance(fitness_function, BranchCoverageTestFitness):
+            goal = fitness_function.goal
+            if isinstance(goal, BranchGoal):
+                self._branches.setdefault((goal.predicate_id, goal.value), []).append(
+                    fitness_function
+                )
+                return True
+            if isinstance(goal, BranchlessCodeObjectGoal):
+                self._code_objects.setdefault(goal.code_object_id, []).append(
+                    fitness_function
+                )
+                self._code_object_ids.add(goal.code_object_id)
+                return True
+        elif isinstance(fitness_function, LineCoverageTestFitness):
+            self._lines.setdefault(fitness_function.goal.line_id, []).append(
+                fitness_function
+            )
+            self._line_ids.add(fitness_function.goal.line_id)
+            return True
+        elif isinstance(fitness_function, StatementCheckedCoverageTestFitness):
+            self._checked_lines.setdefault(fitness_function.goal.line_id, []).append(
+                fitness_function
+            )
+            self._checked_line_ids.add(fitness_function.goal.line_id)
+            return True
+        return False
+
+    def get_covered(self, result: ExecutionResult) -> list[ff.TestCaseFitnessFunction]:
+        """Provides the indexed fitness functions whose goals are covered.
+
+        Args:
+            result: The execution result
+
+        Returns:
+            The fitness functions whose goals are covered by the result
+        """
+        trace = result.execution_trace
+        covered: list[ff.TestCaseFitnessFunction] = []
+        if self._code_objects:
+            for code_object_id in trace.executed_code_objects & self._code_object_ids:
+                covered.extend(self._code_objects[code_object_id])
+        if self._branches:
+            for distances, value in (
+                (trace.true_distances, True),
+                (trace.false_distances, False),
+            ):
+                for predicate_id, distance in distances.items():
+                    if distance == 0.0 and predicate_id in trace.executed_predicates:
+                        covered.extend(self._branches.get((predicate_id, value), ()))
+        if self._lines:
+            for line_id in trace.covered_line_ids & self._line_ids:
+                covered.extend(self._lines[line_id])
+        if self._checked_lines:
+            for line_id in trace.checked_lines & self._checked_line_ids:
+                covered.extend(self._checked_lines[line_id])
+        return covered
+
 
 def create_branch_coverage_fitness_functions(
     executor: AbstractTestCaseExecutor, branch_goal_pool: BranchGoalPool
@@ -14,6 +14,7 @@ import statistics
 
 from abc import abstractmethod
 from collections.abc import Callable
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import TypeVar
@@ -22,11 +23,14 @@ import pynguin.utils.opcodes as op
 
 from pynguin.slicer.dynamicslicer import AssertionSlicer
 from pynguin.slicer.dynamicslicer import DynamicSlicer
+from pynguin.slicer.slicingcache import SlicingCache
 from pynguin.testcase.execution import ExecutionTrace
 from pynguin.testcase.statement import Statement
 
 
 if TYPE_CHECKING:
+    import pynguin.ga.testcasechromosome as tcc
+
     from pynguin.slicer.dynamicslicer import SlicingCriterion
     from pynguin.testcase.execution import AbstractTestCaseExecutor
     from pynguin.testcase.execution import ExecutionResult
@@ -58,7 +62,7 @@ class TestCaseChromosomeComputation(
         """
         if individual.changed or individual.get_last_execution_result() is None:
             individual.set_last_execution_result(
-                self._executor.execute(individual.test_case)
+                self._executor.execute(individual.read_only_test_case)
             )
             individual.changed = False
         result = individual.get_last_execution_result()
@@ -81,20 +85,12 @@ class TestSuiteChromosomeComputation(
         Returns:
             A list of execution results
         """
+        # If we execute a suite which in turn executes it's test cases, then the
+        # cached values of the test cases are invalidated, because the test case is
+        # no longer aware that it was changed.
+        run_test_case_chromosomes(self._executor, individual.test_case_chromosomes)
         results: list[ExecutionResult] = []
         for test_case_chromosome in individual.test_case_chromosomes:
-            if (
-                test_case_chromosome.changed
-                or test_case_chromosome.get_last_execution_result() is None
-            ):
-                test_case_chromosome.set_last_execution_result(
-                    self._executor.execute(test_case_chromosome.test_case)
-                )
-                test_case_chromosome.changed = False
-                # If we execute a suite which in turn executes it's test cases,
-                # then we have to invalidate the values of the test cases, because
-                # the test case is no longer aware that it was changed.
-                test_case_chromosome.invalidate_cache()
             result = test_case_chromosome.get_last_execution_result()
             assert result is not None
             results.append(result)
@@ -404,24 +400,34 @@ class TestCaseStatementCheckedCoverageFunction(TestCaseCoverageFunction):
 class TestSuiteAssertionCheckedCoverageFunction(TestSuiteCoverageFunction):
     """Computes checked coverage on test suites with assertions."""
 
+    def __init__(self, executor):
+        super().__init__(executor)
+        # Reused for slicing all individuals
+        self._slicing_cache = SlicingCache()
+
     def compute_coverage(self, individual) -> float:
         results = self._run_test_suite_chromosome(individual)
         merged_trace = analyze_results(results)
         tracer = self._executor.tracer
         return compute_assertion_checked_coverage(
-            merged_trace, tracer.get_subject_properties()
+            merged_trace, tracer.get_subject_properties(), self._slicing_cache
         )
 
 
 class TestCaseAssertionCheckedCoverageFunction(TestCaseCoverageFunction):
     """Computes checked coverage on test cases with assertions."""
 
+    def __init__(self, executor):
+        super().__init__(executor)
+        # Reused for slicing all individuals
+        self._slicing_cache = SlicingCache()
+
     def compute_coverage(self, individual) -> float:
         result = self._run_test_case_chromosome(individual)
         merged_trace = analyze_results([result])
         tracer = self._executor.tracer
         return compute_assertion_checked_coverage(
-            merged_trace, tracer.get_subject_properties()
+            merged_trace, tracer.get_subject_properties(), self._slicing_cache
         )
 
 
@@ -654,6 +660,35 @@ class ComputationCache:
         return self._coverage_cache[coverage_function]
 
 
+def run_test_case_chromosomes(
+    executor: AbstractTestCaseExecutor,
+    chromosomes: Iterable[tcc.TestCaseChromosome],
+) -> None:
+    """Executes all given test case chromosomes whose last execution result is
+    outdated as a single batch and stores the results.
+
+    This allows the executor to execute the test cases in parallel; subsequent
+    computations on the chromosomes reuse the stored results.
+
+    Args:
+        executor: The executor that shall execute the test cases
+        chromosomes: The chromosomes to run
+    """
+    outdated = {
+        id(chromosome): chromosome
+        for chromosome in chromosomes
+        if chromosome.changed or chromosome.get_last_execution_result() is None
+    }
+    results = executor.execute_many(
+        [chromosome.read_only_test_case for chromosome in outdated.values()]
+    )
+    for chromosome, result in zip(outdated.values(), results, strict=True):
+        chromosome.set_last_execution_result(result)
+        chromosome.changed = False
+        # The cached values were computed on the previous execution result.
+        chromosome.invalidate_cache()
+
+
 def normalise(value: float) -> float:
     """Normalise a value.
 
@@ -926,6 +961,7 @@ def compute_statement_checked_lines(
     trace: ExecutionTrace,
     subject_properties: SubjectProperties,
     statement_slicing_criteria: dict[int, SlicingCriterion],
+    slicing_cache: SlicingCache | None = None,
 ) -> set[int]:
     """Computes checked coverage on bytecode instructions.
     Each statement can be sliced, returning a list of instructions
@@ -941,13 +977,12 @@ def compute_statement_checked_lines(
         subject_properties: All known data
         statement_slicing_criteria: a dictionary of statement positions
             and its slicing criteria
+        slicing_cache: The cache to reuse for slicing, if any
 
     Returns:
         The checked line ids of lines checked by the statements
     """
-    known_code_objects = subject_properties.existing_code_objects
-    dynamic_slicer = DynamicSlicer(known_code_objects)
-    checked_lines_ids = set()
+    slicing_criteria = []
     for statement in statements:
         if statement.get_position() not in statement_slicing_criteria:
             # if there is no slicing criterion there was an exception during
@@ -955,10 +990,14 @@ def compute_statement_checked_lines(
             # with an exception will never be executed,
             # thus having no slicing criterion
             break
-        statement_slice = dynamic_slicer.slice(
-            trace,
-            statement_slicing_criteria[statement.get_position()],
-        )
+        slicing_criteria.append(statement_slicing_criteria[statement.get_position()])
+
+    # All statements are sliced in one traversal of the trace
+    dynamic_slicer = DynamicSlicer(
+        subject_properties.existing_code_objects, slicing_cache
+    )
+    checked_lines_ids = set()
+    for statement_slice in dynamic_slicer.slice_criteria(trace, slicing_criteria):
         statement_checked_lines = DynamicSlicer.map_instructions_to_lines(
             statement_slice, subject_properties
         )
@@ -972,7 +1011,9 @@ def compute_statement_checked_lines(
 
 
 def compute_assertion_checked_coverage(
-    trace: ExecutionTrace, subject_properties: SubjectProperties
+    trace: ExecutionTrace,
+    subject_properties: SubjectProperties,
+    slicing_cache: SlicingCache | None = None,
 ) -> float:
     """Computes checked coverage on bytecode instructions.
     Each assertion can be sliced, returning a list of instructions
@@ -988,6 +1029,7 @@ def compute_assertion_checked_coverage(
     Args:
         trace: The execution trace
         subject_properties: All known data
+        slicing_cache: The cache to reuse for slicing, if any
 
     Returns:
         The computed coverage value
@@ -998,12 +1040,17 @@ def compute_assertion_checked_coverage(
         # Nothing to cover => everything is covered.
         coverage = 1.0
     else:
-        assertion_slicer = AssertionSlicer(subject_properties.existing_code_objects)
+        assertion_slicer = AssertionSlicer(
+            subject_properties.existing_code_objects, slicing_cache
+        )
         checked_instructions = []
-        for executed_assertion in trace.executed_assertions:
-            assertion_checked_instructions = assertion_slicer.slice_assertion(
-                executed_assertion, trace
-            )
+        # All assertions are sliced in one traversal of the trace
+        assertion_slices = assertion_slicer.slice_assertions(
+            trace.executed_assertions, trace
+        )
+        for executed_assertion, assertion_checked_instructions in zip(
+            trace.executed_assertions, assertion_slices
+        ):
             executed_assertion.assertion.checked_instructions.extend(
                 assertion_checked_instructions
             )
@@ -7,8 +7,11 @@
 """Provides various crowding-distance assignment implementations."""
 from __future__ import annotations
 
-import sys
+import heapq
+import operator
 
+from itertools import compress
+from itertools import repeat
 from typing import TYPE_CHECKING
 from typing import TypeVar
 
@@ -24,7 +27,9 @@ C = TypeVar("C", bound=chrom.Chromosome)  # pylint: disable=invalid-name
 
 
 def fast_epsilon_dominance_assignment(
-    front: list[C], goals: OrderedSet[ff.FitnessFunction]
+    front: list[C],
+    goals: OrderedSet[ff.FitnessFunction],
+    fitness: list[tuple[float, ...]] | None = None,
 ) -> None:
     """Implements a "fast" version of the variant of the crowding distance.
 
@@ -36,30 +41,43 @@ def fast_epsilon_dominance_assignment(
     Args:
         front: Front of non-dominated solutions/tests
         goals: Set of goals/targets (e.g., branches) to consider
+        fitness: The fitness values of the solutions of the front for the goals, if
+            they are already known, e.g., from the ranking
     """
-    for test in front:
-        test.distance = 0
-
-    for goal in goals:
-        minimum = sys.float_info.max
-        min_set: list[C] = []
-        maximum = 0.0
-        for test in front:
-            value = test.get_fitness_for(goal)
-            if value < minimum:
-                minimum = value
-                min_set.clear()
-                min_set.append(test)
-            elif value == minimum:
-                min_set.append(test)
-
-            if value > maximum:
-                maximum = value
-
-        if maximum == minimum:
+    if fitness is None:
+        fitness = [
+            tuple(test.get_fitness_for(goal) for goal in goals) for test in front
+        ]
+    assert len(fitness) == len(front)
+
+    distances = [0.0] * len(front)
+    for column in zip(*fitness):
+        minimum = min(column)
+        if max(column) == minimum:
             continue
 
-        for test in min_set:
-            numerator = len(front) - len(min_set)
-            denominator = len(front)
-            test.distance = max(test.distance, numerator / denominator)
+        # All solutions with the minimal fitness get the same distance.
+        distance = (len(front) - column.count(minimum)) / len(front)
+        for index in compress(
+            range(len(front)), map(operator.eq, column, repeat(minimum))
+        ):
+            if distances[index] < distance:
+                distances[index] = distance
+
+    for test, distance in zip(front, distances):
+        test.distance = distance
+
+
+def select_by_distance(front: list[C], number: int) -> list[C]:
+    """Selects the solutions of a front with the largest crowding distance.
+
+    Solutions with equal distance are selected in the order of the front.
+
+    Args:
+        front: The front, whose solutions have a crowding distance assigned
+        number: The number of solutions to select
+
+    Returns:
+        The selected solutions, ordered by descending distance
+    """
+    return heapq.nlargest(number, front, key=lambda test: test.distance)
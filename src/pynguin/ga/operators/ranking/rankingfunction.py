@@ -8,10 +8,13 @@
 from __future__ import annotations
 
 import logging
+import operator
 
 from abc import ABCMeta
 from abc import abstractmethod
 from dataclasses import dataclass
+from itertools import accumulate
+from itertools import compress
 from typing import TYPE_CHECKING
 from typing import Generic
 from typing import TypeVar
@@ -19,10 +22,6 @@ from typing import TypeVar
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
 
-from pynguin.ga.comparators.dominancecomparator import DominanceComparator
-from pynguin.ga.comparators.preferencesortingcomparator import (
-    PreferenceSortingComparator,
-)
 from pynguin.utils import randomness
 from pynguin.utils.orderedset import OrderedSet
 
@@ -39,6 +38,10 @@ class RankedFronts(Generic[C]):
 
     fronts: list[list[C]] | None = None
 
+    # The fitness values of the solutions of each sub-front for the goals that were
+    # used for the ranking, if the ranking function provides them.
+    fitness: list[list[tuple[float, ...]]] | None = None
+
     def get_sub_front(self, rank: int) -> list[C]:
         """Returns the sub-front of chromosome objects of the given rank.
 
@@ -64,6 +67,23 @@ class RankedFronts(Generic[C]):
         assert self.fronts is not None
         return len(self.fronts)
 
+    def get_sub_front_fitness(self, rank: int) -> list[tuple[float, ...]] | None:
+        """Returns the fitness values of the solutions of the sub-front of the given
+        rank.
+
+        Args:
+            rank: The sub-front to retrieve the fitness values for
+
+        Returns:
+            The fitness values of the solutions for the goals that were used for the
+            ranking, in the order of the sub-front, or None if they are not known
+        """
+        if self.fitness is None:
+            return None
+        if rank >= len(self.fitness):
+            return []
+        return self.fitness[rank]
+
 
 # pylint: disable=too-few-public-methods
 class RankingFunction(Generic[C], metaclass=ABCMeta):
@@ -106,91 +126,128 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
 
         fronts = []
 
+        # The fitness values are looked up once, because the comparisons of the
+        # preference sorting and the non-dominated sorting need each of them several
+        # times.
+        fitness = [
+            tuple(solution.get_fitness_for(goal) for goal in uncovered_goals)
+            for solution in solutions
+        ]
+
         # First apply the "preference sorting" to the first front only then compute
         # the ranks according to the non-dominate sorting algorithm
-        zero_front: list[C] = self._get_zero_front(solutions, uncovered_goals)
+        zero_front: list[C] = self._get_zero_front(solutions, fitness)
         fronts.append(zero_front)
-        front_index = 1
 
+        # Chromosomes are compared by identity, because their equality compares the
+        # test cases and execution traces.
+        indices = {id(solution): index for index, solution in enumerate(solutions)}
+        index_fronts = [[indices[id(element)] for element in zero_front]]
+        zero_front_ids = {id(element) for element in zero_front}
+        remaining = [
+            index
+            for index, solution in enumerate(solutions)
+            if id(solution) not in zero_front_ids
+        ]
         if len(zero_front) < config.configuration.search_algorithm.population:
-            ranked_solutions = len(zero_front)
-            comparator: DominanceComparator[C] = DominanceComparator(
-                goals=uncovered_goals
-            )
-
-            remaining: list[C] = []
-            remaining.extend(solutions)
-            for element in zero_front:
-                if element in remaining:
-                    remaining.remove(element)
-
-            while (
-                ranked_solutions < config.configuration.search_algorithm.population
-                and len(remaining) > 0
+            for new_front in self._get_non_dominated_fronts(
+                [fitness[index] for index in remaining],
+                config.configuration.search_algorithm.population - len(zero_front),
             ):
-                new_front: list[C] = self._get_non_dominated_solutions(
-                    remaining, comparator, front_index
-                )
-                fronts.append(new_front)
-                for element in new_front:
-                    if element in remaining:
-                        remaining.remove(element)
-                ranked_solutions += len(new_front)
-                front_index += 1
-
+                index_fronts.append([remaining[index] for index in new_front])
         else:
-            remaining = []
-            remaining.extend(solutions)
-            for element in zero_front:
-                if element in remaining:
-                    remaining.remove(element)
-            for element in remaining:
+            index_fronts.append(remaining)
+
+        for front_index, index_front in enumerate(index_fronts[1:], start=1):
+            front = [solutions[index] for index in index_front]
+            for element in front:
                 element.rank = front_index
-            fronts.append(remaining)
+            fronts.append(front)
 
-        return RankedFronts(fronts)
+        return RankedFronts(
+            fronts,
+            [[fitness[index] for index in index_front] for index_front in index_fronts],
+        )
 
     @staticmethod
     def _get_zero_front(
-        solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
+        solutions: list[C], fitness: list[tuple[float, ...]]
     ) -> list[C]:
+        """Selects the best solution for each goal, i.e., the one with the lowest
+        fitness and, among those, the shortest one.
+
+        Ties are broken randomly, like when selecting with a
+        PreferenceSortingComparator, which replaces the best solution so far by an
+        equally good one with a probability of 0.5.
+
+        Args:
+            solutions: The solutions
+            fitness: The fitness values of the solutions for each goal
+
+        Returns:
+            The best solutions, without duplicates
+        """
         zero_front: OrderedSet[C] = OrderedSet()
-        for goal in uncovered_goals:
-            comparator: PreferenceSortingComparator[C] = PreferenceSortingComparator(
-                goal
-            )
-            best: C | None = None
-            for solution in solutions:
-                flag = comparator.compare(solution, best)
-                if flag < 0 or (flag == 0 and randomness.next_bool()):
-                    best = solution
-            assert best is not None
+        lengths = [solution.length() for solution in solutions]
+        for column in zip(*fitness):
+            keys: list[tuple[float, int]] = list(zip(column, lengths))
+            best_so_far: list[tuple[float, int]] = list(accumulate(keys, min))
+            # Only the positions where a solution is at least as good as the best
+            # one before it can change the selection.
+            best_index = 0
+            for index in compress(
+                range(1, len(keys)), map(operator.eq, keys[1:], best_so_far[1:])
+            ):
+                if keys[index] < best_so_far[index - 1] or randomness.next_bool():
+                    best_index = index
 
+            best = solutions[best_index]
             best.rank = 0
             zero_front.add(best)
         return list(zero_front)
 
     @staticmethod
-    def _get_non_dominated_solutions(
-        solutions: list[C], comparator: DominanceComparator[C], front_index: int
-    ) -> list[C]:
-        front: list[C] = []
-        for solution in solutions:
-            is_dominated = False
-            dominated_solutions: list[C] = []
-            for best in front:
-                flag = comparator.compare(solution, best)
-                if flag < 0:
-                    dominated_solutions.append(best)
-                if flag > 0:
-                    is_dominated = True
-                    break
-            if is_dominated:
-                continue
-
-            solution.rank = front_index
-            front.append(solution)
-            for dominated_solution in dominated_solutions:
-                if dominated_solution in front:
-                    front.remove(dominated_solution)
-        return front
+    def _get_non_dominated_fronts(
+        fitness: list[tuple[float, ...]], limit: int
+    ) -> list[list[int]]:
+        """Sorts solutions into fronts of non-dominated solutions.
+
+        Uses the fast non-dominated sorting of Deb et al.: each pair of solutions is
+        compared once, and the fronts are peeled off by counting the solutions that
+        dominate a solution.
+
+        Args:
+            fitness: The fitness values of the solutions
+            limit: The number of solutions after which no further fronts are needed
+
+        Returns:
+            The fronts, given by the ascending indices of their solutions
+        """
+        dominated_by: list[list[int]] = [[] for _ in fitness]
+        domination_counts = [0] * len(fitness)
+        for index_1, fitness_1 in enumerate(fitness):
+            for index_2 in range(index_1 + 1, len(fitness)):
+                fitness_2 = fitness[index_2]
+                if fitness_1 == fitness_2:
+                    continue
+                if all(map(operator.le, fitness_1, fitness_2)):
+                    dominated_by[index_1].append(index_2)
+                    domination_counts[index_2] += 1
+                elif all(map(operator.le, fitness_2, fitness_1)):
+                    dominated_by[index_2].append(index_1)
+                    domination_counts[index_1] += 1
+
+        fronts: list[list[int]] = []
+        ranked = 0
+        current = [index for index, count in enumerate(domination_counts) if count == 0]
+        while current and ranked < limit:
+            fronts.append(current)
+            ranked += len(current)
+            following: list[int] = []
+            for index in current:
+                for dominated in dominated_by[index]:
+                    domination_counts[dominated] -= 1
+                    if domination_counts[dominated] == 0:
+                        following.append(dominated)
+            current = sorted(following)
+        return fronts
@@ -24,6 +24,18 @@ if TYPE_CHECKING:
     from pynguin.testcase.execution import ExecutionResult
 
 
+class _TestCaseOwners:
+    """Counts the chromosomes that share a test case.
+
+    Every chromosome that shares the test case refers to the same instance.  A
+    chromosome that stops sharing the test case decrements the count, such that the
+    last chromosome may modify the test case without cloning it.
+    """
+
+    def __init__(self) -> None:
+        self.count = 1
+
+
 class TestCaseChromosome(chrom.Chromosome):
     """A chromosome that encodes a single test case."""
 
@@ -47,12 +59,19 @@ class TestCaseChromosome(chrom.Chromosome):
                 test_case is not None
             ), "Cannot create test case chromosome without test case"
             self._test_case: tc.TestCase = test_case
+            # The chromosomes that share the test case.  If there are others, the
+            # test case has to be cloned before it is modified.
+            self._test_case_owners = _TestCaseOwners()
             self._test_factory: tf.TestFactory | None = test_factory
             self.changed = True
             self._last_execution_result: ExecutionResult | None = None
             self._num_mutations = 0
         else:
-            self._test_case = orig._test_case.clone()
+            # The test case is copied on write, because offspring are usually only
+            # changed in a few statements, or not at all.
+            self._test_case = orig._test_case
+            self._test_case_owners = orig._test_case_owners
+            self._test_case_owners.count += 1
             self._test_factory = orig._test_factory
             self.changed = orig.changed
             self._last_execution_result = orig._last_execution_result
@@ -62,11 +81,46 @@ class TestCaseChromosome(chrom.Chromosome):
     def test_case(self) -> tc.TestCase:
         """The test case that is wrapped by this chromosome.
 
+        The caller might modify the test case, thus it is cloned first, if it is
+        shared with another chromosome.  Callers that only read the test case should
+        use read_only_test_case instead.
+
+        Returns:
+            the wrapped test case.
+        """
+        self._unshare_test_case()
+        return self._test_case
+
+    @property
+    def read_only_test_case(self) -> tc.TestCase:
+        """The test case that is wrapped by this chromosome, which must not be
+        modified by the caller.
+
+        In contrast to test_case, the test case is never cloned.
+
         Returns:
             the wrapped test case.
         """
         return self._test_case
 
+    def _is_test_case_shared(self) -> bool:
+        return self._test_case_owners.count > 1
+
+    def _unshare_test_case(self) -> None:
+        """Clone the wrapped test case, if it is shared with another chromosome."""
+        if self._is_test_case_shared():
+            self._own_test_case(self._test_case.clone())
+
+    def _own_test_case(self, test_case: tc.TestCase) -> None:
+        """Replace the wrapped test case by one that is not shared.
+
+        Args:
+            test_case: The new test case
+        """
+        self._test_case_owners.count -= 1
+        self._test_case = test_case
+        self._test_case_owners = _TestCaseOwners()
+
     def num_mutations(self) -> int:
         """The number of mutations.
 
@@ -90,18 +144,18 @@ class TestCaseChromosome(chrom.Chromosome):
         ), "Cannot perform crossover with " + str(type(other))
         assert self._test_factory is not None, "Crossover requires a test factory."
 
-        offspring_test_case = self.test_case.clone(position1)
+        offspring_test_case = self._test_case.clone(position1)
 
-        for j in range(position2, other.test_case.size()):
+        for j in range(position2, other._test_case.size()):
             self._test_factory.append_statement(
-                offspring_test_case, other.test_case.get_statement(j)
+                offspring_test_case, other._test_case.get_statement(j)
             )
 
         if (
             offspring_test_case.size()
             < config.configuration.search_algorithm.chromosome_length
         ):
-            self._test_case = offspring_test_case
+            self._own_test_case(offspring_test_case)
             self.changed = True
 
     def mutate(self) -> None:
@@ -113,11 +167,19 @@ class TestCaseChromosome(chrom.Chromosome):
         ):
             last_mutatable_position = self.get_last_mutatable_statement()
             if last_mutatable_position is not None:
-                self._test_case.chop(last_mutatable_position)
+                if self._is_test_case_shared():
+                    self._own_test_case(
+                        self._test_case.clone(last_mutatable_position + 1)
+                    )
+                else:
+                    self._test_case.chop(last_mutatable_position)
                 changed = True
 
-        # In case mutation removes all calls on the SUT.
-        backup = self.test_case.clone()
+        # In case mutation removes all calls on the SUT.  A shared test case is not
+        # modified, thus it does not have to be cloned for the backup.
+        backup_shared = self._is_test_case_shared()
+        backup = self._test_case if backup_shared else self._test_case.clone()
+        self._unshare_test_case()
 
         if (
             randomness.next_float()
@@ -142,7 +204,7 @@ class TestCaseChromosome(chrom.Chromosome):
 
         assert self._test_factory, "Required for mutation"
         if not self._test_factory.has_call_on_sut(self._test_case):
-            self._test_case = backup
+            self._test_case = backup.clone() if backup_shared else backup
             self._mutation_insert()
 
         if changed:
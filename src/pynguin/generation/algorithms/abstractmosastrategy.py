@@ -13,6 +13,7 @@ from abc import ABCMeta
 from typing import cast
 
 import pynguin.configuration as config
+import pynguin.ga.computations as ff
 import pynguin.ga.testcasechromosome as tcc
 
 from pynguin.ga.comparators.dominancecomparator import DominanceComparator
@@ -80,6 +81,7 @@ class AbstractMOSATestStrategy(
                 offspring_population.append(tch)
 
         self._logger.debug("Number of offsprings = %d", len(offspring_population))
+        ff.run_test_case_chromosomes(self._executor, offspring_population)
         return offspring_population
 
     @staticmethod
@@ -118,6 +120,7 @@ class AbstractMOSATestStrategy(
         for _ in range(config.configuration.search_algorithm.population):
             chromosome = self._chromosome_factory.get_chromosome()
             population.append(chromosome)
+        ff.run_test_case_chromosomes(self._executor, population)
         return population
 
     def _get_best_individuals(self) -> list[tcc.TestCaseChromosome]:
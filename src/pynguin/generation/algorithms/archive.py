@@ -16,6 +16,7 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+import pynguin.coverage.branchgoals as bg
 import pynguin.ga.computations as ff
 import pynguin.ga.testcasechromosome as tcc
 
@@ -103,7 +104,43 @@ class CoverageArchive(Archive):
         super().__init__()
         self._covered: dict[ff.TestCaseFitnessFunction, tcc.TestCaseChromosome] = {}
         self._uncovered = OrderedSet(objectives)
-        self._objectives = OrderedSet(objectives)
+        self._objectives: OrderedSet[ff.TestCaseFitnessFunction] = OrderedSet()
+        # The size of the solution in the archive for each covered objective.
+        self._best_sizes: dict[ff.TestCaseFitnessFunction, int] = {}
+        # The position of each objective, to process objectives in their order.
+        self._positions: dict[ff.TestCaseFitnessFunction, int] = {}
+        # Most objectives are coverage goals, which are looked up in the execution
+        # traces of the solutions.  Only the others are checked for each solution.
+        self._goal_index = bg.CoverageGoalIndex()
+        self._unindexed: list[ff.TestCaseFitnessFunction] = []
+        for objective in objectives:
+            self._add_objective(objective)
+
+    def _add_objective(self, objective: ff.TestCaseFitnessFunction) -> None:
+        self._positions[objective] = len(self._objectives)
+        self._objectives.add(objective)
+        if not self._goal_index.add(objective):
+            self._unindexed.append(objective)
+
+    def _get_covered_objectives(
+        self, solution: tcc.TestCaseChromosome
+    ) -> list[ff.TestCaseFitnessFunction]:
+        if len(self._unindexed) < len(self._objectives) and not solution.changed:
+            result = solution.get_last_execution_result()
+            if result is not None:
+                covered = self._goal_index.get_covered(result)
+                covered.extend(
+                    objective
+                    for objective in self._unindexed
+                    if solution.get_is_covered(objective)
+                )
+                return covered
+        # Checking an objective executes the solution, if necessary.
+        return [
+            objective
+            for objective in self._objectives
+            if solution.get_is_covered(objective)
+        ]
 
     def update(self, solutions: Iterable[tcc.TestCaseChromosome]) -> bool:
         """Updates this archive with the given set of solutions.
@@ -117,24 +154,23 @@ class CoverageArchive(Archive):
         Args:
             solutions: The solutions to update the archive with
         """
-        updated = False
-        for objective in self._objectives:
-            best_solution = self._covered.get(objective, None)
-            best_size = sys.maxsize if best_solution is None else best_solution.size()
-
-            for solution in solutions:
-                covers = solution.get_is_covered(objective)
-                size = solution.size()
-
-                if covers and size < best_size:
-                    updated = True
-                    self._covered[objective] = solution
-                    best_size = size
-                    if objective in self._uncovered:
-                        self._uncovered.remove(objective)
-                        self._on_target_covered(objective)
+        best_solutions: dict[ff.TestCaseFitnessFunction, tcc.TestCaseChromosome] = {}
+        for solution in solutions:
+            size = solution.size()
+            for objective in self._get_covered_objectives(solution):
+                if size < self._best_sizes.get(objective, sys.maxsize):
+                    self._best_sizes[objective] = size
+                    best_solutions[objective] = solution
+
+        # Store the solutions in the order of the objectives, which determines the
+        # order of the solutions in the archive and of the callbacks.
+        for objective in sorted(best_solutions, key=self._positions.__getitem__):
+            self._covered[objective] = best_solutions[objective]
+            if objective in self._uncovered:
+                self._uncovered.remove(objective)
+                self._on_target_covered(objective)
         self._logger.debug("ArchiveCoverageGoals: %d", len(self._covered))
-        return updated
+        return len(best_solutions) > 0
 
     @property
     def uncovered_goals(self) -> OrderedSet[ff.TestCaseFitnessFunction]:
@@ -168,7 +204,7 @@ class CoverageArchive(Archive):
         for goal in new_goals:
             if goal not in self._objectives:
                 self._logger.debug("Adding goal: %s", goal)
-                self._objectives.add(goal)
+                self._add_objective(goal)
                 self._uncovered.add(goal)
 
     @property
@@ -180,6 +216,7 @@ class CoverageArchive(Archive):
         """Resets the archive."""
         self._uncovered.update(self._objectives)
         self._covered.clear()
+        self._best_sizes.clear()
 
     def _all_covered(self) -> bool:
         return all(
@@ -22,6 +22,7 @@ import pynguin.utils.statistics.statistics as stat
 from pynguin.ga.operators.ranking.crowdingdistance import (
     fast_epsilon_dominance_assignment,
 )
+from pynguin.ga.operators.ranking.crowdingdistance import select_by_distance
 from pynguin.generation.algorithms.abstractmosastrategy import AbstractMOSATestStrategy
 from pynguin.utils.orderedset import OrderedSet
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
@@ -66,7 +67,9 @@ class DynaMOSATestStrategy(AbstractMOSATestStrategy):
         )
         for i in range(fronts.get_number_of_sub_fronts()):
             fast_epsilon_dominance_assignment(
-                fronts.get_sub_front(i), self._goals_manager.current_goals
+                fronts.get_sub_front(i),
+                self._goals_manager.current_goals,
+                fronts.get_sub_front_fitness(i),
             )
 
         self.before_first_search_iteration(
@@ -115,7 +118,11 @@ class DynaMOSATestStrategy(AbstractMOSATestStrategy):
 
         while remain > 0 and remain >= len(front) != 0:
             # Assign crowding distance to individuals
-            fast_epsilon_dominance_assignment(front, self._goals_manager.current_goals)
+            fast_epsilon_dominance_assignment(
+                front,
+                self._goals_manager.current_goals,
+                fronts.get_sub_front_fitness(index),
+            )
             # Add the individuals of this front
             self._population.extend(front)
             # Decrement remain
@@ -127,10 +134,12 @@ class DynaMOSATestStrategy(AbstractMOSATestStrategy):
 
         # Remain is less than len(front[index]), insert only the best one
         if remain > 0 and len(front) != 0:
-            fast_epsilon_dominance_assignment(front, self._goals_manager.current_goals)
-            front.sort(key=lambda t: t.distance, reverse=True)
-            for k in range(remain):
-                self._population.append(front[k])
+            fast_epsilon_dominance_assignment(
+                front,
+                self._goals_manager.current_goals,
+                fronts.get_sub_front_fitness(index),
+            )
+            self._population.extend(select_by_distance(front, remain))
 
         self._goals_manager.update(self._population)
 
@@ -157,6 +166,17 @@ class _GoalsManager:
         self._current_goals: OrderedSet[
             bg.BranchCoverageTestFitness
         ] = self._graph.root_branches
+        # The position of each current goal: a goal that is covered is replaced by
+        # its structural children, which are ordered after the goal's position and
+        # before the position of the next goal.
+        self._goal_positions: dict[bg.BranchCoverageTestFitness, tuple[int, ...]] = {
+            goal: (index,) for index, goal in enumerate(self._current_goals)
+        }
+        self._covered_goals: set[ff.FitnessFunction] = set(archive.covered_goals)
+        self._newly_covered_goals: list[ff.FitnessFunction] = [
+            goal for goal in self._current_goals if goal in self._covered_goals
+        ]
+        self._archive.add_on_target_covered(self._newly_covered_goals.append)
         self._archive.add_goals(self._current_goals)  # type: ignore[arg-type]
 
     @property
@@ -174,24 +194,43 @@ class _GoalsManager:
         Args:
             solutions: The previously found solutions
         """
-        # We must keep iterating, as long as new goals are added.
-        new_goals_added = True
-        while new_goals_added:
-            self._archive.update(solutions)
-            covered = self._archive.covered_goals
-            new_goals: OrderedSet[bg.BranchCoverageTestFitness] = OrderedSet()
-            new_goals_added = False
-            for old_goal in self._current_goals:
-                if old_goal in covered:
-                    children = self._graph.get_structural_children(old_goal)
-                    for child in children:
-                        if child not in self._current_goals and child not in covered:
-                            new_goals.add(child)
-                            new_goals_added = True
-                else:
-                    new_goals.add(old_goal)
-            self._current_goals = new_goals
-            self._archive.add_goals(self._current_goals)  # type: ignore[arg-type]
+        self._archive.update(solutions)
+        if not self._newly_covered_goals:
+            return
+        # We must keep iterating, as long as new goals are added.  Only the goals that
+        # were covered since the last iteration can be replaced by new goals.
+        while self._newly_covered_goals:
+            self._covered_goals.update(self._newly_covered_goals)
+            covered_goals = sorted(
+                (
+                    goal
+                    for goal in self._newly_covered_goals
+                    if goal in self._goal_positions
+                ),
+                key=self._goal_positions.__getitem__,  # type: ignore[arg-type]
+            )
+            self._newly_covered_goals.clear()
+            new_goals: list[bg.BranchCoverageTestFitness] = []
+            for goal in covered_goals:
+                position = self._goal_positions.pop(goal)  # type: ignore[call-overload]
+                children = self._graph.get_structural_children(
+                    goal  # type: ignore[arg-type]
+                )
+                for index, child in enumerate(children):
+                    if (
+                        child not in self._goal_positions
+                        and child not in self._covered_goals
+                    ):
+                        self._goal_positions[child] = position + (index,)
+                        new_goals.append(child)
+            if new_goals:
+                new_goals.sort(key=self._goal_positions.__getitem__)
+                self._archive.add_goals(OrderedSet(new_goals))
+                self._archive.update(solutions)
+
+        self._current_goals = OrderedSet(
+            sorted(self._goal_positions, key=self._goal_positions.__getitem__)
+        )
         self._logger.debug("current goals after update: %s", self._current_goals)
 
 
@@ -213,6 +252,10 @@ class _BranchFitnessGraph:
         # Branch less code objects and branches that are not control dependent on other
         # branches.
         self._root_branches: OrderedSet[bg.BranchCoverageTestFitness] = OrderedSet()
+        # The successors of each node in the graph, in the order of their edges.
+        self._structural_children: dict[
+            bg.BranchCoverageTestFitness, OrderedSet[bg.BranchCoverageTestFitness]
+        ] = {}
         self._build_graph(fitness_functions, subject_properties)
 
     def _build_graph(
@@ -221,8 +264,13 @@ class _BranchFitnessGraph:
         subject_properties: SubjectProperties,
     ):
         """Construct the actual graph from the given fitness functions."""
+        goal_to_fitness_function: dict[
+            bg.AbstractBranchCoverageGoal, bg.BranchCoverageTestFitness
+        ] = {}
         for fitness in fitness_functions:
             self._graph.add_node(fitness)
+            self._structural_children[fitness] = OrderedSet()
+            goal_to_fitness_function.setdefault(fitness.goal, fitness)
 
         for fitness in fitness_functions:
             if fitness.goal.is_branchless_code_object:
@@ -250,8 +298,11 @@ class _BranchFitnessGraph:
                     dependency.predicate_id,
                     dependency.branch_value,
                 )
-                dependent_ff = self._goal_to_fitness_function(fitness_functions, goal)
+                dependent_ff = self._goal_to_fitness_function(
+                    goal_to_fitness_function, goal
+                )
                 self._graph.add_edge(dependent_ff, fitness)
+                self._structural_children[dependent_ff].add(fitness)
 
         # Sanity check
         assert {n for n in self._graph.nodes if self._graph.in_degree(n) == 0}.issubset(
@@ -273,20 +324,23 @@ class _BranchFitnessGraph:
 
     @staticmethod
     def _goal_to_fitness_function(
-        search_in: OrderedSet[bg.BranchCoverageTestFitness], goal: bg.BranchGoal
+        search_in: dict[bg.AbstractBranchCoverageGoal, bg.BranchCoverageTestFitness],
+        goal: bg.BranchGoal,
     ) -> bg.BranchCoverageTestFitness:
         """Little helper to find the fitness function associated with a certain goal.
 
         Args:
-            search_in: The list to search in
+            search_in: The fitness functions by their goals
             goal: The goal to search for
 
         Returns:
             The found fitness function.
+
+        Raises:
+            RuntimeError: If there is no fitness function for the goal
         """
-        for fitness in search_in:
-            if fitness.goal == goal:
-                return fitness
+        if (fitness := search_in.get(goal)) is not None:
+            return fitness
         raise RuntimeError(f"Could not find fitness function for goal: {goal}")
 
     def get_structural_children(
@@ -302,4 +356,4 @@ class _BranchFitnessGraph:
         Returns:
             The structural children fitness functions of the given fitness function.
         """
-        return OrderedSet(self._graph.successors(fitness_function))
+        return OrderedSet(self._structural_children[fitness_function])
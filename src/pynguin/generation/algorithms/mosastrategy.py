@@ -17,6 +17,7 @@ import pynguin.utils.statistics.statistics as stat
 from pynguin.ga.operators.ranking.crowdingdistance import (
     fast_epsilon_dominance_assignment,
 )
+from pynguin.ga.operators.ranking.crowdingdistance import select_by_distance
 from pynguin.generation.algorithms.abstractmosastrategy import AbstractMOSATestStrategy
 from pynguin.utils.orderedset import OrderedSet
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
@@ -51,6 +52,7 @@ class MOSATestStrategy(AbstractMOSATestStrategy):
             fast_epsilon_dominance_assignment(
                 fronts.get_sub_front(i),
                 self._archive.uncovered_goals,  # type: ignore[arg-type]
+                fronts.get_sub_front_fitness(i),
             )
 
         self.before_first_search_iteration(
@@ -101,7 +103,9 @@ class MOSATestStrategy(AbstractMOSATestStrategy):
 
         while remain > 0 and remain >= len(front) != 0:
             # Assign crowding distance to individuals
-            fast_epsilon_dominance_assignment(front, uncovered_goals)
+            fast_epsilon_dominance_assignment(
+                front, uncovered_goals, fronts.get_sub_front_fitness(index)
+            )
             # Add the individuals of this front
             self._population.extend(front)
             # Decrement remain
@@ -113,9 +117,9 @@ class MOSATestStrategy(AbstractMOSATestStrategy):
 
         # Remain is less than len(front[index]), insert only the best one
         if remain > 0 and len(front) != 0:
-            fast_epsilon_dominance_assignment(front, uncovered_goals)
-            front.sort(key=lambda t: t.distance, reverse=True)
-            for k in range(remain):
-                self._population.append(front[k])
+            fast_epsilon_dominance_assignment(
+                front, uncovered_goals, fronts.get_sub_front_fitness(index)
+            )
+            self._population.extend(select_by_distance(front, remain))
 
         self._archive.update(self._population)
@@ -100,7 +100,7 @@ class RandomTestStrategy(TestGenerationStrategy):
         # Select random test cases from existing ones to base generation on
         tests = self._random_test_cases(
             [
-                chromosome.test_case
+                chromosome.read_only_test_case
                 for chromosome in test_chromosome.test_case_chromosomes
             ]
         )
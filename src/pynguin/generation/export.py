@@ -68,7 +68,7 @@ class PyTestChromosomeToAstVisitor(cv.ChromosomeVisitor):
             common_modules=self._common_modules,
             exec_result=chromosome.get_last_execution_result(),
         )
-        chromosome.test_case.accept(visitor)
+        chromosome.read_only_test_case.accept(visitor)
         self._conversion_results.append(
             _AstConversionResult(visitor.test_case_ast, visitor.is_failing_test)
         )
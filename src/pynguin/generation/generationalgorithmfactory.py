@@ -66,6 +66,8 @@ from pynguin.generation.stoppingconditions.stoppingcondition import (
 )
 from pynguin.generation.stoppingconditions.stoppingcondition import StoppingCondition
 from pynguin.testcase.execution import AbstractTestCaseExecutor
+from pynguin.testcase.execution import ParallelTestCaseExecutor
+from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.testcase.execution import TypeTracingTestCaseExecutor
 from pynguin.utils.exceptions import ConfigurationException
 from pynguin.utils.orderedset import OrderedSet
@@ -155,6 +157,12 @@ class TestSuiteGenerationAlgorithmFactory(
         test_cluster: ModuleTestCluster,
         constant_provider: ConstantProvider | None = None,
     ):
+        if config.configuration.execution.number_of_workers > 0 and isinstance(
+            executor, TestCaseExecutor
+        ):
+            executor = ParallelTestCaseExecutor(
+                executor, config.configuration.execution.number_of_workers
+            )
         if config.configuration.type_inference.type_tracing:
             executor = TypeTracingTestCaseExecutor(executor, test_cluster)
         self._executor = executor
@@ -80,6 +80,10 @@ class StoppingCondition(so.SearchObserver, ExecutionObserver, metaclass=ABCMeta)
         """Should this observer be attached to the executor?"""
         return self._observes_execution
 
+    @property
+    def observes_statements(self) -> bool:
+        return False
+
     def before_test_case_execution(self, test_case: tc.TestCase):
         pass
 
@@ -191,8 +195,13 @@ class MaxTestExecutionsStoppingCondition(StoppingCondition):
     def before_search_start(self, start_time_ns: int) -> None:
         self._num_executed_tests = 0
 
-    def before_test_case_execution(self, test_case: tc.TestCase):
-        self._num_executed_tests += 1
+    def after_test_case_execution_outside_thread(
+        self, test_case: tc.TestCase, result: ExecutionResult
+    ):
+        # Counted outside the executing thread, such that executions within worker
+        # processes are considered as well.  A reused result was not executed.
+        if not result.reused:
+            self._num_executed_tests += 1
 
     def __str__(self):
         return f"Executed test cases: {self.current_value()}/{self.limit()}"
@@ -230,11 +239,13 @@ class MaxStatementExecutionsStoppingCondition(StoppingCondition):
     def before_search_start(self, start_time_ns: int) -> None:
         self._num_executed_statements = 0
 
-    def before_statement_execution(
-        self, statement: stmt.Statement, node: ast.stmt, exec_ctx: ExecutionContext
+    def after_test_case_execution_outside_thread(
+        self, test_case: tc.TestCase, result: ExecutionResult
     ):
-        self._num_executed_statements += 1
-        return node
+        # Counted outside the executing thread, such that executions within worker
+        # processes are considered as well.
+        if not result.reused:
+            self._num_executed_statements += result.executed_statements
 
     def __str__(self):
         return f"Executed statements: {self.current_value()}/{self.limit()}"
@@ -55,6 +55,7 @@ from pynguin.slicer.statementslicingobserver import StatementSlicingObserver
 from pynguin.testcase.execution import AssertionExecutionObserver
 from pynguin.testcase.execution import ExecutionTracer
 from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.testcase.execution import TypeTracingTestCaseExecutor
 from pynguin.utils import randomness
 from pynguin.utils.report import get_coverage_report
 from pynguin.utils.report import render_coverage_report
@@ -526,6 +527,10 @@ def _run() -> ReturnCode:
         for stop in algorithm.stopping_conditions:
             _LOGGER.info("%s", stop)
     _LOGGER.info("Stop generating test cases")
+    # Release worker processes, which would be outdated after the search anyway.
+    algorithm.executor.shutdown()
+    if isinstance(algorithm.executor, TypeTracingTestCaseExecutor):
+        algorithm.executor.track_statistics_values(stat.track_output_variable)
 
     # Executions that happen after this point should not influence the
     # search statistics
@@ -537,6 +542,7 @@ def _run() -> ReturnCode:
     tracked_metrics = _track_final_metrics(
         algorithm, executor, generation_result, constant_provider
     )
+    executor.track_statistics_values(stat.track_output_variable)
 
     # Export the generated test suites
     if (
@@ -13,6 +13,7 @@ import json
 import logging
 
 from dataclasses import dataclass
+from dataclasses import field
 from types import CodeType
 from typing import TYPE_CHECKING
 
@@ -77,6 +78,13 @@ class CodeObjectMetaData:
     # CDG of this Code Object
     cdg: ControlDependenceGraph
 
+    # The lengths of the shortest paths in the CDG between the nodes of the predicates
+    # of this code object, see ControlDependenceGraph.compute_predicate_distances.
+    # Computed once the code object is instrumented.
+    predicate_distances: dict[int, tuple[tuple[int, int], ...]] = field(
+        default_factory=dict
+    )
+
 
 @dataclass
 class PredicateMetaData:
@@ -253,15 +261,14 @@ class InstrumentationTransformer:
         cfg = CFG.from_bytecode(Bytecode.from_code(code))
         original_cfg = CFG.from_bytecode(Bytecode.from_code(code))
         cdg = ControlDependenceGraph.compute(cfg)
-        code_object_id = self._tracer.register_code_object(
-            CodeObjectMetaData(
-                code_object=code,
-                parent_code_object_id=parent_code_object_id,
-                cfg=cfg,
-                original_cfg=original_cfg,
-                cdg=cdg,
-            )
+        code_object_meta_data = CodeObjectMetaData(
+            code_object=code,
+            parent_code_object_id=parent_code_object_id,
+            cfg=cfg,
+            original_cfg=original_cfg,
+            cdg=cdg,
         )
+        code_object_id = self._tracer.register_code_object(code_object_meta_data)
         # Overwrite/Set docstring to carry tagging information, i.e.,
         # the code object id. Convert to JSON string because I'm not sure where this
         # value might be used in CPython.
@@ -272,6 +279,7 @@ class InstrumentationTransformer:
         for adapter in self._instrumentation_adapters:
             adapter.visit_entry_node(real_entry_node.basic_block, code_object_id)
         self._instrument_cfg(cfg, code_object_id)
+        code_object_meta_data.predicate_distances = cdg.compute_predicate_distances()
         return self._instrument_inner_code_objects(
             cfg.bytecode_cfg().to_code(), code_object_id
         )
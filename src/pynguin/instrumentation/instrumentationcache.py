@@ -0,0 +1,227 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides an on-disk cache for instrumented modules.
+
+Instrumenting a module requires to build the control-flow graphs, the control
+dependence graphs and the dominator trees of all its code objects.  The cache stores
+the instrumented code object of a module together with the subject properties that
+were registered during the instrumentation, similar to the ``__pycache__`` of the
+Python interpreter.  An entry is used if the source of the module and the applied
+instrumentations are unchanged.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import io
+import logging
+import marshal
+import os
+import pickle  # nosec
+import sys
+import tempfile
+
+from pathlib import Path
+from types import CodeType
+from typing import TYPE_CHECKING
+from typing import Any
+
+from bytecode.instr import UNSET
+from bytecode.instr import InstrLocation
+
+from pynguin.__version__ import __version__
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import pynguin.configuration as config
+
+    from pynguin.analyses.constants import DynamicConstantProvider
+    from pynguin.testcase.execution import ExecutionTracer
+    from pynguin.testcase.execution import SubjectProperties
+
+_LOGGER = logging.getLogger(__name__)
+
+# Increase, if the format of the cache entries changes.
+_CACHE_FORMAT_VERSION = 2
+
+# Identify the objects that the instrumented code refers to, which must be replaced
+# by the objects of the current run when loading an entry.
+_TRACER_ID = "tracer"
+_DYNAMIC_CONSTANT_PROVIDER_ID = "dynamic_constant_provider"
+
+
+def _load_code(code: bytes, constants: tuple[Any, ...]) -> CodeType:
+    # Reverses _CachePickler.reducer_override.
+    return marshal.loads(code).replace(co_consts=constants)  # nosec
+
+
+class _CachePickler(pickle.Pickler):
+    """A pickler for code objects that refer to the tracer and the dynamic constant
+    provider of a run.
+
+    Code objects are marshalled without their constants, which are pickled
+    separately.  Thus, the constants may contain arbitrary objects.  Instruction
+    locations are frozen and slotted, and UNSET is a singleton, thus they cannot be
+    pickled by default.
+    """
+
+    def __init__(self, file, shared_objects: dict[int, str]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared_objects = shared_objects
+
+    def persistent_id(self, obj: Any) -> str | None:
+        return self._shared_objects.get(id(obj))
+
+    def reducer_override(self, obj: Any) -> Any:
+        if obj is UNSET:
+            return "UNSET"
+        if type(obj) is CodeType:  # pylint: disable=unidiomatic-typecheck
+            return _load_code, (
+                marshal.dumps(obj.replace(co_consts=())),
+                obj.co_consts,
+            )
+        if type(obj) is InstrLocation:  # pylint: disable=unidiomatic-typecheck
+            return InstrLocation, (
+                obj.lineno,
+                obj.end_lineno,
+                obj.col_offset,
+                obj.end_col_offset,
+            )
+        return NotImplemented
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """Unpickles the entries that were pickled by _CachePickler."""
+
+    def __init__(self, file, shared_objects: dict[str, Any]) -> None:
+        super().__init__(file)
+        self._shared_objects = shared_objects
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self._shared_objects[pid]
+
+
+class InstrumentationCache:
+    """A cache for instrumented modules that is stored in a directory.
+
+    The entries are keyed by a hash of the module's source, the applied
+    instrumentations, and the versions of Pynguin and the Python interpreter.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | os.PathLike,
+        tracer: ExecutionTracer,
+        coverage_metrics: set[config.CoverageMetric],
+        dynamic_constant_provider: DynamicConstantProvider | None = None,
+    ) -> None:
+        """Create a new cache.
+
+        Args:
+            cache_dir: The directory that contains the cache entries
+            tracer: The tracer that is used by the instrumented code
+            coverage_metrics: The coverage metrics that are instrumented
+            dynamic_constant_provider: The dynamic constant provider that is used by
+                the instrumented code, if any.
+        """
+        self._cache_dir = Path(cache_dir)
+        self._tracer = tracer
+        self._coverage_metrics = coverage_metrics
+        self._dynamic_constant_provider = dynamic_constant_provider
+
+    def _shared_objects(self) -> dict[str, Any]:
+        shared_objects: dict[str, Any] = {_TRACER_ID: self._tracer}
+        if self._dynamic_constant_provider is not None:
+            shared_objects[
+                _DYNAMIC_CONSTANT_PROVIDER_ID
+            ] = self._dynamic_constant_provider
+        return shared_objects
+
+    def entry_path(self, module_name: str, source: bytes) -> Path:
+        """Provides the path of the cache entry for the given module.
+
+        Args:
+            module_name: The name of the module
+            source: The source of the module
+
+        Returns:
+            The path of the cache entry
+        """
+        key = hashlib.sha256()
+        for part in (
+            str(_CACHE_FORMAT_VERSION),
+            __version__,
+            sys.version,
+            importlib.util.MAGIC_NUMBER.hex(),
+            module_name,
+            ",".join(sorted(metric.value for metric in self._coverage_metrics)),
+            str(self._dynamic_constant_provider is not None),
+        ):
+            key.update(part.encode())
+            key.update(b"\0")
+        key.update(source)
+        return self._cache_dir / f"{module_name}.{key.hexdigest()}.pickle"
+
+    def get_code(
+        self, module_name: str, source: bytes, instrument: Callable[[], CodeType]
+    ) -> CodeType:
+        """Provides the instrumented code of a module.
+
+        If there is an entry for the module, the subject properties of the tracer are
+        replaced by the cached ones.  Otherwise, the module is instrumented, which
+        registers the subject properties at the tracer, and an entry is stored.
+
+        Args:
+            module_name: The name of the module
+            source: The source of the module
+            instrument: Instruments the module
+
+        Returns:
+            The instrumented code object of the module
+        """
+        path = self.entry_path(module_name, source)
+        if (entry := self._load(path)) is not None:
+            code, subject_properties = entry
+            _LOGGER.debug("Use cached instrumentation of %s", module_name)
+            self._tracer.subject_properties = subject_properties
+            return code
+        code = instrument()
+        self._store(path, code, self._tracer.get_subject_properties())
+        return code
+
+    def _load(self, path: Path) -> tuple[CodeType, SubjectProperties] | None:
+        try:
+            with path.open("rb") as file:
+                return _CacheUnpickler(file, self._shared_objects()).load()  # nosec
+        except FileNotFoundError:
+            return None
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Ignore invalid instrumentation cache entry %s", path)
+            _LOGGER.debug("Failed to load cache entry", exc_info=error)
+            return None
+
+    def _store(
+        self, path: Path, code: CodeType, subject_properties: SubjectProperties
+    ) -> None:
+        shared_objects = {id(obj): pid for pid, obj in self._shared_objects().items()}
+        try:
+            buffer = io.BytesIO()
+            _CachePickler(buffer, shared_objects).dump((code, subject_properties))
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # Replace the entry atomically, because several runs might share the
+            # cache directory.
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=self._cache_dir, suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(buffer.getvalue())
+            os.replace(temp_path, path)
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.warning("Failed to store instrumentation cache entry %s", path)
+            _LOGGER.debug("Failed to store cache entry", exc_info=error)
@@ -32,6 +32,7 @@ from pynguin.instrumentation.instrumentation import CheckedCoverageInstrumentati
 from pynguin.instrumentation.instrumentation import DynamicSeedingInstrumentation
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.instrumentation.instrumentation import LineCoverageInstrumentation
+from pynguin.instrumentation.instrumentationcache import InstrumentationCache
 
 
 if TYPE_CHECKING:
@@ -48,10 +49,12 @@ class InstrumentationLoader(SourceFileLoader):
         path,
         tracer: ExecutionTracer,
         transformer: InstrumentationTransformer,
+        cache: InstrumentationCache | None = None,
     ):
         super().__init__(fullname, path)
         self._tracer = tracer
         self._transformer = transformer
+        self._cache = cache
 
     def exec_module(self, module):
         self._tracer.reset()
@@ -68,6 +71,15 @@ class InstrumentationLoader(SourceFileLoader):
         Returns:
             The modules code blocks
         """
+        if self._cache is not None:
+            return self._cache.get_code(
+                fullname,
+                self.get_data(self.get_filename(fullname)),
+                lambda: self._instrument(fullname),
+            )
+        return self._instrument(fullname)
+
+    def _instrument(self, fullname) -> CodeType:
         to_instrument = cast(CodeType, super().get_code(fullname))
         assert to_instrument is not None, "Failed to get code object of module."
         return self._transformer.instrument_module(to_instrument)
@@ -122,6 +134,7 @@ class InstrumentationFinder(MetaPathFinder):
         tracer: ExecutionTracer,
         coverage_metrics: set[config.CoverageMetric],
         dynamic_constant_provider: DynamicConstantProvider | None = None,
+        instrumentation_cache_dir: str = "",
     ) -> None:
         """Wraps the given pathfinder.
 
@@ -131,12 +144,15 @@ class InstrumentationFinder(MetaPathFinder):
             tracer: the execution tracer
             coverage_metrics: the coverage metrics to be used for instrumentation.
             dynamic_constant_provider: Used for dynamic constant seeding
+            instrumentation_cache_dir: The directory of the on-disk cache for the
+                instrumented module, the cache is disabled if it is empty.
         """
         self._module_to_instrument = module_to_instrument
         self._original_pathfinder = original_pathfinder
         self._tracer = tracer
         self._coverage_metrics = coverage_metrics
         self._dynamic_constant_provider = dynamic_constant_provider
+        self._instrumentation_cache_dir = instrumentation_cache_dir
 
     def update_instrumentation_metrics(
         self,
@@ -156,6 +172,16 @@ class InstrumentationFinder(MetaPathFinder):
         self._coverage_metrics = coverage_metrics
         self._dynamic_constant_provider = dynamic_constant_provider
 
+    def _build_cache(self) -> InstrumentationCache | None:
+        if not self._instrumentation_cache_dir:
+            return None
+        return InstrumentationCache(
+            self._instrumentation_cache_dir,
+            self._tracer,
+            self._coverage_metrics,
+            self._dynamic_constant_provider,
+        )
+
     def _should_instrument(self, module_name: str):
         return module_name == self._module_to_instrument
 
@@ -188,6 +214,7 @@ class InstrumentationFinder(MetaPathFinder):
                             self._coverage_metrics,
                             self._dynamic_constant_provider,
                         ),
+                        self._build_cache(),
                     )
                     return spec
                 self._logger.error(
@@ -223,6 +250,7 @@ def install_import_hook(
     tracer: ExecutionTracer,
     coverage_metrics: set[config.CoverageMetric] | None = None,
     dynamic_constant_provider: DynamicConstantProvider | None = None,
+    instrumentation_cache_dir: str | None = None,
 ) -> ImportHookContextManager:
     """Install the InstrumentationFinder in the meta path.
 
@@ -232,6 +260,9 @@ def install_import_hook(
         coverage_metrics: the coverage metrics to be used for instrumentation, falls
             back to the configured metrics in the configuration, if not specified.
         dynamic_constant_provider: Used for dynamic constant seeding
+        instrumentation_cache_dir: The directory of the on-disk cache for the
+            instrumented module, falls back to the configured directory, if not
+            specified.
 
     Returns:
         a context manager which can be used to uninstall the hook.
@@ -250,6 +281,10 @@ def install_import_hook(
         )
     if coverage_metrics is None:
         coverage_metrics = set(config.configuration.statistics_output.coverage_metrics)
+    if instrumentation_cache_dir is None:
+        instrumentation_cache_dir = (
+            config.configuration.execution.instrumentation_cache_dir
+        )
 
     to_wrap = None
     for finder in sys.meta_path:
@@ -270,6 +305,7 @@ def install_import_hook(
         tracer,
         coverage_metrics=coverage_metrics,
         dynamic_constant_provider=dynamic_constant_provider,
+        instrumentation_cache_dir=instrumentation_cache_dir,
     )
     sys.meta_path.insert(0, hook)
     return ImportHookContextManager(hook)
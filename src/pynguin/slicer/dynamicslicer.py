@@ -17,6 +17,7 @@ import time
 from dataclasses import dataclass
 from dataclasses import field
 from typing import TYPE_CHECKING
+from typing import TypeVar
 
 import pynguin.configuration as config
 import pynguin.utils.opcodes as op
@@ -25,6 +26,7 @@ from pynguin.slicer.executedinstruction import ExecutedAttributeInstruction
 from pynguin.slicer.executedinstruction import ExecutedMemoryInstruction
 from pynguin.slicer.executionflowbuilder import ExecutionFlowBuilder
 from pynguin.slicer.executionflowbuilder import UniqueInstruction
+from pynguin.slicer.slicingcache import SlicingCache
 from pynguin.slicer.stack.stackeffect import StackEffect
 from pynguin.slicer.stack.stacksimulation import TraceStack
 from pynguin.utils.exceptions import InstructionNotFoundException
@@ -32,6 +34,8 @@ from pynguin.utils.exceptions import SlicingTimeoutException
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from bytecode import Instr
 
     from pynguin.analyses.controlflow import CFG
@@ -44,6 +48,8 @@ if TYPE_CHECKING:
     from pynguin.testcase.execution import ExecutionTrace
     from pynguin.testcase.execution import SubjectProperties
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class SlicingCriterion:
@@ -59,51 +65,64 @@ class SlicingCriterion:
 class SlicingContext:  # pylint: disable=too-many-instance-attributes
     """Data class storing all defined and used variables as well as instructions
     used at one point during the slicing.
+
+    The context is shared by all slicing criteria of a traversal.  The criteria are
+    numbered, each entry is mapped to the bit mask of the criteria it belongs to.
     """
 
-    # Instructions included in the slice
-    instr_in_slice: list[UniqueInstruction] = field(default_factory=list)
+    # Instructions included in the slice of each criterion
+    instr_in_slice: dict[int, list[UniqueInstruction]] = field(default_factory=dict)
 
     # Instructions for which to compute control dependencies
-    instr_ctrl_deps: set[UniqueInstruction] = field(default_factory=set)
+    instr_ctrl_deps: dict[UniqueInstruction, int] = field(default_factory=dict)
 
     # Variable uses for which a definition is needed
-    var_uses_local: set[tuple[int | str | None, int]] = field(default_factory=set)
-    var_uses_global: set[tuple[int | str | None, str]] = field(default_factory=set)
+    var_uses_local: dict[tuple[int | str | None, int], int] = field(
+        default_factory=dict
+    )
+    var_uses_global: dict[tuple[int | str | None, str], int] = field(
+        default_factory=dict
+    )
 
-    var_uses_nonlocal: set[tuple] = field(default_factory=set)
-    var_uses_addresses: set[str] = field(default_factory=set)
+    var_uses_nonlocal: dict[tuple, int] = field(default_factory=dict)
+    var_uses_addresses: dict[str, int] = field(default_factory=dict)
 
     # Attribute uses for which a definition is needed
-    attr_uses: set[str] = field(default_factory=set)
+    attr_uses: dict[str, int] = field(default_factory=dict)
 
     # Variable uses, which normally are attribute uses
     # (used when encompassing object is created)
-    attribute_variables: set[str] = field(default_factory=set)
+    attribute_variables: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
 class SlicingState:  # pylint: disable=too-many-instance-attributes
     """Holds the configuration and state of the dynamic slicing process
     for each analysed instruction.
+
+    The trace is traversed once for all slicing criteria that are reached by the
+    traversal.  The bit mask of these criteria is stored in criteria, the first one
+    is the criterion at which the traversal started.
     """
 
     basic_block_id: int
     code_object_id: int
-    context: SlicingContext
     curr_instr: Instr
     execution_flow_builder: ExecutionFlowBuilder
     file: str
-    new_attribute_object_uses: set[str]
     offset: int
-    pops: int
-    pushes: int
     timeout: float
     trace_position: int
-    trace_stack: TraceStack
-    code_object_dependent: bool = False
-    import_back_call: UniqueInstruction | None = None
+    first_criterion: int
+    context: SlicingContext = field(default_factory=SlicingContext)
+    criteria: int = 0
+    new_attribute_object_uses: dict[str, int] = field(default_factory=dict)
+    pops: int = 0
+    pushes: int = 0
+    trace_stack: TraceStack = field(default_factory=TraceStack)
+    code_object_dependent: int = 0
     stack_simulation: bool = True  # must be disabled for exceptions
+    import_back_call: UniqueInstruction | None = None
 
     def update_state(self) -> LastInstrState:
         """Updates the slicing state for the next instruction.
@@ -127,6 +146,17 @@ class SlicingState:  # pylint: disable=too-many-instance-attributes
         return last_state
 
 
+def _add_criteria(entries: dict[_T, int], key: _T, criteria: int) -> None:
+    entries[key] = entries.get(key, 0) | criteria
+
+
+def _iter_criteria(criteria: int) -> Iterator[int]:
+    while criteria:
+        lowest = criteria & -criteria
+        yield lowest.bit_length() - 1
+        criteria ^= lowest
+
+
 class DynamicSlicer:
     """Class that holds the slicing logic and calls."""
 
@@ -135,10 +165,12 @@ class DynamicSlicer:
     def __init__(
         self,
         known_code_objects: dict[int, CodeObjectMetaData],
+        slicing_cache: SlicingCache | None = None,
     ):
         self._known_code_objects = known_code_objects
+        self._slicing_cache = SlicingCache() if slicing_cache is None else slicing_cache
 
-    def slice(  # pylint: disable=too-many-branches, too-many-locals
+    def slice(
         self,
         trace: ExecutionTrace,
         slicing_criterion: SlicingCriterion,
@@ -157,27 +189,67 @@ class DynamicSlicer:
             SlicingTimeoutException: when the slicing takes longer than the
                 configured budget
         """
-        slc = self._setup_slicing_configuration(slicing_criterion, trace)
+        return self.slice_criteria(trace, [slicing_criterion])[0]
 
-        while True:
-            criterion_in_slice = imp_data_dep = False
-            include_use = True
+    def slice_criteria(
+        self,
+        trace: ExecutionTrace,
+        slicing_criteria: list[SlicingCriterion],
+    ) -> list[list[UniqueInstruction]]:
+        """Performs the dynamic slicing for several slicing criteria at once.
 
+        The trace is traversed backwards starting at the latest criterion.  The other
+        criteria join the traversal when it reaches them.  The traversal tracks the
+        uses, the control dependencies and the simulated stack for the union of its
+        criteria, each entry only records the criteria it belongs to.  A criterion
+        that is not reached, or whose simulated stack would differ from the one of
+        the traversal, is sliced in another traversal.
+
+        Args:
+            trace: Execution trace object containing slicing information
+                with collected instructions.
+            slicing_criteria: Slicing criterion objects where slicing is started
+
+        Returns:
+            The included instructions of each slicing criterion, in the order of the
+            criteria.
+
+        Raises:
+            SlicingTimeoutException: when the slicing takes longer than the
+                configured budget
+        """
+        slices: dict[int, list[UniqueInstruction]] = {}
+        pending = list(range(len(slicing_criteria)))
+        while pending:
+            # Ordered by trace position, such that the latest criterion is the last one
+            pending.sort(key=lambda index: slicing_criteria[index].trace_position)
+            slices.update(self._slice_traversal(trace, slicing_criteria, pending))
+        return [slices[index] for index in range(len(slicing_criteria))]
+
+    def _slice_traversal(
+        self,
+        trace: ExecutionTrace,
+        slicing_criteria: list[SlicingCriterion],
+        pending: list[int],
+    ) -> dict[int, list[UniqueInstruction]]:
+        first = pending.pop()
+        slc = self._setup_slicing_configuration(slicing_criteria[first], trace, first)
+        # The criteria that are split off from this traversal
+        split_off: list[int] = []
+
+        while True:
             # Get last instruction
             last_state = slc.update_state()
 
-            if last_state.exception:
-                # Stack can not be reliably simulated when an exception occurred
-                slc.stack_simulation = False
             if not last_state.last_instr:
-                # Reached end of executed instructions -> return slice (and keep order)
-                instructions = set()
-                slice_instructions = []
-                for i in reversed(slc.context.instr_in_slice):
-                    if i not in instructions:
-                        instructions.add(i)
-                        slice_instructions.append(i)
-                return slice_instructions
+                # Reached end of executed instructions -> return slices
+                pending.extend(split_off)
+                return {
+                    index: self._get_slice_instructions(
+                        slc.context.instr_in_slice[index]
+                    )
+                    for index in _iter_criteria(slc.criteria)
+                }
 
             last_unique_instr = self.create_unique_instruction(
                 slc.file,
@@ -192,75 +264,179 @@ class DynamicSlicer:
                 last_traced_instr = trace.executed_instructions[slc.trace_position]
                 slc.trace_position -= 1
 
-            # Stack housekeeping
-            prev_import_back_call = self._stack_housekeeping(
-                last_state, last_unique_instr, slc
+            split_off.extend(
+                _iter_criteria(
+                    self._slice_instruction(
+                        last_state, last_unique_instr, last_traced_instr, slc
+                    )
+                )
             )
+            slc.import_back_call = slc.trace_stack.get_import_frame()
 
-            # Control dependency
-            control_dependency = self.check_control_dependency(
-                slc.context, last_unique_instr, slc.code_object_id
+            self._add_reached_criteria(
+                slicing_criteria, pending, last_unique_instr, slc
             )
 
-            # Data dependencies
-            # Explicit data dependency
-            (
-                exp_data_dep,
-                slc.new_attribute_object_uses,
-            ) = self.check_explicit_data_dependency(
-                slc.context, last_unique_instr, last_traced_instr
-            )
+            # next iteration
+            slc.curr_instr = last_state.last_instr
+
+            if time.time() > slc.timeout:
+                raise SlicingTimeoutException
 
-            # Dependency via method call
-            if last_state.call and slc.code_object_dependent:
-                imp_data_dep = True
-                slc.code_object_dependent = False
+    def _slice_instruction(  # pylint: disable=too-many-arguments
+        self,
+        last_state: LastInstrState,
+        last_unique_instr: UniqueInstruction,
+        last_traced_instr: ExecutedInstruction | None,
+        slc: SlicingState,
+    ) -> int:
+        imp_data_dep = exclude_use = split_off = 0
 
-                if last_state.import_start:
+        if last_state.exception:
+            # Stack can not be reliably simulated when an exception occurred
+            slc.stack_simulation = False
+
+        # Stack housekeeping
+        prev_import_back_call = self._stack_housekeeping(
+            last_state, last_unique_instr, slc
+        )
+
+        # Control dependency
+        control_dependency = self.check_control_dependency(
+            slc.context, last_unique_instr, slc.code_object_id
+        )
+
+        # Data dependencies
+        # Explicit data dependency
+        (
+            exp_data_dep,
+            slc.new_attribute_object_uses,
+        ) = self.check_explicit_data_dependency(
+            slc.context, last_unique_instr, last_traced_instr
+        )
+
+        # Dependency via method call
+        code_object_dependent = slc.code_object_dependent & slc.criteria
+        if last_state.call and code_object_dependent:
+            slc.code_object_dependent = 0
+
+            if last_state.import_start:
+                if code_object_dependent != slc.criteria:
+                    # Only the dependent criteria include the import statement on
+                    # their stacks, thus the other group of criteria has to be
+                    # sliced in a traversal of its own.
+                    split_off = self._split_criteria(slc, code_object_dependent)
+                    code_object_dependent &= slc.criteria
+                if code_object_dependent:
                     # We need to include the import statement after determining
                     # if one of the instructions executed by the import is included
                     # (because IMPORT_NAME is traced afterwards).
-                    slc.context.instr_in_slice.append(prev_import_back_call)
+                    self._add_to_slices(
+                        slc.context, prev_import_back_call, code_object_dependent
+                    )
                     num_import_pops = StackEffect.stack_effect(
                         prev_import_back_call.opcode, arg=None, jump=False
                     )[0]
                     slc.trace_stack.update_pop_operations(
-                        num_import_pops, prev_import_back_call, True
+                        num_import_pops, prev_import_back_call, code_object_dependent
                     )
-            # Implicit data dependency (over stack)
-            if slc.stack_simulation:
-                stack_dep, include_use = slc.trace_stack.update_push_operations(
-                    slc.pushes, last_state.returned
-                )
-                if stack_dep:
-                    imp_data_dep = True
-            if last_state.returned:
-                slc.code_object_dependent = False
-
-            if control_dependency or exp_data_dep or imp_data_dep:
-                criterion_in_slice = True
-
-                if not last_state.call:
-                    slc.code_object_dependent = True
-
-            # Unconditional jumps
-            if last_state.jump and last_state.last_instr.is_uncond_jump():
-                criterion_in_slice = True
-
-            # Housekeeping for execution trace, stack
-            self._trace_housekeeping(
-                criterion_in_slice,
-                include_use,
-                last_traced_instr,
-                last_unique_instr,
-                slc,
+            imp_data_dep = code_object_dependent
+        # Implicit data dependency (over stack)
+        if slc.stack_simulation:
+            stack_dep, exclude_use = slc.trace_stack.update_push_operations(
+                slc.pushes, last_state.returned
             )
+            imp_data_dep |= stack_dep
+        if last_state.returned:
+            slc.code_object_dependent = 0
+
+        criteria_in_slice = (
+            control_dependency | exp_data_dep | imp_data_dep
+        ) & slc.criteria
+        if not last_state.call:
+            slc.code_object_dependent |= criteria_in_slice
+
+        # Unconditional jumps
+        if last_state.jump and last_state.last_instr.is_uncond_jump():
+            criteria_in_slice = slc.criteria
+
+        # Housekeeping for execution trace, stack
+        self._trace_housekeeping(
+            criteria_in_slice,
+            criteria_in_slice & ~exclude_use,
+            last_traced_instr,
+            last_unique_instr,
+            slc,
+        )
+        return split_off
 
-            # next iteration
-            slc.curr_instr = last_state.last_instr
+    @staticmethod
+    def _split_criteria(slc: SlicingState, criteria: int) -> int:
+        # Keeps the group of criteria that contains the first criterion of the
+        # traversal, such that each traversal completes at least one criterion.
+        if not criteria & (1 << slc.first_criterion):
+            criteria = slc.criteria & ~criteria
+        split_off = slc.criteria & ~criteria
+        slc.criteria = criteria
+        return split_off
+
+    def _add_reached_criteria(
+        self,
+        slicing_criteria: list[SlicingCriterion],
+        pending: list[int],
+        unique_instr: UniqueInstruction,
+        slc: SlicingState,
+    ) -> None:
+        # A criterion is reached, if its instruction is the current one of the
+        # traversal at its position in the trace.  Slicing the criterion continues
+        # from the state that a traversal starting at the criterion would have,
+        # which requires that the instruction is on the simulated stack as often as
+        # it would be at the start.
+        reached = []
+        for index in pending:
+            criterion = slicing_criteria[index]
+            if (
+                criterion.trace_position == slc.trace_position
+                and (
+                    criterion.unique_instr.code_object_id,
+                    criterion.unique_instr.node_id,
+                    criterion.unique_instr.offset,
+                    criterion.unique_instr.opcode,
+                )
+                == (
+                    unique_instr.code_object_id,
+                    unique_instr.node_id,
+                    unique_instr.offset,
+                    unique_instr.opcode,
+                )
+                and slc.stack_simulation
+                and self._initial_stack_effect(criterion.unique_instr)[0] == slc.pops
+            ):
+                reached.append(index)
+        for index in reached:
+            pending.remove(index)
+            self._add_criterion(slc, index, slicing_criteria[index].unique_instr)
+            unique_instr.in_slice |= 1 << index
 
-            if time.time() > slc.timeout:
-                raise SlicingTimeoutException
+    @staticmethod
+    def _get_slice_instructions(
+        instr_in_slice: list[UniqueInstruction],
+    ) -> list[UniqueInstruction]:
+        # Keep the order of the instructions
+        instructions = set()
+        slice_instructions = []
+        for i in reversed(instr_in_slice):
+            if i not in instructions:
+                instructions.add(i)
+                slice_instructions.append(i)
+        return slice_instructions
+
+    @staticmethod
+    def _add_to_slices(
+        context: SlicingContext, unique_instr: UniqueInstruction, criteria: int
+    ) -> None:
+        for index in _iter_criteria(criteria):
+            context.instr_in_slice[index].append(unique_instr)
 
     def _stack_housekeeping(self, last_state, last_unique_instr, slc):
         prev_import_back_call = slc.trace_stack.get_import_frame()
@@ -272,28 +448,32 @@ class DynamicSlicer:
             # Frame finished
             self._finish_frame(slc)
         slc.context.attribute_variables = slc.trace_stack.get_attribute_uses()
-        slc.import_back_call = slc.trace_stack.get_import_frame()
         self._update_stack_effects(last_state, last_unique_instr, slc)
         return prev_import_back_call
 
     def _trace_housekeeping(  # pylint: disable=too-many-arguments
-        self, criterion_in_slice, include_use, last_traced_instr, last_unique_instr, slc
+        self,
+        criteria_in_slice,
+        criteria_with_uses,
+        last_traced_instr,
+        last_unique_instr,
+        slc,
     ):
         # Add instruction to slice
-        if criterion_in_slice:
-            slc.context.instr_in_slice.append(last_unique_instr)
+        if criteria_in_slice:
+            self._add_to_slices(slc.context, last_unique_instr, criteria_in_slice)
         # Add uses (for S_D)
-        if criterion_in_slice and last_unique_instr.is_use() and include_use:
-            self.add_uses(slc.context, last_traced_instr)
+        if criteria_with_uses and last_unique_instr.is_use():
+            self.add_uses(slc.context, last_traced_instr, criteria_with_uses)
         # Add control dependencies (for S_C)
-        if criterion_in_slice:
+        if criteria_in_slice:
             self.add_control_dependencies(
-                slc.context, last_unique_instr, slc.code_object_id
+                slc.context, last_unique_instr, slc.code_object_id, criteria_in_slice
             )
         # Add current instruction to the stack
         if slc.stack_simulation:
             slc.trace_stack.update_pop_operations(
-                slc.pops, last_unique_instr, criterion_in_slice
+                slc.pops, last_unique_instr, criteria_in_slice
             )
 
     @staticmethod
@@ -328,8 +508,8 @@ class DynamicSlicer:
         self,
         slicing_criterion: SlicingCriterion,
         trace: ExecutionTrace,
+        index: int,
     ):
-        new_attribute_object_uses: set[str] = set()
         # Build slicing criterion
         last_ex_instruction = slicing_criterion.unique_instr
         code_object_id = last_ex_instruction.code_object_id
@@ -337,46 +517,47 @@ class DynamicSlicer:
         curr_instr = self._locate_unique_in_bytecode(
             last_ex_instruction, code_object_id, basic_block_id
         )
-        execution_flow_builder = ExecutionFlowBuilder(trace, self._known_code_objects)
-        pops, pushes, trace_stack = self._init_stack(
-            last_ex_instruction,
+        execution_flow_builder = ExecutionFlowBuilder(
+            trace, self._known_code_objects, self._slicing_cache
         )
-        context = self._init_context(code_object_id, last_ex_instruction)
         timeout = time.time() + config.configuration.stopping.maximum_slicing_time
-        return SlicingState(
+        slc = SlicingState(
             basic_block_id,
             code_object_id,
-            context,
             curr_instr,
             execution_flow_builder,
             last_ex_instruction.file,
-            new_attribute_object_uses,
             last_ex_instruction.offset,
-            pops,
-            pushes,
             timeout,
             slicing_criterion.trace_position,
-            trace_stack,
+            index,
         )
+        self._add_criterion(slc, index, last_ex_instruction)
+        slc.pops, slc.pushes = self._initial_stack_effect(last_ex_instruction)
+        slc.trace_stack.update_push_operations(slc.pushes, returned=False)
+        slc.trace_stack.update_pop_operations(
+            slc.pops, last_ex_instruction, 1 << index
+        )  # The slicing criterion is in the slice
+        return slc
 
     @staticmethod
-    def _init_stack(last_ex_instruction) -> tuple[int, int, TraceStack]:
-        trace_stack = TraceStack()
-        pops, pushes = StackEffect.stack_effect(
+    def _initial_stack_effect(last_ex_instruction) -> tuple[int, int]:
+        return StackEffect.stack_effect(
             last_ex_instruction.opcode,
             last_ex_instruction.dis_arg,
         )
-        trace_stack.update_push_operations(pushes, returned=False)
-        trace_stack.update_pop_operations(
-            pops, last_ex_instruction, in_slice=True
-        )  # The slicing criterion is in the slice
-        return pops, pushes, trace_stack
 
-    def _init_context(self, code_object_id, last_ex_instruction) -> SlicingContext:
-        context = SlicingContext()
-        context.instr_in_slice.append(last_ex_instruction)
-        self.add_control_dependencies(context, last_ex_instruction, code_object_id)
-        return context
+    def _add_criterion(
+        self, slc: SlicingState, index: int, last_ex_instruction: UniqueInstruction
+    ) -> None:
+        slc.criteria |= 1 << index
+        slc.context.instr_in_slice[index] = [last_ex_instruction]
+        self.add_control_dependencies(
+            slc.context,
+            last_ex_instruction,
+            last_ex_instruction.code_object_id,
+            1 << index,
+        )
 
     def _locate_unique_in_bytecode(
         self, instr: UniqueInstruction, code_object_id: int, basic_block_id: int
@@ -431,6 +612,7 @@ class DynamicSlicer:
             offset,
             instr.arg,
             instr.lineno,
+            slicing_cache=self._slicing_cache,
         )
 
     def check_control_dependency(
@@ -438,7 +620,7 @@ class DynamicSlicer:
         context: SlicingContext,
         unique_instr: UniqueInstruction,
         code_object_id: int,
-    ) -> bool:
+    ) -> int:
         """Check if the given unique instruction has a control dependency from the
         slicing context.
 
@@ -448,13 +630,13 @@ class DynamicSlicer:
             code_object_id: the id of the code object containing the instruction
 
         Returns:
-            True if the instruction is part of the slice due to a control dependency,
-            False otherwise
+            The bit mask of the slicing criteria whose slices contain the instruction
+            due to a control dependency
         """
-        control_dependency = False
+        control_dependency = 0
 
         if not unique_instr.is_cond_branch():
-            return False
+            return 0
 
         code_object: CodeObjectMetaData = self._known_code_objects[code_object_id]
         cdg: ControlDependenceGraph = code_object.cdg
@@ -462,17 +644,13 @@ class DynamicSlicer:
         assert curr_node, "Invalid node id"
         successors = cdg.get_successors(curr_node)
 
-        instr_ctrl_deps_copy = context.instr_ctrl_deps.copy()
-
         # Check if any instruction on S_C is control dependent on current instruction
         # If so: include current instruction in the slice, remove all instructions
         # control dependent on current instruction
-        for instr in context.instr_ctrl_deps:
+        for instr in list(context.instr_ctrl_deps):
             instr_node = self.get_node(instr.node_id, cdg)
             if instr_node in successors:
-                instr_ctrl_deps_copy.remove(instr)
-                control_dependency = True
-        context.instr_ctrl_deps = instr_ctrl_deps_copy
+                control_dependency |= context.instr_ctrl_deps.pop(instr)
 
         return control_dependency
 
@@ -481,6 +659,7 @@ class DynamicSlicer:
         context: SlicingContext,
         unique_instr: UniqueInstruction,
         code_object_id: int,
+        criteria: int,
     ) -> None:
         """Add control dependencies to the slicing context.
 
@@ -488,6 +667,8 @@ class DynamicSlicer:
             context: The context that will receive the control dependencies
             unique_instr: The instruction to check for control dependencies
             code_object_id: the id of the code object containing the instruction
+            criteria: the bit mask of the slicing criteria whose slices contain the
+                instruction
         """
         code_object: CodeObjectMetaData = self._known_code_objects[code_object_id]
         cdg: ControlDependenceGraph = code_object.cdg
@@ -497,7 +678,7 @@ class DynamicSlicer:
 
         for predecessor in predecessors:
             if not predecessor.is_artificial:
-                context.instr_ctrl_deps.add(unique_instr)
+                _add_criteria(context.instr_ctrl_deps, unique_instr, criteria)
 
     @staticmethod
     def get_node(
@@ -524,7 +705,7 @@ class DynamicSlicer:
         context: SlicingContext,
         unique_instr: UniqueInstruction,
         traced_instr: ExecutedInstruction | None,
-    ) -> tuple[bool, set[str]]:
+    ) -> tuple[int, dict[str, int]]:
         """Analyses the explicit data dependencies from one instruction to another
         instruction.
 
@@ -534,15 +715,16 @@ class DynamicSlicer:
             traced_instr: the instruction the data dependency can be to
 
         Returns:
-            A tuple with either False and an empty set or True and a set containing all
-            explicit attribute creation uses.
+            A tuple with the bit mask of the slicing criteria, for which the
+            instruction has an explicit data dependency, and the explicit attribute
+            creation uses, mapped to the bit masks of their criteria.
         """
-        complete_cover = False
-        partial_cover = False
-        attribute_creation_uses = set()
+        complete_cover = 0
+        partial_cover = 0
+        attribute_creation_uses: dict[str, int] = {}
 
         if not unique_instr.is_def():
-            return False, set()
+            return 0, {}
 
         # Check variable definitions
         if isinstance(traced_instr, ExecutedMemoryInstruction):
@@ -558,45 +740,46 @@ class DynamicSlicer:
                     if use.startswith(hex(traced_instr.arg_address)) and len(use) > len(
                         hex(traced_instr.arg_address)
                     ):
-                        complete_cover = True
                         attribute_uses.add(use)
-                        attribute_creation_uses.add("_".join(use.split("_")[1:]))
                 for use in attribute_uses:
-                    context.attr_uses.remove(use)
+                    criteria = context.attr_uses.pop(use)
+                    complete_cover |= criteria
+                    _add_criteria(
+                        attribute_creation_uses, "_".join(use.split("_")[1:]), criteria
+                    )
 
             # Check for address dependencies
             if traced_instr.is_mutable_type and traced_instr.object_creation:
                 # Note that the definition of an object here means the
                 # creation of the object.
-                address_dependency = self._check_scope_for_def(
+                complete_cover |= self._check_scope_for_def(
                     context.var_uses_addresses,
                     hex(traced_instr.arg_address),
                     None,
                     None,
                 )
-                if address_dependency:
-                    complete_cover = True
 
             # Check for the attributes which were converted to variables
             # (explained in the previous construct)
             if traced_instr.argument in context.attribute_variables:
-                complete_cover = True
-                context.attribute_variables.remove(str(traced_instr.argument))
+                complete_cover |= context.attribute_variables.pop(
+                    str(traced_instr.argument)
+                )
 
         if isinstance(traced_instr, ExecutedAttributeInstruction):
             # check attribute defs
             if traced_instr.combined_attr in context.attr_uses:
-                complete_cover = True
-                context.attr_uses.remove(traced_instr.combined_attr)
+                complete_cover |= context.attr_uses.pop(traced_instr.combined_attr)
             # Partial cover: modification of attribute of
             # object in search for definition
-            if hex(traced_instr.src_address) in context.var_uses_addresses:
-                partial_cover = True
+            partial_cover = context.var_uses_addresses.get(
+                hex(traced_instr.src_address), 0
+            )
 
-        return (complete_cover or partial_cover), attribute_creation_uses
+        return complete_cover | partial_cover, attribute_creation_uses
 
-    def _check_variables(self, context, traced_instr):
-        complete_cover = False
+    def _check_variables(self, context, traced_instr) -> int:
+        complete_cover = 0
 
         # Check local variables
         if traced_instr.opcode in (op.STORE_FAST, op.DELETE_FAST):
@@ -658,8 +841,9 @@ class DynamicSlicer:
                 and hex(traced_instr.arg_address) in context.var_uses_addresses
                 and traced_instr.object_creation
             ):
-                complete_cover = True
-                context.var_uses_addresses.remove(hex(traced_instr.arg_address))
+                complete_cover = context.var_uses_addresses.pop(
+                    hex(traced_instr.arg_address)
+                )
 
         else:
             # There should be no other possible instructions
@@ -669,51 +853,55 @@ class DynamicSlicer:
 
     @staticmethod
     def _check_scope_for_def(
-        context_scope: set,
+        context_scope: dict,
         argument: str,
         scope_id: int | str | tuple | None,
         comp_op,
-    ) -> bool:
-        complete_cover = False
+    ) -> int:
+        complete_cover = 0
         remove_tuples = set()
 
         for tup in context_scope:
             if isinstance(tup, tuple):
                 if argument == tup[0] and comp_op(tup[1], scope_id):
-                    complete_cover = True
                     remove_tuples.add(tup)
             else:
                 if argument == tup:
-                    complete_cover = True
                     remove_tuples.add(tup)
         for tup in remove_tuples:
-            context_scope.remove(tup)
+            complete_cover |= context_scope.pop(tup)
 
         return complete_cover
 
     def add_uses(
-        self, context: SlicingContext, traced_instr: ExecutedInstruction
+        self, context: SlicingContext, traced_instr: ExecutedInstruction, criteria: int
     ) -> None:
         """Add all uses found in the executed instruction into the slicing context.
 
         Args:
             context: The slicing context that gets extended
             traced_instr: The instruction to analyse
+            criteria: the bit mask of the slicing criteria whose slices contain the
+                instruction
         """
         if isinstance(traced_instr, ExecutedMemoryInstruction):
-            self._add_variable_uses(context, traced_instr)
+            self._add_variable_uses(context, traced_instr, criteria)
 
         # Add attribute uses
         if isinstance(traced_instr, ExecutedAttributeInstruction):
-            self._add_attribute_uses(context, traced_instr)
+            self._add_attribute_uses(context, traced_instr, criteria)
 
-    def _add_variable_uses(self, context, traced_instr):
+    def _add_variable_uses(self, context, traced_instr, criteria):
         if traced_instr.arg_address and traced_instr.is_mutable_type:
-            context.var_uses_addresses.add(hex(traced_instr.arg_address))
+            _add_criteria(
+                context.var_uses_addresses, hex(traced_instr.arg_address), criteria
+            )
         # Add local variables
         if traced_instr.opcode == op.LOAD_FAST:
-            context.var_uses_local.add(
-                (traced_instr.argument, traced_instr.code_object_id)
+            _add_criteria(
+                context.var_uses_local,
+                (traced_instr.argument, traced_instr.code_object_id),
+                criteria,
             )
         # Add global variables (with *_NAME instructions)
         elif traced_instr.opcode == op.LOAD_NAME:
@@ -725,14 +913,24 @@ class DynamicSlicer:
                 ].code_object.co_name
                 == "<module>"
             ):
-                context.var_uses_global.add((traced_instr.argument, traced_instr.file))
+                _add_criteria(
+                    context.var_uses_global,
+                    (traced_instr.argument, traced_instr.file),
+                    criteria,
+                )
             else:
-                context.var_uses_local.add(
-                    (traced_instr.argument, traced_instr.code_object_id)
+                _add_criteria(
+                    context.var_uses_local,
+                    (traced_instr.argument, traced_instr.code_object_id),
+                    criteria,
                 )
         # Add global variables
         elif traced_instr.opcode == op.LOAD_GLOBAL:
-            context.var_uses_global.add((traced_instr.argument, traced_instr.file))
+            _add_criteria(
+                context.var_uses_global,
+                (traced_instr.argument, traced_instr.file),
+                criteria,
+            )
         # Add nonlocal variables
         elif traced_instr.opcode in [
             op.LOAD_CLOSURE,
@@ -749,26 +947,32 @@ class DynamicSlicer:
 
                 assert current_code_meta.parent_code_object_id is not None
                 current_code_object_id = current_code_meta.parent_code_object_id
-            context.var_uses_nonlocal.add(
-                (traced_instr.argument, tuple(variable_scope))
+            _add_criteria(
+                context.var_uses_nonlocal,
+                (traced_instr.argument, tuple(variable_scope)),
+                criteria,
             )
         else:
             # There should be no other possible instructions
             raise ValueError("Instruction opcode can not be analyzed for definitions.")
 
     @staticmethod
-    def _add_attribute_uses(context, traced_instr):
+    def _add_attribute_uses(context, traced_instr, criteria):
         # Memory address of loaded attribute
         if traced_instr.arg_address and traced_instr.is_mutable_type:
-            context.var_uses_addresses.add(hex(traced_instr.arg_address))
+            _add_criteria(
+                context.var_uses_addresses, hex(traced_instr.arg_address), criteria
+            )
         # Attribute name in combination with source
         if traced_instr.arg_address:
-            context.attr_uses.add(traced_instr.combined_attr)
+            _add_criteria(context.attr_uses, traced_instr.combined_attr, criteria)
         # Special case for access to composite types and imports:
         # We want the complete definition of composite types and
         # the imported module, respectively
         if not traced_instr.arg_address or traced_instr.opcode == op.IMPORT_FROM:
-            context.var_uses_addresses.add(hex(traced_instr.src_address))
+            _add_criteria(
+                context.var_uses_addresses, hex(traced_instr.src_address), criteria
+            )
 
     @staticmethod
     def get_line_id_by_instruction(
@@ -833,8 +1037,10 @@ class AssertionSlicer:
     def __init__(
         self,
         known_code_objects: dict[int, CodeObjectMetaData],
+        slicing_cache: SlicingCache | None = None,
     ):
         self._known_code_objects = known_code_objects
+        self._slicing_cache = SlicingCache() if slicing_cache is None else slicing_cache
 
     def _slicing_criterion_from_assertion(
         self, assertion: ExecutedAssertion, trace: ExecutionTrace
@@ -866,6 +1072,7 @@ class AssertionSlicer:
             traced_instr.offset,
             original_instr.arg,  # type: ignore[union-attr]
             traced_instr.lineno,
+            slicing_cache=self._slicing_cache,
         )
 
         return SlicingCriterion(unique_instr, assertion.trace_position - 1)
@@ -882,6 +1089,26 @@ class AssertionSlicer:
         Returns:
             The list of executed instructions contained in the slice of the assertion.
         """
-        slicing_criterion = self._slicing_criterion_from_assertion(assertion, trace)
-        slicer = DynamicSlicer(self._known_code_objects)
-        return slicer.slice(trace, slicing_criterion)
+        return self.slice_assertions([assertion], trace)[0]
+
+    def slice_assertions(
+        self, assertions: list[ExecutedAssertion], trace: ExecutionTrace
+    ) -> list[list[UniqueInstruction]]:
+        """Calculate the dynamic slices for the assertions inside a test case.
+
+        The assertions are sliced in a single traversal of the trace.
+
+        Args:
+            assertions: The assertions, for which to calculate the slices.
+            trace: the execution trace
+
+        Returns:
+            The lists of executed instructions contained in the slices of the
+            assertions, in the order of the assertions.
+        """
+        slicing_criteria = [
+            self._slicing_criterion_from_assertion(assertion, trace)
+            for assertion in assertions
+        ]
+        slicer = DynamicSlicer(self._known_code_objects, self._slicing_cache)
+        return slicer.slice_criteria(trace, slicing_criteria)
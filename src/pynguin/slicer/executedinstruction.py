@@ -7,7 +7,15 @@
 """Contains all code related to executed instruction classes."""
 from __future__ import annotations
 
+import sys
+
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
+from typing import overload
 
 from opcode import opname
 
@@ -141,3 +149,419 @@ class ExecutedReturnInstruction(ExecutedInstruction):
             f"{'(ret)':<7} {self.file:<40} {opname[self.opcode]:<72} "
             f"{self.code_object_id:02d} @ line: {self.lineno:d}-{self.offset:d}"
         )
+
+
+# The kinds of executed instructions that can be stored in the columns of an
+# ExecutedInstructionLog.  The position of a class is its kind.
+_KINDS: tuple[type[ExecutedInstruction], ...] = (
+    ExecutedInstruction,
+    ExecutedMemoryInstruction,
+    ExecutedAttributeInstruction,
+    ExecutedControlInstruction,
+    ExecutedCallInstruction,
+    ExecutedReturnInstruction,
+)
+_KIND_INDICES: dict[type[ExecutedInstruction], int] = {
+    kind: index for index, kind in enumerate(_KINDS)
+}
+_MEMORY_KIND = _KIND_INDICES[ExecutedMemoryInstruction]
+_ATTRIBUTE_KIND = _KIND_INDICES[ExecutedAttributeInstruction]
+_INT_ARGUMENT_KINDS = frozenset(
+    (_KIND_INDICES[ExecutedControlInstruction], _KIND_INDICES[ExecutedCallInstruction])
+)
+
+_MUTABLE_TYPE_FLAG = 1
+_OBJECT_CREATION_FLAG = 2
+
+
+class ExecutedInstructionLog(Sequence[ExecutedInstruction]):
+    """An append-only log of executed instructions that is stored in columns.
+
+    A trace records every executed instruction when slicing, thus storing an
+    object per instruction is costly.  Instead, the log stores each field in a typed
+    array; file names and argument names are interned in a string table.  An
+    ExecutedInstruction is only created when an element of the log is accessed.
+    Instructions whose values do not fit into the columns, e.g., because a line
+    number is missing, are kept as objects.
+    """
+
+    def __init__(self, instructions: Iterable[ExecutedInstruction] = ()) -> None:
+        self._kinds = array("B")
+        self._files = array("L")
+        self._code_object_ids = array("q")
+        self._node_ids = array("q")
+        self._opcodes = array("H")
+        self._arguments = array("q")
+        self._linenos = array("q")
+        self._offsets = array("q")
+        self._arg_addresses = array("q")
+        self._src_addresses = array("q")
+        self._flags = array("B")
+        self._strings: list[str] = []
+        self._string_indices: dict[str, int] = {}
+        self._irregular: dict[int, ExecutedInstruction] = {}
+        self.extend(instructions)
+
+    def _columns(self) -> tuple[array, ...]:
+        return (
+            self._kinds,
+            self._files,
+            self._code_object_ids,
+            self._node_ids,
+            self._opcodes,
+            self._arguments,
+            self._linenos,
+            self._offsets,
+            self._arg_addresses,
+            self._src_addresses,
+            self._flags,
+        )
+
+    def _intern(self, string: str) -> int:
+        index = self._string_indices.get(string)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(string)
+            self._string_indices[string] = index
+        return index
+
+    def _encode_argument(self, kind: int, argument: int | str | None) -> int:
+        if kind in (_MEMORY_KIND, _ATTRIBUTE_KIND):
+            if argument is None:
+                return -1
+            if isinstance(argument, str):
+                return self._intern(argument)
+        elif kind in _INT_ARGUMENT_KINDS:
+            if isinstance(argument, int):
+                return argument
+        elif argument is None:
+            return 0
+        raise TypeError(f"Cannot store argument {argument!r}")
+
+    def add(  # pylint: disable=too-many-arguments
+        self,
+        kind: type[ExecutedInstruction],
+        file: str,
+        code_object_id: int,
+        node_id: int,
+        opcode: int,
+        argument: int | str | None,
+        lineno: int,
+        offset: int,
+        arg_address: int = 0,
+        src_address: int = 0,
+        is_mutable_type: bool = False,
+        object_creation: bool = False,
+    ) -> None:
+        """Adds an executed instruction to the log without creating an object.
+
+        Args:
+            kind: the class of the executed instruction
+            file: File name of the module containing the instruction
+            code_object_id: code object containing the instruction
+            node_id: the node of the code object containing the instruction
+            opcode: the opcode of the instruction
+            argument: the argument of the instruction
+            lineno: the line number of the instruction
+            offset: the offset of the instruction
+            arg_address: the memory address of the argument
+            src_address: the memory address of the accessed attribute's owner
+            is_mutable_type: if the argument is mutable
+            object_creation: if the instruction creates the object used
+        """
+        kind_index = _KIND_INDICES[kind]
+        size = len(self._kinds)
+        try:
+            self._arguments.append(self._encode_argument(kind_index, argument))
+            self._code_object_ids.append(code_object_id)
+            self._node_ids.append(node_id)
+            self._opcodes.append(opcode)
+            self._linenos.append(lineno)
+            self._offsets.append(offset)
+            self._arg_addresses.append(arg_address)
+            self._src_addresses.append(src_address)
+            self._files.append(self._intern(file))
+        except (TypeError, OverflowError):
+            for column in self._columns():
+                del column[size:]
+            self._append_irregular(
+                self._create(
+                    kind_index,
+                    file,
+                    code_object_id,
+                    node_id,
+                    opcode,
+                    argument,
+                    lineno,
+                    offset,
+                    arg_address,
+                    src_address,
+                    is_mutable_type,
+                    object_creation,
+                )
+            )
+            return
+        self._flags.append(
+            (_MUTABLE_TYPE_FLAG if is_mutable_type else 0)
+            | (_OBJECT_CREATION_FLAG if object_creation else 0)
+        )
+        self._kinds.append(kind_index)
+
+    def _append_irregular(self, instruction: ExecutedInstruction) -> None:
+        self._irregular[len(self._kinds)] = instruction
+        for column in self._columns():
+            column.append(0)
+
+    def append(self, instruction: ExecutedInstruction) -> None:
+        """Adds an executed instruction to the log.
+
+        Args:
+            instruction: the executed instruction to add
+        """
+        kind = type(instruction)
+        if kind not in _KIND_INDICES:
+            self._append_irregular(instruction)
+            return
+        self.add(
+            kind,
+            instruction.file,
+            instruction.code_object_id,
+            instruction.node_id,
+            instruction.opcode,
+            instruction.argument,
+            instruction.lineno,
+            instruction.offset,
+            getattr(instruction, "arg_address", 0),
+            getattr(instruction, "src_address", 0),
+            getattr(instruction, "is_mutable_type", False),
+            getattr(instruction, "object_creation", False),
+        )
+
+    def extend(self, instructions: Iterable[ExecutedInstruction]) -> None:
+        """Adds the given executed instructions to the log.
+
+        Args:
+            instructions: the executed instructions to add
+        """
+        if not isinstance(instructions, ExecutedInstructionLog):
+            for instruction in instructions:
+                self.append(instruction)
+            return
+        if instructions is self:
+            instructions = ExecutedInstructionLog(self)
+        shift = len(self._kinds)
+        remap = array("q", (self._intern(string) for string in instructions._strings))
+        self._kinds.extend(instructions._kinds)
+        self._files.extend(array("L", (remap[index] for index in instructions._files)))
+        self._code_object_ids.extend(instructions._code_object_ids)
+        self._node_ids.extend(instructions._node_ids)
+        self._opcodes.extend(instructions._opcodes)
+        self._arguments.extend(
+            array(
+                "q",
+                (
+                    remap[argument]
+                    if kind in (_MEMORY_KIND, _ATTRIBUTE_KIND) and argument >= 0
+                    else argument
+                    for kind, argument in zip(
+                        instructions._kinds, instructions._arguments
+                    )
+                ),
+            )
+        )
+        self._linenos.extend(instructions._linenos)
+        self._offsets.extend(instructions._offsets)
+        self._arg_addresses.extend(instructions._arg_addresses)
+        self._src_addresses.extend(instructions._src_addresses)
+        self._flags.extend(instructions._flags)
+        for index, instruction in instructions._irregular.items():
+            self._irregular[index + shift] = instruction
+
+    @staticmethod
+    def _create(  # pylint: disable=too-many-arguments
+        kind: int,
+        file: str,
+        code_object_id: int,
+        node_id: int,
+        opcode: int,
+        argument: int | str | None,
+        lineno: int,
+        offset: int,
+        arg_address: int,
+        src_address: int,
+        is_mutable_type: bool,
+        object_creation: bool,
+    ) -> ExecutedInstruction:
+        if kind == _MEMORY_KIND:
+            return ExecutedMemoryInstruction(
+                file,
+                code_object_id,
+                node_id,
+                opcode,
+                argument,
+                lineno,
+                offset,
+                arg_address,
+                is_mutable_type,
+                object_creation,
+            )
+        if kind == _ATTRIBUTE_KIND:
+            return ExecutedAttributeInstruction(
+                file,
+                code_object_id,
+                node_id,
+                opcode,
+                argument,
+                lineno,
+                offset,
+                src_address,
+                arg_address,
+                is_mutable_type,
+            )
+        return _KINDS[kind](
+            file, code_object_id, node_id, opcode, argument, lineno, offset
+        )
+
+    def _check_index(self, index: int) -> int:
+        size = len(self._kinds)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("executed instruction index out of range")
+        return index
+
+    def _materialise(self, index: int) -> ExecutedInstruction:
+        if (instruction := self._irregular.get(index)) is not None:
+            return instruction
+        kind = self._kinds[index]
+        argument: int | str | None
+        if kind in (_MEMORY_KIND, _ATTRIBUTE_KIND):
+            string_index = self._arguments[index]
+            argument = None if string_index < 0 else self._strings[string_index]
+        elif kind in _INT_ARGUMENT_KINDS:
+            argument = self._arguments[index]
+        else:
+            argument = None
+        flags = self._flags[index]
+        return self._create(
+            kind,
+            self._strings[self._files[index]],
+            self._code_object_ids[index],
+            self._node_ids[index],
+            self._opcodes[index],
+            argument,
+            self._linenos[index],
+            self._offsets[index],
+            self._arg_addresses[index],
+            self._src_addresses[index],
+            bool(flags & _MUTABLE_TYPE_FLAG),
+            bool(flags & _OBJECT_CREATION_FLAG),
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> ExecutedInstruction:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ExecutedInstruction]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialise(i) for i in range(*index.indices(len(self)))]
+        return self._materialise(self._check_index(index))
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __iter__(self) -> Iterator[ExecutedInstruction]:
+        for index in range(len(self._kinds)):
+            yield self._materialise(index)
+
+    def __reversed__(self) -> Iterator[ExecutedInstruction]:
+        for index in range(len(self._kinds) - 1, -1, -1):
+            yield self._materialise(index)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __sizeof__(self) -> int:
+        # The strings are shared with the instrumented code, thus only the
+        # containers are accounted for.
+        return (
+            object.__sizeof__(self)
+            + sum(sys.getsizeof(column) for column in self._columns())
+            + sys.getsizeof(self._strings)
+            + sys.getsizeof(self._string_indices)
+            + sys.getsizeof(self._irregular)
+        )
+
+    def code_object_id(self, index: int) -> int:
+        """Provides the code object id of an instruction without creating it.
+
+        Args:
+            index: the position of the instruction in the log
+
+        Returns:
+            The id of the code object containing the instruction.
+        """
+        index = self._check_index(index)
+        if (instruction := self._irregular.get(index)) is not None:
+            return instruction.code_object_id
+        return self._code_object_ids[index]
+
+    def node_id(self, index: int) -> int:
+        """Provides the node id of an instruction without creating it.
+
+        Args:
+            index: the position of the instruction in the log
+
+        Returns:
+            The id of the node containing the instruction.
+        """
+        index = self._check_index(index)
+        if (instruction := self._irregular.get(index)) is not None:
+            return instruction.node_id
+        return self._node_ids[index]
+
+    def opcode(self, index: int) -> int:
+        """Provides the opcode of an instruction without creating it.
+
+        Args:
+            index: the position of the instruction in the log
+
+        Returns:
+            The opcode of the instruction.
+        """
+        index = self._check_index(index)
+        if (instruction := self._irregular.get(index)) is not None:
+            return instruction.opcode
+        return self._opcodes[index]
+
+    def rindex_opcode(self, opcode: int) -> int:
+        """Provides the position of the last instruction with the given opcode.
+
+        Args:
+            opcode: the opcode to search for
+
+        Returns:
+            The position of the last such instruction, or -1 if there is none.
+        """
+        opcodes = self._opcodes
+        irregular = self._irregular
+        for index in range(len(opcodes) - 1, -1, -1):
+            if (instruction := irregular.get(index)) is not None:
+                if instruction.opcode == opcode:
+                    return index
+            elif opcodes[index] == opcode:
+                return index
+        return -1
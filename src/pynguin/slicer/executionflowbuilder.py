@@ -26,6 +26,7 @@ UNSET = object()
 if TYPE_CHECKING:
     from pynguin.instrumentation.instrumentation import CodeObjectMetaData
     from pynguin.slicer.executedinstruction import ExecutedInstruction
+    from pynguin.slicer.slicingcache import SlicingCache
     from pynguin.testcase.execution import ExecutionTrace
 
 
@@ -46,7 +47,8 @@ class UniqueInstruction(Instr):
         offset: int,
         arg=UNSET,
         lineno: int | None = None,
-        in_slice: bool = False,
+        in_slice: int = 0,
+        slicing_cache: SlicingCache | None = None,
     ):
         self.file = file
         if arg is not UNSET:
@@ -58,29 +60,38 @@ class UniqueInstruction(Instr):
         self.offset = offset
 
         # Additional information from disassembly
-        dis_instr = self.locate_in_disassembly(
-            list(dis.get_instructions(code_meta.code_object))
-        )
+        if slicing_cache is None:
+            dis_instr = self.locate_in_disassembly(
+                list(dis.get_instructions(code_meta.code_object))
+            )
+        else:
+            dis_instr = slicing_cache.locate_in_disassembly(
+                code_meta.code_object, self.opcode, offset
+            )
         self.dis_arg = dis_instr.arg
         self.is_jump_target = dis_instr.is_jump_target
 
         self._in_slice = in_slice
 
     @property
-    def in_slice(self) -> bool:
-        """Returns a boolean if the instruction is inside the slice.
+    def in_slice(self) -> int:
+        """Provides the slicing criteria whose slices contain the instruction.
+
+        The criteria are numbered, bit i is set if the instruction is inside the
+        slice of criterion i.
 
         Returns:
-            True if the instructions is part of the slice, False otherwise.
+            The bit mask of the criteria, which is non-zero if the instruction is
+            part of a slice.
         """
         return self._in_slice
 
     @in_slice.setter
-    def in_slice(self, in_slice) -> None:
-        """Sets whether the instruction is inside the slice.
+    def in_slice(self, in_slice: int) -> None:
+        """Sets the slicing criteria whose slices contain the instruction.
 
         Args:
-            in_slice: whether the instruction is inside the slice
+            in_slice: the bit mask of the criteria
         """
         self._in_slice = in_slice
 
@@ -199,9 +210,11 @@ class ExecutionFlowBuilder:
         self,
         trace: ExecutionTrace,
         known_code_objects: dict[int, CodeObjectMetaData],
+        slicing_cache: SlicingCache | None = None,
     ):
         self.trace = trace
         self.known_code_objects = known_code_objects
+        self._slicing_cache = slicing_cache
 
     def _finish_basic_block(
         self,
@@ -273,6 +286,43 @@ class ExecutionFlowBuilder:
         Returns:
             The last instruction and the state when it is executed
         """
+        if self._slicing_cache is None:
+            return self._reconstruct_last_instruction(
+                file, instr, trace_pos, offset, co_id, bb_id, import_instr
+            )
+        # The instruction is identified by its location
+        key = (
+            file,
+            co_id,
+            bb_id,
+            offset,
+            trace_pos,
+            None
+            if import_instr is None
+            else (
+                import_instr.code_object_id,
+                import_instr.node_id,
+                import_instr.offset,
+            ),
+        )
+        return self._slicing_cache.get_last_instruction(
+            self.trace,
+            key,
+            lambda: self._reconstruct_last_instruction(
+                file, instr, trace_pos, offset, co_id, bb_id, import_instr
+            ),
+        )
+
+    def _reconstruct_last_instruction(  # pylint: disable=too-many-arguments
+        self,
+        file: str,
+        instr: Instr,
+        trace_pos: int,
+        offset: int,
+        co_id: int,
+        bb_id: int,
+        import_instr: UniqueInstruction | None,
+    ) -> LastInstrState:
         # Find the basic block and the exact location of the current instruction
         basic_block, bb_offset = self._get_basic_block(co_id, bb_id)
         instr_index = self.locate_in_basic_block(instr, offset, basic_block, bb_offset)
@@ -486,6 +536,7 @@ class ExecutionFlowBuilder:
             offset,
             instr.arg,
             instr.lineno,
+            slicing_cache=self._slicing_cache,
         )
 
     def _continue_at_last_traced(
@@ -0,0 +1,153 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a cache for the work that is repeated when slicing execution traces."""
+from __future__ import annotations
+
+import dis
+import threading
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pynguin.utils.opcodes as op
+
+from pynguin.utils.exceptions import InstructionNotFoundException
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+    from types import CodeType
+
+    from pynguin.slicer.executionflowbuilder import LastInstrState
+    from pynguin.testcase.execution import ExecutionTrace
+
+
+@dataclass
+class SlicingCacheStatistics:
+    """Counts how much of the slicing work was computed and how much was reused."""
+
+    # Code objects that were disassembled, and instructions that were located in an
+    # already indexed disassembly
+    indexed_code_objects: int = 0
+    reused_disassemblies: int = 0
+
+    # Steps of the backwards reconstruction of the execution flow
+    reconstructed_instructions: int = 0
+    reused_reconstructed_instructions: int = 0
+
+
+def _index_disassembly(
+    code_object: CodeType,
+) -> dict[tuple[int, int], dis.Instruction]:
+    # Maps the opcode and the instrumented offset to the first matching instruction
+    # of the disassembly, see UniqueInstruction.locate_in_disassembly.
+    index: dict[tuple[int, int], dis.Instruction] = {}
+    # EXTENDED_ARG instructions are not counted for instrumented offsets,
+    # which has to be compensated here
+    offset_offset = 0
+    for dis_instr in dis.get_instructions(code_object):
+        if dis_instr.opcode == op.EXTENDED_ARG:
+            offset_offset += 2
+        index.setdefault(
+            (dis_instr.opcode, dis_instr.offset - offset_offset), dis_instr
+        )
+    return index
+
+
+class SlicingCache:
+    """Caches the work that is repeated when slicing execution traces.
+
+    Every instruction that is considered by the slicer has to be located in the
+    disassembly of its code object.  The cache indexes the disassembly of each code
+    object once.  Furthermore, the reconstruction of the execution flow only depends
+    on the trace and the position in it, thus it is memoised by the trace position for
+    the last trace that was sliced in a thread.  Slicing an execution repeatedly, for
+    example, for several criteria that are not reached by one traversal of the trace,
+    thus only reconstructs the execution flow once.
+    """
+
+    class _TraceLocalState(threading.local):  # pylint:disable=too-few-public-methods
+        """Stores the memoised execution flow of the trace sliced in a thread."""
+
+        def __init__(self):
+            super().__init__()
+            self.trace: ExecutionTrace | None = None
+            self.last_instructions: dict[Hashable, LastInstrState] = {}
+
+    def __init__(self) -> None:
+        # Maps the ids of code objects to the code object and its index.  The code
+        # object is kept alive, such that its id is not reused.
+        self._disassemblies: dict[
+            int, tuple[CodeType, dict[tuple[int, int], dis.Instruction]]
+        ] = {}
+        self._trace_local_state = SlicingCache._TraceLocalState()
+        self._statistics = SlicingCacheStatistics()
+
+    @property
+    def statistics(self) -> SlicingCacheStatistics:
+        """Provides the counters of the computed and the reused work.
+
+        Returns:
+            The statistics of the cache
+        """
+        return self._statistics
+
+    def locate_in_disassembly(
+        self, code_object: CodeType, opcode: int, offset: int
+    ) -> dis.Instruction:
+        """Retrieves an instruction from the disassembly of its code object.
+
+        Args:
+            code_object: The code object containing the instruction
+            opcode: The opcode of the instruction
+            offset: The instrumented offset of the instruction
+
+        Returns:
+            The instruction from the disassembly
+
+        Raises:
+            InstructionNotFoundException: If the instruction is not located in the
+                code object.
+        """
+        if (entry := self._disassemblies.get(id(code_object))) is None:
+            entry = code_object, _index_disassembly(code_object)
+            self._disassemblies[id(code_object)] = entry
+            self._statistics.indexed_code_objects += 1
+        else:
+            self._statistics.reused_disassemblies += 1
+        if (dis_instr := entry[1].get((opcode, offset))) is None:
+            raise InstructionNotFoundException
+        return dis_instr
+
+    def get_last_instruction(
+        self,
+        trace: ExecutionTrace,
+        key: Hashable,
+        reconstruct: Callable[[], LastInstrState],
+    ) -> LastInstrState:
+        """Provides the last instruction that was executed before an instruction.
+
+        Args:
+            trace: The trace that is sliced
+            key: The location of the instruction and its position in the trace
+            reconstruct: Reconstructs the last instruction if it is not memoised
+
+        Returns:
+            The last instruction and the state when it is executed
+        """
+        state = self._trace_local_state
+        if state.trace is not trace:
+            state.trace = trace
+            state.last_instructions = {}
+        if (last_state := state.last_instructions.get(key)) is None:
+            last_state = reconstruct()
+            state.last_instructions[key] = last_state
+            self._statistics.reconstructed_instructions += 1
+        else:
+            self._statistics.reused_reconstructed_instructions += 1
+        return last_state
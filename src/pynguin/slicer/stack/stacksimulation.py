@@ -48,7 +48,8 @@ class FrameStack:
 
     code_object_id: int
     block_stacks: list[BlockStack]
-    attribute_uses: set[str] = field(default_factory=set)
+    # The attribute uses and the bit masks of the slicing criteria they belong to
+    attribute_uses: dict[str, int] = field(default_factory=dict)
     import_name_instr: UniqueInstruction | None = None
 
 
@@ -95,31 +96,31 @@ class TraceStack:
 
     def update_push_operations(
         self, num_pushes: int, returned: bool
-    ) -> tuple[bool, bool]:
+    ) -> tuple[int, int]:
         """
-        Simulate the push operations on the stack and return whether
-        implicit dependencies occur or uses are included.
+        Simulate the push operations on the stack and return for which slicing
+        criteria implicit dependencies occur or uses are excluded.
 
         Args:
             num_pushes: number of pushes to pop from stack
             returned: Whether the trace already returned from the method call
 
         Returns:
-            A tuple containing the booleans:
-                1. implicit dependency
-                2. include use
+            A tuple containing the bit masks of the slicing criteria:
+                1. with an implicit dependency
+                2. for which the uses are not included
         """
         curr_frame_stack = self.frame_stacks[-1]
         curr_block_stack = curr_frame_stack.block_stacks[-1]
 
-        imp_dependency: bool = False
-        include_use: bool = True
+        imp_dependency = 0
+        exclude_use = 0
 
         if returned:
             prev_frame_stack = self.frame_stacks[-2]
             prev_block_stack_instr = prev_frame_stack.block_stacks[-1].peek()
             if prev_block_stack_instr and prev_block_stack_instr.in_slice:
-                imp_dependency = True
+                imp_dependency |= prev_block_stack_instr.in_slice
 
         # Handle push operations
         for _ in range(0, num_pushes):
@@ -133,7 +134,7 @@ class TraceStack:
                 tos_instr = None
 
             if tos_instr and tos_instr.in_slice:
-                imp_dependency = True
+                imp_dependency |= tos_instr.in_slice
 
                 # For attribute accesses, instructions preparing TOS to access the
                 # attribute should be included. However, the use data for these will
@@ -143,14 +144,14 @@ class TraceStack:
                     if len(curr_block_stack) > 0:
                         tos1_instr = curr_block_stack.peek()
                         if tos1_instr and tos1_instr.opcode == tos_instr.opcode:
-                            include_use = False
+                            exclude_use |= tos_instr.in_slice
                 if tos_instr.opcode in (op.LOAD_ATTR, op.DELETE_ATTR, op.IMPORT_FROM):
-                    include_use = False
+                    exclude_use |= tos_instr.in_slice
 
-        return imp_dependency, include_use
+        return imp_dependency, exclude_use
 
     def update_pop_operations(
-        self, num_pops: int, unique_instr: UniqueInstruction, in_slice: bool
+        self, num_pops: int, unique_instr: UniqueInstruction, in_slice: int
     ) -> None:
         """
         Pushes a given number of instructions onto the stack and updates the
@@ -159,13 +160,13 @@ class TraceStack:
         Args:
             num_pops: number of pop operations
             unique_instr: the instruction for which the stack is updated
-            in_slice: whether the instruction is part of the slice
+            in_slice: the bit mask of the slicing criteria whose slices contain the
+                instruction
         """
         curr_frame_stack = self.frame_stacks[-1]
         curr_block_stack = curr_frame_stack.block_stacks[-1]
 
-        if in_slice:
-            unique_instr.in_slice = True
+        unique_instr.in_slice |= in_slice
 
         # Handle pop operations
         for _ in range(0, num_pops):
@@ -177,11 +178,9 @@ class TraceStack:
         """
         return self.frame_stacks[-1].attribute_uses
 
-    def set_attribute_uses(self, attribute_uses: set[str]) -> None:
+    def set_attribute_uses(self, attribute_uses: dict[str, int]) -> None:
         """Set attribute uses of frame stack on top of stack."""
-        self.frame_stacks[-1].attribute_uses = set()
-        for attr in attribute_uses:
-            self.frame_stacks[-1].attribute_uses.add(attr)
+        self.frame_stacks[-1].attribute_uses = dict(attribute_uses)
 
     def get_import_frame(self) -> UniqueInstruction | None:
         """Get the import frame instruction, None if frame stacks are empty."""
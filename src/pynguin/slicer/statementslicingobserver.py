@@ -17,6 +17,7 @@ import pynguin.utils.opcodes as op
 from pynguin.ga.computations import compute_statement_checked_lines
 from pynguin.slicer.dynamicslicer import SlicingCriterion
 from pynguin.slicer.executionflowbuilder import UniqueInstruction
+from pynguin.slicer.slicingcache import SlicingCache
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,9 +41,20 @@ class StatementSlicingObserver(ex.ExecutionObserver):
     def __init__(self, tracer: ex.ExecutionTracer) -> None:
         self._tracer = tracer
         self._slicing_local_state = StatementSlicingObserver.SlicingLocalState()
+        # Reused for slicing all executions
+        self._slicing_cache = SlicingCache()
+
+    @property
+    def slicing_cache(self) -> SlicingCache:
+        """Provides the cache that is used for slicing the executions.
+
+        Returns:
+            The slicing cache
+        """
+        return self._slicing_cache
 
     def before_test_case_execution(self, test_case: tc.TestCase):
-        pass
+        self._slicing_local_state.slicing_criteria = {}
 
     def before_statement_execution(
         self, statement: st.Statement, node: ast.stmt, exec_ctx: ex.ExecutionContext
@@ -74,6 +86,7 @@ class StatementSlicingObserver(ex.ExecutionObserver):
                 last_traced_instr.offset,
                 arg=last_traced_instr.argument,
                 lineno=last_traced_instr.lineno,
+                slicing_cache=self._slicing_cache,
             )
             slicing_criterion = SlicingCriterion(
                 slicing_instruction,
@@ -91,6 +104,7 @@ class StatementSlicingObserver(ex.ExecutionObserver):
             result.execution_trace,
             self._tracer.get_subject_properties(),
             self._slicing_local_state.slicing_criteria,
+            self._slicing_cache,
         )
         result.execution_trace.checked_lines.update(checked_lines)
 
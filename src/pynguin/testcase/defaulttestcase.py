@@ -37,25 +37,33 @@ class DefaultTestCase(tc.TestCase):
     def add_statement(
         self, statement: stmt.Statement, position: int = -1
     ) -> vr.VariableReference | None:
-        if position == -1:
-            self._statements.append(statement)
-        else:
-            self._statements.insert(position, statement)
+        self._insert_statement(statement, position)
         return statement.ret_val
 
     def add_variable_creating_statement(
         self, statement: stmt.VariableCreatingStatement, position: int = -1
     ) -> vr.VariableReference:
-        if position == -1:
+        self._insert_statement(statement, position)
+        return statement.ret_val
+
+    def _insert_statement(self, statement: stmt.Statement, position: int) -> None:
+        self._cached_hash = None
+        if position == -1 or position >= len(self._statements):
+            position = len(self._statements)
             self._statements.append(statement)
         else:
             self._statements.insert(position, statement)
-        return statement.ret_val
+            self._shift_type_index(position, 1)
+        self._index_statement(statement, position)
 
     def add_statements(self, statements: list[stmt.Statement]) -> None:
-        self._statements.extend(statements)
+        self._cached_hash = None
+        for statement in statements:
+            self._index_statement(statement, len(self._statements))
+            self._statements.append(statement)
 
     def append_test_case(self, test_case: tc.TestCase) -> None:
+        self._cached_hash = None
         memo: dict[vr.VariableReference, vr.VariableReference] = {}
         for statement in test_case.statements:
             clone = statement.clone(self, memo)
@@ -63,20 +71,26 @@ class DefaultTestCase(tc.TestCase):
                 # If the original statement created a variable, then so does the clone
                 # Thus we know that clone.ret_val is not None
                 memo[statement.ret_val] = clone.ret_val  # type: ignore[assignment]
+            self._index_statement(clone, len(self._statements))
             self._statements.append(clone)
 
     def remove(self, position: int) -> None:
         self._logger.debug("Removing statement at position %d", position)
         if position >= self.size():
             return
+        self._cached_hash = None
+        self._unindex_statement(self._statements[position], position)
         del self._statements[position]
+        self._shift_type_index(position, -1)
 
     def remove_statement(self, statement: stmt.Statement) -> None:
-        self._statements.remove(statement)
+        self.remove(self._statements.index(statement))
 
     def chop(self, pos: int) -> None:
         assert pos >= 0
+        self._cached_hash = None
         while len(self._statements) > pos + 1:
+            self._unindex_statement(self._statements[-1], len(self._statements) - 1)
             del self._statements[-1]
 
     def contains(self, statement: stmt.Statement) -> bool:
@@ -90,7 +104,10 @@ class DefaultTestCase(tc.TestCase):
         self, statement: stmt.Statement, position: int
     ) -> vr.VariableReference | None:
         assert 0 <= position < len(self._statements)
+        self._cached_hash = None
+        self._unindex_statement(self._statements[position], position)
         self._statements[position] = statement
+        self._index_statement(statement, position)
         return statement.ret_val
 
     def has_statement(self, position: int) -> bool:
@@ -107,6 +124,9 @@ class DefaultTestCase(tc.TestCase):
                 memo[statement.ret_val] = copy.ret_val  # type: ignore[assignment]
             test_case._statements.append(copy)
             copy.assertions = statement.copy_assertions(memo)
+        if limit is None:
+            # The clone is structurally equal to this test case.
+            test_case._cached_hash = self._cached_hash
         return test_case
 
     def get_dependencies(
@@ -169,9 +189,16 @@ class DefaultTestCase(tc.TestCase):
         return True
 
     def __hash__(self) -> int:
-        memo: dict[vr.VariableReference, int] = {
-            statement.ret_val: idx
-            for idx, statement in enumerate(self._statements)
-            if statement.ret_val is not None
-        }
-        return hash(tuple(s.structural_hash(memo) for s in self._statements))
+        # The hash is cached until the test case or one of its statements is
+        # modified, because test cases are hashed frequently, e.g., when their
+        # chromosomes are stored in an OrderedSet.
+        if self._cached_hash is None:
+            memo: dict[vr.VariableReference, int] = {
+                statement.ret_val: idx
+                for idx, statement in enumerate(self._statements)
+                if statement.ret_val is not None
+            }
+            self._cached_hash = hash(
+                tuple(s.structural_hash(memo) for s in self._statements)
+            )
+        return self._cached_hash
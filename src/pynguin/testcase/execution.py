@@ -13,12 +13,21 @@ import contextlib
 import copy
 import dataclasses
 import inspect
+import io
+import itertools
+import json
 import logging
+import multiprocessing
 import os
+import pickle
 import sys
 import threading
+import weakref
 
 from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Sized
 from dataclasses import dataclass
 from dataclasses import field
@@ -28,9 +37,11 @@ from queue import Empty
 from queue import Queue
 from types import BuiltinFunctionType
 from types import BuiltinMethodType
+from types import CodeType
 from types import ModuleType
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import Generic
 from typing import TypeVar
 from typing import cast
 
@@ -59,14 +70,18 @@ from pynguin.analyses.typesystem import ANY
 from pynguin.analyses.typesystem import Instance
 from pynguin.analyses.typesystem import ProperType
 from pynguin.analyses.typesystem import TupleType
+from pynguin.instrumentation.instrumentation import CODE_OBJECT_ID_KEY
 from pynguin.instrumentation.instrumentation import ArtificialInstr
 from pynguin.instrumentation.instrumentation import CheckedCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import CodeObjectMetaData
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.instrumentation.instrumentation import PredicateMetaData
 from pynguin.instrumentation.instrumentation import PynguinCompare
+from pynguin.utils import randomness
+from pynguin.utils.bitset import BitSet
 from pynguin.utils.mirror import Mirror
 from pynguin.utils.orderedset import OrderedSet
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 from pynguin.utils.type_utils import given_exception_matches
 from pynguin.utils.type_utils import is_bytes
 from pynguin.utils.type_utils import is_numeric
@@ -76,6 +91,9 @@ from pynguin.utils.type_utils import is_string
 immutable_types = (int, float, complex, str, tuple, frozenset, bytes)
 
 if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
     import pynguin.testcase.testcase as tc
 
     from pynguin.analyses import module
@@ -83,6 +101,9 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_K = TypeVar("_K")  # pylint:disable=invalid-name
+_V = TypeVar("_V")  # pylint:disable=invalid-name
+
 
 class ExecutionContext:
     """Contains information required in the context of an execution.
@@ -249,9 +270,10 @@ class ExecutionObserver:
     """An Observer that can be used to observe the execution of a test case.
 
     Important Note: If an observer is stateful, then this state must be encapsulated
-    in a threading.local, i.e., be bound to a thread. Note that thread local data
-    is initialized per thread, so there is no need to clear any pre-existing data
-    (because there is none), as every thread gets its own instance.
+    in a threading.local, i.e., be bound to a thread. Note that a thread may execute
+    several test cases one after another, so the thread local data has to be reset in
+    ExecutionObserver::before_test_case_execution, which is called from within the
+    executing thread.
 
     Methods that are called from within the thread are not allowed to interact with the
     'outside'. The only thing that should leave an observer are results when they are
@@ -268,9 +290,24 @@ class ExecutionObserver:
     For more details, look at some implementations, e.g., AssertionTraceObserver.
     """
 
+    @property
+    def observes_statements(self) -> bool:
+        """Whether this observer has to be notified about every executed statement.
+
+        If none of its observers observes statements, the executor may restore the
+        state after a prefix of a test case from a snapshot instead of executing the
+        statements of the prefix, see
+        ExecutionConfiguration.prefix_snapshot_cache_size.
+
+        Returns:
+            Whether this observer observes statements
+        """
+        return True
+
     @abstractmethod
     def before_test_case_execution(self, test_case: tc.TestCase):
-        """Called before test case execution.
+        """Called before test case execution from inside the thread that executes
+        the test case.
 
         Args:
             test_case: The test cases that will be executed.
@@ -319,6 +356,12 @@ class ExecutionObserver:
             node: the ast node representing the statement.
             exec_ctx: the current execution context.
 
+        Note: If test cases are compiled as a whole, see
+        ExecutionConfiguration.compile_whole_test_cases, this method is called for all
+        statements of a test case before the first one is executed.  Thus, the
+        returned node must only depend on the statement and not on the state of the
+        execution.
+
         Returns:
             An ast node. You may choose to modify this node to change what is executed.
         """
@@ -390,9 +433,13 @@ class AssertionExecutionObserver(ExecutionObserver):
                 assertion_node = exec_ctx.wrap_node_in_module(
                     exec_ctx.node_for_assertion(assertion, ast.stmt())  # Dummy node
                 )
-                executor.execute_ast(assertion_node, exec_ctx)
+                # The code might come from the code cache of the executor, thus we
+                # take the id of the code object from the instrumented code.
+                code = executor.compile_ast(assertion_node)
+                executor.execute_code(code, exec_ctx)
 
-                code_object_id, node_id = self._get_assertion_node_and_code_object_ids()
+                code_object_id = json.loads(code.co_consts[0])[CODE_OBJECT_ID_KEY]
+                node_id = self._get_assertion_node_id(code_object_id)
                 self._tracer.register_assertion_position(
                     code_object_id, node_id, assertion
                 )
@@ -401,11 +448,10 @@ class AssertionExecutionObserver(ExecutionObserver):
                 # Restore old state
                 self._tracer.disable()
 
-    def _get_assertion_node_and_code_object_ids(self) -> tuple[int, int]:
+    def _get_assertion_node_id(self, code_object_id: int) -> int:
         existing_code_objects = (
             self._tracer.get_subject_properties().existing_code_objects
         )
-        code_object_id = len(existing_code_objects) - 1
         code_object = existing_code_objects[code_object_id]
         assert_node = None
         for node in code_object.cfg.nodes:
@@ -418,7 +464,7 @@ class AssertionExecutionObserver(ExecutionObserver):
             ):
                 assert_node = node
         assert assert_node
-        return code_object_id, assert_node.index
+        return assert_node.index
 
 
 class ReturnTypeObserver(ExecutionObserver):
@@ -442,7 +488,8 @@ class ReturnTypeObserver(ExecutionObserver):
         self._test_cluster = test_cluster
 
     def before_test_case_execution(self, test_case: tc.TestCase):
-        pass
+        self._return_type_local_state.return_type_trace = {}
+        self._return_type_local_state.return_type_generic_args = {}
 
     def after_test_case_execution_inside_thread(
         self, test_case: tc.TestCase, result: ExecutionResult
@@ -529,18 +576,24 @@ class ReturnTypeObserver(ExecutionObserver):
 
 @dataclass
 class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
-    """Stores trace information about the execution."""
+    """Stores trace information about the execution.
+
+    The ids of code objects and lines are dense, thus they are stored in bit sets,
+    which are merged at once.
+    """
 
     _logger = logging.getLogger(__name__)
 
-    executed_code_objects: OrderedSet[int] = field(default_factory=OrderedSet)
+    executed_code_objects: BitSet = field(default_factory=BitSet)
     executed_predicates: dict[int, int] = field(default_factory=dict)
     true_distances: dict[int, float] = field(default_factory=dict)
     false_distances: dict[int, float] = field(default_factory=dict)
-    covered_line_ids: OrderedSet[int] = field(default_factory=OrderedSet)
-    executed_instructions: list[ei.ExecutedInstruction] = field(default_factory=list)
+    covered_line_ids: BitSet = field(default_factory=BitSet)
+    executed_instructions: ei.ExecutedInstructionLog = field(
+        default_factory=ei.ExecutedInstructionLog
+    )
     executed_assertions: list[ExecutedAssertion] = field(default_factory=list)
-    checked_lines: OrderedSet[int] = field(default_factory=OrderedSet)
+    checked_lines: BitSet = field(default_factory=BitSet)
 
     def merge(self, other: ExecutionTrace) -> None:
         """Merge the values from the other execution trace.
@@ -549,8 +602,9 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             other: Merges the other traces into this trace
         """
         self.executed_code_objects.update(other.executed_code_objects)
+        executed_predicates = self.executed_predicates
         for key, value in other.executed_predicates.items():
-            self.executed_predicates[key] = self.executed_predicates.get(key, 0) + value
+            executed_predicates[key] = executed_predicates.get(key, 0) + value
         self._merge_min(self.true_distances, other.true_distances)
         self._merge_min(self.false_distances, other.false_distances)
         self.covered_line_ids.update(other.covered_line_ids)
@@ -576,7 +630,9 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             source: the source of the merge
         """
         for key, value in source.items():
-            target[key] = min(target.get(key, inf), value)
+            current = target.get(key)
+            if current is None or value < current:
+                target[key] = value
 
     def update_predicate_distances(
         self, distance_true: float, distance_false: float, predicate: int
@@ -607,7 +663,7 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
         lineno: int,
         offset: int,
     ) -> None:
-        """Creates a new ExecutedInstruction object and adds it to the trace.
+        """Adds an ExecutedInstruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -617,10 +673,16 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             lineno: the line number of the instruction
             offset: the offset of the instruction
         """
-        executed_instr = ei.ExecutedInstruction(
-            module, code_object_id, node_id, opcode, None, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            None,
+            lineno,
+            offset,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_memory_instruction(  # pylint: disable=too-many-arguments
         self,
@@ -635,7 +697,7 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
         is_mutable_type: bool,
         object_creation: bool,
     ) -> None:
-        """Creates a new ExecutedMemoryInstruction object and adds it to the trace.
+        """Adds an ExecutedMemoryInstruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -649,7 +711,8 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             is_mutable_type: if the argument is mutable
             object_creation: if the instruction creates the object used
         """
-        executed_instr = ei.ExecutedMemoryInstruction(
+        self.executed_instructions.add(
+            ei.ExecutedMemoryInstruction,
             module,
             code_object_id,
             node_id,
@@ -657,11 +720,10 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             arg_name,
             lineno,
             offset,
-            arg_address,
-            is_mutable_type,
-            object_creation,
+            arg_address=arg_address,
+            is_mutable_type=is_mutable_type,
+            object_creation=object_creation,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_attribute_instruction(  # pylint: disable=too-many-arguments
         self,
@@ -676,8 +738,7 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
         arg_address: int,
         is_mutable_type: bool,
     ) -> None:
-        """Creates a new ExecutedAttributeInstruction object and
-        adds it to the trace.
+        """Adds an ExecutedAttributeInstruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -691,7 +752,8 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             arg_address: the memory address of the argument
             is_mutable_type: if the attribute is mutable
         """
-        executed_instr = ei.ExecutedAttributeInstruction(
+        self.executed_instructions.add(
+            ei.ExecutedAttributeInstruction,
             module,
             code_object_id,
             node_id,
@@ -699,11 +761,10 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             attr_name,
             lineno,
             offset,
-            src_address,
-            arg_address,
-            is_mutable_type,
+            arg_address=arg_address,
+            src_address=src_address,
+            is_mutable_type=is_mutable_type,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_jump_instruction(  # pylint: disable=too-many-arguments
         self,
@@ -715,7 +776,7 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
         offset: int,
         target_id: int,
     ) -> None:
-        """Creates a new ExecutedControlInstruction object and adds it to the trace.
+        """Adds an ExecutedControlInstruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -726,10 +787,16 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             offset: the offset of the instruction
             target_id: the target offset to jump to
         """
-        executed_instr = ei.ExecutedControlInstruction(
-            module, code_object_id, node_id, opcode, target_id, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedControlInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            target_id,
+            lineno,
+            offset,
         )
-        self.executed_instructions.append(executed_instr)
 
     def add_call_instruction(  # pylint: disable=too-many-arguments
         self,
@@ -741,7 +808,7 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
         offset: int,
         arg: int,
     ) -> None:
-        """Creates a new ExecutedCallInstruction object and adds it to the trace.
+        """Adds an ExecutedCallInstruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -752,12 +819,17 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             offset: the offset of the instruction
             arg: the argument to the instruction
         """
-        executed_instr = ei.ExecutedCallInstruction(
-            module, code_object_id, node_id, opcode, arg, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedCallInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            arg,
+            lineno,
+            offset,
         )
 
-        self.executed_instructions.append(executed_instr)
-
     def add_return_instruction(  # pylint: disable=too-many-arguments
         self,
         module: str,
@@ -767,7 +839,7 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
         lineno: int,
         offset: int,
     ) -> None:
-        """Creates a new ExecutedReturnInstruction object and adds it to the trace.
+        """Adds an ExecutedReturnInstruction to the trace.
 
         Args:
             module: File name of the module containing the instruction
@@ -777,12 +849,17 @@ class ExecutionTrace:  # pylint: disable=too-many-instance-attributes
             lineno: the line number of the instruction
             offset: the offset of the instruction
         """
-        executed_instr = ei.ExecutedReturnInstruction(
-            module, code_object_id, node_id, opcode, None, lineno, offset
+        self.executed_instructions.add(
+            ei.ExecutedReturnInstruction,
+            module,
+            code_object_id,
+            node_id,
+            opcode,
+            None,
+            lineno,
+            offset,
         )
 
-        self.executed_instructions.append(executed_instr)
-
 
 # pylint:disable=too-many-instance-attributes
 @dataclasses.dataclass
@@ -790,6 +867,12 @@ class ExecutionResult:
     """Result of an execution."""
 
     timeout: bool = False
+    # Whether the result is reused from a previous execution of the test case,
+    # i.e., the test case was not executed again.
+    reused: bool = dataclasses.field(default=False, init=False)
+    # The number of statements whose execution started.  Statements whose state is
+    # restored from a snapshot are not executed.
+    executed_statements: int = dataclasses.field(default=0, init=False)
     exceptions: dict[int, BaseException] = dataclasses.field(
         default_factory=dict, init=False
     )
@@ -954,6 +1037,10 @@ class SubjectProperties:
     # stores which line id represents which line in which file
     existing_lines: dict[int, LineMetaData] = field(default_factory=dict)
 
+    # stores the id of each line in existing_lines, i.e., the reverse mapping, which
+    # is maintained by ExecutionTracer.register_line
+    line_ids: dict[LineMetaData, int] = field(default_factory=dict)
+
     # stores known memory attribute object addresses
     object_addresses: OrderedSet[int] = field(default_factory=OrderedSet)
 
@@ -1074,6 +1161,15 @@ class ExecutionTracer:
         """
         return self._thread_local_state.trace
 
+    def set_trace(self, trace: ExecutionTrace) -> None:
+        """Continue tracing with the given trace, e.g., a trace that was recorded
+        before.
+
+        Args:
+            trace: The execution trace
+        """
+        self._thread_local_state.trace = trace
+
     def register_code_object(self, meta: CodeObjectMetaData) -> int:
         """Declare that a code object exists.
 
@@ -1332,14 +1428,11 @@ class ExecutionTracer:
             the id of the registered line
         """
         line_meta = LineMetaData(code_object_id, file_name, line_number)
-        if line_meta not in self.subject_properties.existing_lines.values():
+        line_id = self.subject_properties.line_ids.get(line_meta)
+        if line_id is None:
             line_id = len(self.subject_properties.existing_lines)
             self.subject_properties.existing_lines[line_id] = line_meta
-        else:
-            index = list(self.subject_properties.existing_lines.values()).index(
-                line_meta
-            )
-            line_id = list(self.subject_properties.existing_lines.keys())[index]
+            self.subject_properties.line_ids[line_meta] = line_id
         return line_id
 
     def _update_metrics(
@@ -1688,9 +1781,10 @@ class ExecutionTracer:
         if statement.has_only_exception_assertion():
             trace = self._thread_local_state.trace
             error_call_position = len(trace.executed_instructions) - 1
-            error_causing_instr = trace.executed_instructions[error_call_position]
-            code_object_id = error_causing_instr.code_object_id
-            node_id = error_causing_instr.node_id
+            code_object_id = trace.executed_instructions.code_object_id(
+                error_call_position
+            )
+            node_id = trace.executed_instructions.node_id(error_call_position)
             trace.executed_assertions.append(
                 ExecutedAssertion(
                     code_object_id,
@@ -1721,12 +1815,9 @@ class ExecutionTracer:
         if self.is_disabled():
             return
 
-        exec_instr = self.get_trace().executed_instructions
-        pop_jump_if_true_position = len(exec_instr) - 1
-        for instr in reversed(exec_instr):
-            if instr.opcode == op.POP_JUMP_IF_TRUE:
-                break
-            pop_jump_if_true_position -= 1
+        pop_jump_if_true_position = (
+            self.get_trace().executed_instructions.rindex_opcode(op.POP_JUMP_IF_TRUE)
+        )
         assert (
             pop_jump_if_true_position != -1
         ), "Node in code object did not contain a POP_JUMP_IF_TRUE instruction"
@@ -1781,20 +1872,20 @@ class ExecutionTracer:
     def __repr__(self) -> str:
         return "ExecutionTracer"
 
-    def lineids_to_linenos(self, line_ids: OrderedSet[int]) -> OrderedSet[int]:
+    def lineids_to_linenos(self, line_ids: Iterable[int]) -> OrderedSet[int]:
         """Convenience method to translate line ids to line numbers.
 
         Args:
             line_ids: The ids that should be translated.
 
         Returns:
-            The line numbers.
+            The line numbers, in ascending order.
         """
         return OrderedSet(
-            [
+            sorted(
                 self.subject_properties.existing_lines[line_id].line_number
                 for line_id in line_ids
-            ]
+            )
         )
 
 
@@ -2052,6 +2143,269 @@ class AbstractTestCaseExecutor(abc.ABC):
             Result of the execution
         """
 
+    def execute_many(self, test_cases: list[tc.TestCase]) -> list[ExecutionResult]:
+        """Executes the given test cases.
+
+        The default implementation executes one test case after another.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Returns:
+            The results of the executions, in the order of the given test cases
+        """
+        return [self.execute(test_case) for test_case in test_cases]
+
+    def shutdown(self) -> None:
+        """Release the resources, e.g., worker processes, held by this executor.
+
+        The executor might still be used afterwards, it then has to acquire its
+        resources again.
+        """
+
+
+class _LRUCache(Generic[_K, _V]):
+    """A bounded cache, e.g., for the code objects that are compiled and instrumented
+    from the nodes of executed statements and assertions.
+
+    The least recently used values are evicted, if the cache holds too many values
+    or, if a maximum total size is given, too many bytes.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        max_bytes: int | None = None,
+        size_of: Callable[[_V], int] = sys.getsizeof,
+    ) -> None:
+        """Create new cache.
+
+        Args:
+            max_size: The maximum number of cached values
+            max_bytes: The maximum total size of the cached values in bytes, if any
+            size_of: Provides the (approximate) size of a value in bytes
+        """
+        assert max_size > 0
+        assert max_bytes is None or max_bytes > 0
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._size_of = size_of
+        self._values: OrderedDict[_K, _V] = OrderedDict()
+        self._sizes: dict[_K, int] = {}
+        # A timed out thread might still access the cache.
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.size_in_bytes = 0
+
+    def get(self, key: _K) -> _V | None:
+        """Provides the value cached for the given key, if any.
+
+        Args:
+            key: The key of the value
+
+        Returns:
+            The cached value or None
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._values.move_to_end(key)
+            return value
+
+    def put(self, key: _K, value: _V) -> None:
+        """Cache the given value.
+
+        Args:
+            key: The key of the value
+            value: The value, which is not cached if it is larger than the maximum
+                total size
+        """
+        size = self._size_of(value) if self._max_bytes is not None else 0
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        with self._lock:
+            if self._max_bytes is not None:
+                self.size_in_bytes += size - self._sizes.get(key, 0)
+                self._sizes[key] = size
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self._max_size or (
+                self._max_bytes is not None and self.size_in_bytes > self._max_bytes
+            ):
+                evicted, _ = self._values.popitem(last=False)
+                if self._max_bytes is not None:
+                    self.size_in_bytes -= self._sizes.pop(evicted)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._values.clear()
+            self._sizes.clear()
+            self.size_in_bytes = 0
+
+
+# The number of executed prefixes of test cases that an executor remembers for each
+# snapshot it caches.  Only the hashes of the prefixes are kept.
+_EXECUTED_PREFIXES_PER_SNAPSHOT = 100
+
+
+@dataclass
+class _PrefixSnapshot:
+    """The state after executing a prefix of a test case."""
+
+    local_namespace: dict[str, Any]
+    trace: ExecutionTrace
+    # The dumps of the nodes of the prefix, which tell apart prefixes whose hashes
+    # collide.
+    nodes: tuple[str, ...]
+
+
+@dataclass
+class _CachedResult:
+    """The result of executing a test case, which is cached by an executor.
+
+    A result is only reused after a second execution of the test case had the same
+    outcome.  If the outcomes differ, the test case is considered nondeterministic
+    and the result is dropped, such that the test case is always executed.
+    """
+
+    result: ExecutionResult | None
+    confirmed: bool = False
+
+
+def _copy_result(result: ExecutionResult) -> ExecutionResult:
+    """Copy an execution result, such that modifying the copy, e.g., by
+    ExecutionResult.delete_statement_data, does not modify the result.
+
+    The traces are shared, because they are not modified after the execution.
+
+    Args:
+        result: The execution result
+
+    Returns:
+        A copy of the result
+    """
+    copied = copy.copy(result)
+    copied.exceptions = dict(result.exceptions)
+    copied.raw_return_types = dict(result.raw_return_types)
+    copied.raw_return_type_generic_args = dict(result.raw_return_type_generic_args)
+    copied.proper_return_type_trace = dict(result.proper_return_type_trace)
+    copied.proxy_knowledge = dict(result.proxy_knowledge)
+    return copied
+
+
+def _cached_result_size(cached: _CachedResult) -> int:
+    """Approximate the memory used by a cached result in bytes.
+
+    Args:
+        cached: The cached result
+
+    Returns:
+        The approximate size of the result and its execution trace
+    """
+    size = sys.getsizeof(cached)
+    if (result := cached.result) is not None:
+        trace = result.execution_trace
+        size += sum(
+            sys.getsizeof(value)
+            for value in (
+                result,
+                result.exceptions,
+                result.raw_return_types,
+                result.raw_return_type_generic_args,
+                result.proper_return_type_trace,
+                result.proxy_knowledge,
+                trace,
+                trace.executed_code_objects,
+                trace.executed_predicates,
+                trace.true_distances,
+                trace.false_distances,
+                trace.covered_line_ids,
+                trace.executed_instructions,
+                trace.executed_assertions,
+                trace.checked_lines,
+            )
+        )
+    return size
+
+
+def _same_outcome(first: ExecutionResult, second: ExecutionResult) -> bool:
+    """Checks whether two executions of the same test case had the same outcome.
+
+    The executed instructions are only compared by their number, because they
+    contain the addresses of the objects that were created by an execution.
+
+    Args:
+        first: The result of the first execution
+        second: The result of the second execution
+
+    Returns:
+        Whether the results have the same exceptions and coverage
+    """
+    first_trace = first.execution_trace
+    second_trace = second.execution_trace
+    return (
+        {idx: type(ex) for idx, ex in first.exceptions.items()}
+        == {idx: type(ex) for idx, ex in second.exceptions.items()}
+        and first_trace.executed_code_objects == second_trace.executed_code_objects
+        and first_trace.executed_predicates == second_trace.executed_predicates
+        and first_trace.true_distances == second_trace.true_distances
+        and first_trace.false_distances == second_trace.false_distances
+        and first_trace.covered_line_ids == second_trace.covered_line_ids
+        and len(first_trace.executed_instructions)
+        == len(second_trace.executed_instructions)
+    )
+
+
+# The name of the callback that is called after each statement of a test case that
+# is compiled as a whole.
+_STATEMENT_CALLBACK = "__pynguin_after_statement__"
+_STATEMENT_CALLBACK_NODE = ast.fix_missing_locations(
+    ast.Expr(
+        value=ast.Call(
+            func=ast.Name(id=_STATEMENT_CALLBACK, ctx=ast.Load()),
+            args=[],
+            keywords=[],
+        )
+    )
+)
+
+
+@dataclass
+class _ExecutionThread:
+    """A long-lived thread that executes the requested test cases one after another
+    and provides their results."""
+
+    thread: threading.Thread
+    requests: Queue[tc.TestCase | None]
+    results: Queue[ExecutionResult]
+    cancelled: threading.Event
+    # Stops the thread when the executor is garbage collected.  It must be detached
+    # when the executor stops using the thread, otherwise it keeps the thread's
+    # queue alive until then.
+    finalizer: weakref.finalize
+
+
+def _execute_requested_test_cases(
+    executor_ref: weakref.ref[TestCaseExecutor],
+    requests: Queue[tc.TestCase | None],
+    results: Queue[ExecutionResult],
+    cancelled: threading.Event,
+) -> None:
+    # Only hold a weak reference to the executor while waiting for requests, such
+    # that the thread does not keep an unused executor alive.
+    while (test_case := requests.get()) is not None and not cancelled.is_set():
+        if (executor := executor_ref()) is None:
+            return
+        executor._execute_test_case(  # pylint:disable=protected-access
+            test_case, results
+        )
+        del executor
+
 
 class TestCaseExecutor(AbstractTestCaseExecutor):
     """An executor that executes the generated test cases."""
@@ -2087,6 +2441,10 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         )
         self._tracer = tracer
         self._observers: list[ExecutionObserver] = []
+        self._execution_thread: _ExecutionThread | None = None
+        # The test case whose execution is in progress in the executing thread
+        # and its result so far, such that a timeout can report its progress.
+        self._execution_in_progress: tuple[tc.TestCase, ExecutionResult] | None = None
         self._instrument = (
             config.CoverageMetric.CHECKED
             in config.configuration.statistics_output.coverage_metrics
@@ -2095,6 +2453,46 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         self._checked_transformer = InstrumentationTransformer(
             self._tracer, [checked_instrumentation]
         )
+        cache_size = config.configuration.execution.code_cache_size
+        self._code_cache: _LRUCache[str, CodeType] | None = (
+            _LRUCache(cache_size) if cache_size > 0 else None
+        )
+        # Instrumented code objects are registered in the subject properties, which
+        # are replaced when the SUT is reloaded.
+        self._code_cache_subject_properties = self._tracer.get_subject_properties()
+        self._compile_whole_test_cases = (
+            config.configuration.execution.compile_whole_test_cases
+        )
+        snapshot_cache_size = config.configuration.execution.prefix_snapshot_cache_size
+        # The snapshots and the executed prefixes are keyed by the hashes of the
+        # prefixes.
+        self._prefix_snapshots: _LRUCache[int, _PrefixSnapshot] | None = (
+            _LRUCache(snapshot_cache_size) if snapshot_cache_size > 0 else None
+        )
+        self._executed_prefixes: _LRUCache[int, bool] | None = (
+            _LRUCache(snapshot_cache_size * _EXECUTED_PREFIXES_PER_SNAPSHOT)
+            if snapshot_cache_size > 0
+            else None
+        )
+        # The snapshots contain the objects and traces of the loaded SUT.
+        self._prefix_snapshots_subject_properties = (
+            self._tracer.get_subject_properties()
+        )
+        self._reused_statement_executions = 0
+        result_cache_size = config.configuration.execution.result_cache_size
+        self._result_cache: _LRUCache[tc.TestCase, _CachedResult] | None = (
+            _LRUCache(
+                result_cache_size,
+                config.configuration.execution.result_cache_max_bytes,
+                _cached_result_size,
+            )
+            if result_cache_size > 0
+            else None
+        )
+        # The cached results refer to the ids of the instrumented code objects.
+        self._result_cache_subject_properties = self._tracer.get_subject_properties()
+        self._result_cache_hits = 0
+        self._result_cache_misses = 0
 
         def log_thread_exception(arg):
             _LOGGER.error(
@@ -2150,43 +2548,258 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         Args:
             instrument: Whether to instrument the test and its assertions.
         """
+        if instrument != self._instrument:
+            if self._result_cache is not None:
+                self._result_cache.clear()
+            self._clear_prefix_snapshots()
         self._instrument = instrument
 
+    def track_statistics_values(
+        self, tracking_fun: Callable[[RuntimeVariable, Any], None]
+    ) -> None:
+        """Track statistics values of this executor.
+
+        Args:
+            tracking_fun: The tracking function as a callback.
+        """
+        if self._code_cache is not None:
+            tracking_fun(RuntimeVariable.CodeCacheHits, self._code_cache.hits)
+            tracking_fun(RuntimeVariable.CodeCacheMisses, self._code_cache.misses)
+        if self._prefix_snapshots is not None:
+            tracking_fun(
+                RuntimeVariable.ReusedStatementExecutions,
+                self._reused_statement_executions,
+            )
+        if self._result_cache is not None:
+            lookups = self._result_cache_hits + self._result_cache_misses
+            tracking_fun(
+                RuntimeVariable.ResultCacheHitRate,
+                self._result_cache_hits / lookups if lookups > 0 else 0.0,
+            )
+
     def execute(
         self,
         test_case: tc.TestCase,
     ) -> ExecutionResult:
-        with contextlib.redirect_stdout(self._null_file):
-            with contextlib.redirect_stderr(self._null_file):
-                return_queue: Queue[ExecutionResult] = Queue()
-                thread = threading.Thread(
-                    target=self._execute_test_case,
-                    args=(test_case, return_queue),
-                    daemon=True,
-                )
-                thread.start()
-                thread.join(
-                    timeout=min(
-                        self._maximum_test_execution_timeout,
-                        self._test_execution_time_per_statement
-                        * len(test_case.statements),
-                    )
+        return self.execute_many([test_case])[0]
+
+    def execute_many(self, test_cases: list[tc.TestCase]) -> list[ExecutionResult]:
+        """Executes the given test cases.
+
+        The setup of the execution, i.e., redirecting the output and starting an
+        executing thread, is shared between the test cases.  Each test case keeps
+        its own timeout, though.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Returns:
+            The results of the executions, in the order of the given test cases
+        """
+        if self._result_cache is None or any(
+            observer.observes_statements for observer in self._observers
+        ):
+            results = self._execute_in_thread(test_cases)
+        else:
+            results = self._execute_with_result_cache(test_cases)
+        for test_case, result in zip(test_cases, results, strict=True):
+            self._after_test_case_execution_outside_thread(test_case, result)
+        return results
+
+    def _execute_with_result_cache(
+        self, test_cases: list[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        """Reuse the cached results of the given test cases, or execute them.
+
+        A test case is identified by its structural hash and equality, whose hash is
+        cached by the test case.  Because test cases are mutated during the search,
+        the cache keeps a clone of a test case as its key.  The cache is only used
+        if none of the observers observes statements, because a reused result does
+        not notify the observers inside the executing thread.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Returns:
+            The results of the executions, in the order of the given test cases
+        """
+        assert self._result_cache is not None
+        if (
+            self._result_cache_subject_properties
+            is not self._tracer.get_subject_properties()
+        ):
+            self._result_cache.clear()
+            self._result_cache_subject_properties = (
+                self._tracer.get_subject_properties()
+            )
+        results: list[ExecutionResult | None] = []
+        to_execute: list[int] = []
+        for idx, test_case in enumerate(test_cases):
+            cached = self._result_cache.get(test_case)
+            if cached is not None and cached.confirmed:
+                assert cached.result is not None
+                self._result_cache_hits += 1
+                reused = _copy_result(cached.result)
+                reused.reused = True
+                results.append(reused)
+            else:
+                self._result_cache_misses += 1
+                results.append(None)
+                to_execute.append(idx)
+
+        executed = self._execute_in_thread([test_cases[idx] for idx in to_execute])
+        for idx, result in zip(to_execute, executed, strict=True):
+            results[idx] = result
+            if result.timeout:
+                continue
+            cached = self._result_cache.get(test_cases[idx])
+            if cached is None:
+                self._result_cache.put(
+                    test_cases[idx].clone(), _CachedResult(_copy_result(result))
                 )
-                if thread.is_alive():
-                    # Set thread ident to invalid value, such that the tracer
-                    # kills the thread
-                    self._tracer.current_thread_identifier = -1
-                    result = ExecutionResult(timeout=True)
-                    _LOGGER.warning("Experienced timeout from test-case execution")
+            elif cached.result is not None:
+                if _same_outcome(cached.result, result):
+                    cached.confirmed = True
                 else:
-                    try:
-                        result = return_queue.get(block=False)
-                    except Empty as ex:
-                        _LOGGER.error("Finished thread did not return a result.")
-                        raise RuntimeError("Bug in Pynguin!") from ex
-        self._after_test_case_execution_outside_thread(test_case, result)
+                    _LOGGER.debug("Do not cache result of nondeterministic test case")
+                    self._result_cache.put(test_cases[idx].clone(), _CachedResult(None))
+        return cast(list[ExecutionResult], results)
+
+    def shutdown(self) -> None:
+        if self._execution_thread is not None:
+            self._execution_thread.finalizer.detach()
+            self._execution_thread.requests.put(None)
+            self._execution_thread = None
+
+    def _execute_in_thread(
+        self, test_cases: list[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        """Execute the given test cases, one after another, in the executing thread.
+
+        Observers are only notified about the events that happen inside the
+        executing thread, i.e., the caller is responsible for calling
+        _after_test_case_execution_outside_thread.  If a test case times out, the
+        executing thread is abandoned and a new one executes the remaining test
+        cases.
+
+        Args:
+            test_cases: The test cases to execute
+
+        Raises:
+            RuntimeError: If the executing thread died without providing a result.
+
+        Returns:
+            The execution results
+        """
+        results: list[ExecutionResult] = []
+        with contextlib.redirect_stdout(self._null_file):
+            with contextlib.redirect_stderr(self._null_file):
+                while len(results) < len(test_cases):
+                    remaining = test_cases[len(results) :]
+                    execution_thread = self._get_execution_thread()
+                    for test_case in remaining:
+                        execution_thread.requests.put(test_case)
+                    for test_case in remaining:
+                        try:
+                            results.append(
+                                execution_thread.results.get(
+                                    timeout=self._get_execution_timeout(test_case)
+                                )
+                            )
+                        except Empty as ex:
+                            if (
+                                not execution_thread.thread.is_alive()
+                                and execution_thread.results.empty()
+                            ):
+                                execution_thread.finalizer.detach()
+                                self._execution_thread = None
+                                _LOGGER.error(
+                                    "Finished thread did not return a result."
+                                )
+                                raise RuntimeError("Bug in Pynguin!") from ex
+                            self._abandon_execution_thread()
+                            results.append(self._timed_out_result(test_case))
+                            _LOGGER.warning(
+                                "Experienced timeout from test-case execution"
+                            )
+                            break
+        return results
+
+    def _timed_out_result(self, test_case: tc.TestCase) -> ExecutionResult:
+        """Provide the result of the given test case, whose execution timed out.
+
+        Args:
+            test_case: The test case that timed out
+
+        Returns:
+            The result, which only counts the statements that started executing
+        """
+        result = ExecutionResult(timeout=True)
+        if self._execution_in_progress is not None:
+            executing, in_progress = self._execution_in_progress
+            if executing is test_case:
+                result.executed_statements = in_progress.executed_statements
         return result
 
+    def _get_execution_thread(self) -> _ExecutionThread:
+        # The thread does not exist within a forked process, thus we check whether
+        # it is alive.
+        if (
+            self._execution_thread is None
+            or not self._execution_thread.thread.is_alive()
+        ):
+            if self._execution_thread is not None:
+                self._execution_thread.finalizer.detach()
+            requests: Queue[tc.TestCase | None] = Queue()
+            results: Queue[ExecutionResult] = Queue()
+            cancelled = threading.Event()
+            thread = threading.Thread(
+                target=_execute_requested_test_cases,
+                args=(weakref.ref(self), requests, results, cancelled),
+                daemon=True,
+            )
+            thread.start()
+            self._execution_thread = _ExecutionThread(
+                thread,
+                requests,
+                results,
+                cancelled,
+                weakref.finalize(self, requests.put, None),
+            )
+        return self._execution_thread
+
+    def _abandon_execution_thread(self) -> None:
+        """Abandon the executing thread, e.g., because its current execution timed
+        out.
+
+        Threads cannot be killed, thus we set the thread ident of the tracer to an
+        invalid value, such that the thread kills itself as soon as it executes
+        instrumented code or the next statement.  Code that is not instrumented,
+        e.g., from a C extension, keeps running, though; ParallelTestCaseExecutor
+        replaces its worker processes in such a case.
+        """
+        assert self._execution_thread is not None
+        self._execution_thread.finalizer.detach()
+        self._execution_thread.cancelled.set()
+        self._execution_thread.requests.put(None)
+        self._tracer.current_thread_identifier = -1
+        self._execution_thread = None
+
+    def _get_execution_timeout(self, test_case: tc.TestCase) -> int:
+        """Provides the time (in seconds) after which the execution of the given test
+        case times out.
+
+        Args:
+            test_case: The test case
+
+        Returns:
+            The timeout for the test case
+        """
+        return min(
+            self._maximum_test_execution_timeout,
+            self._test_execution_time_per_statement * len(test_case.statements),
+        )
+
     def _before_test_case_execution(self, test_case: tc.TestCase) -> None:
         self._tracer.init_trace()
         for observer in self._observers:
@@ -2195,17 +2808,236 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
     def _execute_test_case(self, test_case: tc.TestCase, result_queue: Queue) -> None:
         self._before_test_case_execution(test_case)
         result = ExecutionResult()
+        self._execution_in_progress = (test_case, result)
         exec_ctx = ExecutionContext(self._module_provider)
         self._tracer.current_thread_identifier = threading.current_thread().ident
-        for idx, statement in enumerate(test_case.statements):
+        if self._prefix_snapshots is not None and not any(
+            observer.observes_statements for observer in self._observers
+        ):
+            self._execute_test_case_from_snapshot(test_case, exec_ctx, result)
+        # Checked coverage relies on the instructions of each statement being traced
+        # on their own, i.e., without the instructions of the callbacks.
+        elif self._compile_whole_test_cases and not self._instrument:
+            self._execute_whole_test_case(test_case, exec_ctx, result)
+        else:
+            for idx, statement in enumerate(test_case.statements):
+                ast_node = self._before_statement_execution(statement, exec_ctx)
+                result.executed_statements += 1
+                exception = self.execute_ast(ast_node, exec_ctx)
+                self._after_statement_execution(statement, exec_ctx, exception)
+                if exception is not None:
+                    result.report_new_thrown_exception(idx, exception)
+                    break
+        self._after_test_case_execution_inside_thread(test_case, result)
+        self._execution_in_progress = None
+        result_queue.put(result)
+
+    def _execute_test_case_from_snapshot(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+    ) -> None:
+        """Continue the execution of the longest prefix of the test case whose
+        resulting state was stored in a snapshot before.
+
+        The statements are executed as the code of their nodes, thus the state after
+        a prefix of statements is identified by the dumps of their nodes, which are
+        hashed incrementally.  Copying the state is expensive, thus a snapshot is
+        only stored where it is likely to be reused: after the whole test case, of
+        which mutated test cases keep a prefix, and after the longest prefix that was
+        executed before, i.e., where the test case diverges from an earlier one.  The
+        snapshots are discarded when the SUT is reloaded, e.g., with a different
+        instrumentation.
+
+        Args:
+            test_case: The test case to execute
+            exec_ctx: The execution context
+            result: The execution result
+        """
+        assert self._prefix_snapshots is not None
+        assert self._executed_prefixes is not None
+        if (
+            self._prefix_snapshots_subject_properties
+            is not self._tracer.get_subject_properties()
+        ):
+            self._clear_prefix_snapshots()
+            self._prefix_snapshots_subject_properties = (
+                self._tracer.get_subject_properties()
+            )
+        statements = test_case.statements
+        nodes = tuple(
+            ast.dump(exec_ctx.node_for_statement(statement)) for statement in statements
+        )
+        # The hash of the prefix of each length, starting at 1
+        prefix_hashes = list(
+            itertools.accumulate(
+                nodes, lambda prefix_hash, node: hash((prefix_hash, node)), initial=0
+            )
+        )[1:]
+        start = self._restore_longest_prefix(nodes, prefix_hashes, exec_ctx)
+        snapshot_lengths = {
+            len(statements),
+            self._longest_executed_prefix(prefix_hashes, start),
+        }
+        for prefix_hash in prefix_hashes:
+            self._executed_prefixes.put(prefix_hash, True)
+
+        for idx in range(start, len(statements)):
+            statement = statements[idx]
             ast_node = self._before_statement_execution(statement, exec_ctx)
+            result.executed_statements += 1
             exception = self.execute_ast(ast_node, exec_ctx)
             self._after_statement_execution(statement, exec_ctx, exception)
             if exception is not None:
                 result.report_new_thrown_exception(idx, exception)
                 break
-        self._after_test_case_execution_inside_thread(test_case, result)
-        result_queue.put(result)
+            if idx + 1 in snapshot_lengths:
+                snapshot = self._copy_state(
+                    exec_ctx.local_namespace, self._tracer.get_trace(), nodes[: idx + 1]
+                )
+                if snapshot is not None:
+                    self._prefix_snapshots.put(prefix_hashes[idx], snapshot)
+
+    def _restore_longest_prefix(
+        self,
+        nodes: tuple[str, ...],
+        prefix_hashes: list[int],
+        exec_ctx: ExecutionContext,
+    ) -> int:
+        """Restore the state after the longest prefix for which a snapshot exists.
+
+        Args:
+            nodes: The dumps of the nodes of the statements
+            prefix_hashes: The hash of the prefix of each length, starting at 1
+            exec_ctx: The execution context
+
+        Returns:
+            The length of the restored prefix, 0 if none was restored
+        """
+        assert self._prefix_snapshots is not None
+        for length in range(len(nodes), 0, -1):
+            snapshot = self._prefix_snapshots.get(prefix_hashes[length - 1])
+            if snapshot is not None and snapshot.nodes == nodes[:length]:
+                restored = self._copy_state(
+                    snapshot.local_namespace, snapshot.trace, snapshot.nodes
+                )
+                if restored is None:
+                    return 0
+                exec_ctx.local_namespace.update(restored.local_namespace)
+                self._tracer.set_trace(restored.trace)
+                self._reused_statement_executions += length
+                return length
+        return 0
+
+    def _longest_executed_prefix(self, prefix_hashes: list[int], start: int) -> int:
+        """Provide the length of the longest prefix that was executed before, but
+        is longer than the given one.
+
+        Args:
+            prefix_hashes: The hash of the prefix of each length, starting at 1
+            start: The length of the restored prefix
+
+        Returns:
+            The length of the prefix, 0 if there is none
+        """
+        assert self._executed_prefixes is not None
+        for length in range(len(prefix_hashes), start, -1):
+            if self._executed_prefixes.get(prefix_hashes[length - 1]) is not None:
+                return length
+        return 0
+
+    def _clear_prefix_snapshots(self) -> None:
+        if self._prefix_snapshots is not None:
+            self._prefix_snapshots.clear()
+        if self._executed_prefixes is not None:
+            self._executed_prefixes.clear()
+
+    def _copy_state(
+        self,
+        local_namespace: dict[str, Any],
+        trace: ExecutionTrace,
+        nodes: tuple[str, ...],
+    ) -> _PrefixSnapshot | None:
+        """Copy the given state of an execution.
+
+        Args:
+            local_namespace: The local namespace, i.e., the objects of the variables
+            trace: The execution trace
+            nodes: The dumps of the nodes of the executed statements
+
+        Returns:
+            A snapshot of the state, or None if the objects cannot be copied.
+        """
+        copied_trace = ExecutionTrace()
+        copied_trace.merge(trace)
+        # Copying objects might execute code of the SUT, e.g., __deepcopy__, which
+        # is not caused by the test case and should therefore not be in the trace.
+        self._tracer.disable()
+        try:
+            return _PrefixSnapshot(copy.deepcopy(local_namespace), copied_trace, nodes)
+        except Exception:  # pylint:disable=broad-except
+            return None
+        finally:
+            self._tracer.enable()
+
+    def _execute_whole_test_case(
+        self,
+        test_case: tc.TestCase,
+        exec_ctx: ExecutionContext,
+        result: ExecutionResult,
+    ) -> None:
+        """Compile the test case into a single module and execute it at once.
+
+        A call of a callback is inserted after each statement, which notifies the
+        observers about the executed statement.  Thus, the position of the statement
+        that raised an exception is the number of statements executed before.
+
+        Args:
+            test_case: The test case to execute
+            exec_ctx: The execution context
+            result: The execution result
+        """
+        statements = test_case.statements
+        body: list[ast.stmt] = []
+        for statement in statements:
+            # The nodes are already located by wrapping them in a module.
+            body.extend(self._before_statement_execution(statement, exec_ctx).body)
+            body.append(_STATEMENT_CALLBACK_NODE)
+        ast_node = ast.Module(body=body, type_ignores=[])
+
+        executed_statements = 0
+        in_callback = False
+
+        def after_statement_execution() -> None:
+            nonlocal executed_statements, in_callback
+            in_callback = True
+            self._after_statement_execution(
+                statements[executed_statements], exec_ctx, None
+            )
+            in_callback = False
+            executed_statements += 1
+            # The next statement starts right after the callback.
+            result.executed_statements = min(executed_statements + 1, len(statements))
+
+        exec_ctx.global_namespace[
+            _STATEMENT_CALLBACK
+        ] = after_statement_execution  # type: ignore[assignment]
+        result.executed_statements = min(1, len(statements))
+        try:
+            exception = self.execute_ast(ast_node, exec_ctx)
+        finally:
+            del exec_ctx.global_namespace[_STATEMENT_CALLBACK]
+        if exception is None:
+            return
+        if in_callback:
+            # The observers failed, which aborts the execution, as it does when the
+            # statements are executed on their own.
+            raise exception
+        self._after_statement_execution(
+            statements[executed_statements], exec_ctx, exception
+        )
+        result.report_new_thrown_exception(executed_statements, exception)
 
     def _after_test_case_execution_inside_thread(
         self, test_case: tc.TestCase, result: ExecutionResult
@@ -2276,20 +3108,69 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Executing %s", ast.unparse(ast_node))
 
-        code = compile(ast_node, "<ast>", "exec")
-        if self._instrument:
-            code = self._checked_transformer.instrument_module(code)
+        exception = self.execute_code(self.compile_ast(ast_node), exec_ctx)
+        if exception is not None and _LOGGER.isEnabledFor(logging.DEBUG):
+            failed_stmt = ast.unparse(ast_node)
+            _LOGGER.debug(
+                "Failed to execute statement:\n%s%s", failed_stmt, exception.args
+            )
+        return exception
 
+    @staticmethod
+    def execute_code(
+        code: CodeType, exec_ctx: ExecutionContext
+    ) -> BaseException | None:
+        """Execute the given code object in the given context.
+
+        Args:
+            code: The code object to execute, see compile_ast.
+            exec_ctx: The execution context
+
+        Returns:
+            The raised exception, if any.
+        """
         try:
             # pylint: disable=exec-used
             exec(code, exec_ctx.global_namespace, exec_ctx.local_namespace)  # nosec
         except BaseException as err:  # pylint: disable=broad-except
-            failed_stmt = ast.unparse(ast_node)
-            _LOGGER.debug("Failed to execute statement:\n%s%s", failed_stmt, err.args)
             return err
-
         return None
 
+    def compile_ast(self, ast_node: ast.Module) -> CodeType:
+        """Provides the compiled, and possibly instrumented, code for the given node.
+
+        Instrumenting the code is expensive, thus the instrumented code is cached.
+        The node is built from the statement, the names of the variables and modules
+        it uses and the modifications by the observers, thus its dump is used as key
+        for the code cache.  Compiling a node is cheaper than dumping it, though,
+        thus code that is not instrumented is not cached.
+
+        Args:
+            ast_node: The node to compile
+
+        Returns:
+            The code object
+        """
+        if self._code_cache is None or not self._instrument:
+            return self._compile(ast_node)
+        if (
+            self._code_cache_subject_properties
+            is not self._tracer.get_subject_properties()
+        ):
+            self._code_cache.clear()
+            self._code_cache_subject_properties = self._tracer.get_subject_properties()
+        key = ast.dump(ast_node, include_attributes=True)
+        if (code := self._code_cache.get(key)) is None:
+            code = self._compile(ast_node)
+            self._code_cache.put(key, code)
+        return code
+
+    def _compile(self, ast_node: ast.Module) -> CodeType:
+        code = compile(ast_node, "<ast>", "exec")
+        if self._instrument:
+            code = self._checked_transformer.instrument_module(code)
+        return code
+
     def _after_statement_execution(
         self,
         statement: stmt.Statement,
@@ -2311,10 +3192,318 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
             self._tracer.enable()
 
 
+# Additional time (in seconds) that we grant a worker process to respond, on top of
+# the timeouts of the test cases that it executes, before we consider it broken.
+_WORKER_GRACE_PERIOD = 5
+
+
+class _SharedObjectPickler(pickle.Pickler):
+    """A pickler that sends objects, which are shared with the worker processes, by
+    reference.
+
+    The worker processes are forked from the Pynguin process, thus every object that
+    existed at that time is located at the same address within each worker.  We use
+    the id of such an object as its persistent id, which avoids transferring, e.g.,
+    the test cluster with every test case.
+    """
+
+    def __init__(self, file, shared_objects: dict[int, Any]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._shared_objects = shared_objects
+
+    def persistent_id(self, obj: Any) -> int | None:  # noqa: D102
+        obj_id = id(obj)
+        if obj_id in self._shared_objects and self._shared_objects[obj_id] is obj:
+            return obj_id
+        return None
+
+
+class _SharedObjectUnpickler(pickle.Unpickler):
+    """The counterpart of _SharedObjectPickler."""
+
+    def __init__(self, file, shared_objects: dict[int, Any]) -> None:
+        super().__init__(file)
+        self._shared_objects = shared_objects
+
+    def persistent_load(self, pid: Any) -> Any:  # noqa: D102
+        try:
+            return self._shared_objects[pid]
+        except KeyError as error:
+            raise pickle.UnpicklingError(f"Unknown shared object {pid}") from error
+
+
+def _dumps(obj: Any, shared_objects: dict[int, Any]) -> bytes:
+    buffer = io.BytesIO()
+    _SharedObjectPickler(buffer, shared_objects).dump(obj)
+    return buffer.getvalue()
+
+
+def _loads(data: bytes, shared_objects: dict[int, Any]) -> Any:
+    return _SharedObjectUnpickler(io.BytesIO(data), shared_objects).load()
+
+
+def _is_transferable(obj: Any, shared_objects: dict[int, Any]) -> bool:
+    try:
+        _loads(_dumps(obj, shared_objects), shared_objects)
+        return True
+    except Exception:  # pylint:disable=broad-except
+        return False
+
+
+def _collect_shared_objects(test_cluster: module.TestCluster) -> dict[int, Any]:
+    """Collect the objects that do not change during the generation and that are
+    referenced by many test cases.
+
+    Args:
+        test_cluster: The test cluster from which the test cases are built
+
+    Returns:
+        A dict from the ids of the shared objects to the objects
+    """
+    shared: list[Any] = [test_cluster, test_cluster.type_system]
+    shared.extend(test_cluster.accessible_objects_under_test)
+    for generators in test_cluster.generators.values():
+        shared.extend(generators)
+    for modifiers in test_cluster.modifiers.values():
+        shared.extend(modifiers)
+    return {id(obj): obj for obj in shared}
+
+
+def _serialize_result(result: ExecutionResult, shared_objects: dict[int, Any]) -> bytes:
+    """Serialize the given result such that it can be loaded by the Pynguin process.
+
+    Exceptions raised by the SUT or observed types are not necessarily picklable,
+    e.g., if they are defined locally.  We replace such exceptions by a RuntimeError
+    that names the original exception and drop such types.
+
+    Args:
+        result: The result of an execution within a worker process
+        shared_objects: The objects that are shared with the Pynguin process
+
+    Returns:
+        The serialized result
+    """
+    with contextlib.suppress(Exception):
+        data = _dumps(result, shared_objects)
+        _loads(data, shared_objects)
+        return data
+
+    for idx, exception in list(result.exceptions.items()):
+        if not _is_transferable(exception, shared_objects):
+            result.exceptions[idx] = RuntimeError(type(exception).__name__)
+    entries: dict[Any, Any]
+    for entries in (  # type: ignore[assignment]
+        result.raw_return_types,
+        result.raw_return_type_generic_args,
+        result.proper_return_type_trace,
+        result.proxy_knowledge,
+    ):
+        for key, value in list(entries.items()):
+            if not _is_transferable(value, shared_objects):
+                del entries[key]
+    with contextlib.suppress(Exception):
+        data = _dumps(result, shared_objects)
+        _loads(data, shared_objects)
+        return data
+
+    # Something else, e.g., an assertion on an unpicklable value, is not
+    # transferable.  Only keep the data that is required for the search.
+    transferable = ExecutionResult(timeout=result.timeout)
+    transferable.executed_statements = result.executed_statements
+    transferable.exceptions = result.exceptions
+    transferable.execution_trace = result.execution_trace
+    return _dumps(transferable, shared_objects)
+
+
+def _run_execution_worker(
+    connection: Connection,
+    executor: TestCaseExecutor,
+    shared_objects: dict[int, Any],
+) -> None:
+    """The main loop of a worker process.
+
+    Receives batches of test cases, executes them and sends back their results.
+
+    Args:
+        connection: The connection to the Pynguin process
+        executor: The executor that is used to execute the test cases
+        shared_objects: The objects that are shared with the Pynguin process
+    """
+    while True:
+        try:
+            test_cases = _loads(connection.recv_bytes(), shared_objects)
+        except EOFError:
+            return
+        # pylint:disable-next=protected-access
+        results = executor._execute_in_thread(test_cases)
+        connection.send_bytes(
+            pickle.dumps(
+                [_serialize_result(result, shared_objects) for result in results]
+            )
+        )
+
+
+class ParallelTestCaseExecutor(AbstractTestCaseExecutor):
+    """A test case executor that distributes batches of test cases onto a pool of
+    worker processes.
+
+    The workers are forked from the Pynguin process, i.e., they share the state of
+    the module under test and the observers of the delegate at the time of forking.
+    Single test cases, as well as batches when forking is not available on the
+    platform, are executed in the Pynguin process by the delegate.  The observers are
+    notified about the end of each execution inside the Pynguin process, in the order
+    of the given test cases.
+    A worker, in which an execution timed out, is replaced by a freshly forked one,
+    because the timed out execution might still occupy it.
+    """
+
+    def __init__(self, delegate: TestCaseExecutor, number_of_workers: int) -> None:
+        """Create new parallel test case executor.
+
+        Args:
+            delegate: The executor that actually executes the test cases
+            number_of_workers: The number of worker processes to use
+        """
+        assert number_of_workers > 0, "Requires at least one worker"
+        self._delegate = delegate
+        self._number_of_workers = number_of_workers
+        self._workers: list[tuple[BaseProcess, Connection]] = []
+        self._forked_observers: list[ExecutionObserver] = []
+        self._shared_objects: dict[int, Any] = {}
+        self._fork_available = "fork" in multiprocessing.get_all_start_methods()
+        if not self._fork_available:
+            _LOGGER.warning(
+                "Forking processes is not supported on this platform, "
+                "test cases are executed sequentially."
+            )
+
+    @property
+    def module_provider(self) -> ModuleProvider:
+        return self._delegate.module_provider
+
+    def add_observer(self, observer: ExecutionObserver) -> None:
+        self._delegate.add_observer(observer)
+
+    def clear_observers(self) -> None:
+        self._delegate.clear_observers()
+
+    def temporarily_add_observer(self, observer: ExecutionObserver):
+        return self._delegate.temporarily_add_observer(observer)
+
+    @property
+    def tracer(self) -> ExecutionTracer:
+        return self._delegate.tracer
+
+    def execute(self, test_case: tc.TestCase) -> ExecutionResult:
+        return self._delegate.execute(test_case)
+
+    def execute_many(self, test_cases: list[tc.TestCase]) -> list[ExecutionResult]:
+        if len(test_cases) < 2 or not self._fork_available:
+            return self._delegate.execute_many(test_cases)
+
+        self._start_workers(test_cases[0])
+        chunk_size = -(-len(test_cases) // self._number_of_workers)
+        chunks = [
+            test_cases[start : start + chunk_size]
+            for start in range(0, len(test_cases), chunk_size)
+        ]
+        try:
+            messages = [_dumps(chunk, self._shared_objects) for chunk in chunks]
+        except Exception:  # pylint:disable=broad-except
+            _LOGGER.debug(
+                "Could not transfer test cases to workers, executing sequentially.",
+                exc_info=True,
+            )
+            return self._delegate.execute_many(test_cases)
+
+        for (_, connection), message in zip(self._workers, messages):
+            connection.send_bytes(message)
+        results: list[ExecutionResult] = []
+        for idx, chunk in enumerate(chunks):
+            results.extend(self._receive_results(idx, chunk))
+
+        for test_case, result in zip(test_cases, results, strict=True):
+            # pylint:disable-next=protected-access
+            self._delegate._after_test_case_execution_outside_thread(test_case, result)
+        return results
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            self._stop_worker(worker)
+        self._workers.clear()
+        self._delegate.shutdown()
+
+    def _start_workers(self, test_case: tc.TestCase) -> None:
+        # pylint:disable=protected-access
+        observers = list(self._delegate._observers)
+        if (
+            self._workers
+            and len(observers) == len(self._forked_observers)
+            and all(new is old for new, old in zip(observers, self._forked_observers))
+        ):
+            return
+
+        # The observers of the workers are outdated, so we have to fork new ones.
+        self.shutdown()
+        self._forked_observers = observers
+        self._shared_objects = _collect_shared_objects(test_case.test_cluster)
+        self._workers = [self._start_worker() for _ in range(self._number_of_workers)]
+
+    def _start_worker(self) -> tuple[BaseProcess, Connection]:
+        context = multiprocessing.get_context("fork")
+        parent_connection, child_connection = context.Pipe()
+        process = context.Process(
+            target=_run_execution_worker,
+            args=(child_connection, self._delegate, self._shared_objects),
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        return process, parent_connection
+
+    @staticmethod
+    def _stop_worker(worker: tuple[BaseProcess, Connection]) -> None:
+        process, connection = worker
+        process.kill()
+        process.join()
+        connection.close()
+
+    def _receive_results(
+        self, worker_idx: int, chunk: list[tc.TestCase]
+    ) -> list[ExecutionResult]:
+        _, connection = self._workers[worker_idx]
+        # pylint:disable-next=protected-access
+        timeout = sum(self._delegate._get_execution_timeout(t) for t in chunk)
+        results: list[ExecutionResult] | None = None
+        try:
+            if connection.poll(timeout + _WORKER_GRACE_PERIOD):
+                results = [
+                    _loads(data, self._shared_objects)
+                    for data in pickle.loads(connection.recv_bytes())
+                ]
+        except (EOFError, OSError, pickle.UnpicklingError):
+            pass
+        if results is None:
+            _LOGGER.warning("Execution worker did not respond, it will be replaced.")
+            results = [ExecutionResult(timeout=True) for _ in chunk]
+        elif not any(result.timeout for result in results):
+            return results
+
+        # A timed out execution might leave behind a thread that still runs within
+        # the worker, which we can only get rid of by replacing the worker.
+        self._stop_worker(self._workers[worker_idx])
+        self._workers[worker_idx] = self._start_worker()
+        return results
+
+
 class TypeTracingTestCaseExecutor(AbstractTestCaseExecutor):
     """A test case executor that delegates to another executor.
     Every test case is executed twice, one time for the regular result
-    and one time with proxies in order to refine parameter types."""
+    and one time with proxies in order to refine parameter types.
+
+    With adaptive type tracing, the second execution only happens with a probability
+    that is kept per called callable.  The probability decays each time tracing does
+    not change the knowledge about the parameters of a callable."""
 
     def __init__(
         self, delegate: AbstractTestCaseExecutor, cluster: module.ModuleTestCluster
@@ -2322,6 +3511,16 @@ class TypeTracingTestCaseExecutor(AbstractTestCaseExecutor):
         self._delegate = delegate
         self._type_tracing_observer = TypeTracingObserver(cluster)
         self._return_type_observer = ReturnTypeObserver(cluster)
+        type_inference = config.configuration.type_inference
+        self._adaptive = type_inference.adaptive_type_tracing
+        self._probability_decay = type_inference.type_tracing_probability_decay
+        self._min_probability = type_inference.type_tracing_min_probability
+        # The probability to trace the calls of a callable, if it is not contained,
+        # its calls are always traced.
+        self._tracing_probabilities: dict[
+            gao.GenericCallableAccessibleObject, float
+        ] = {}
+        self._skipped_proxied_executions = 0
 
     @property
     def module_provider(self) -> ModuleProvider:
@@ -2337,20 +3536,123 @@ class TypeTracingTestCaseExecutor(AbstractTestCaseExecutor):
     def tracer(self) -> ExecutionTracer:
         return self._delegate.tracer
 
+    def shutdown(self) -> None:
+        self._delegate.shutdown()
+
+    def track_statistics_values(
+        self, tracking_fun: Callable[[RuntimeVariable, Any], None]
+    ) -> None:
+        """Track statistics values of this executor.
+
+        Args:
+            tracking_fun: The tracking function as a callback.
+        """
+        if self._adaptive:
+            tracking_fun(
+                RuntimeVariable.SkippedTypeTracingExecutions,
+                self._skipped_proxied_executions,
+            )
+
     def execute(self, test_case: tc.TestCase) -> ExecutionResult:
         with self._delegate.temporarily_add_observer(self._return_type_observer):
             result = self._delegate.execute(test_case)
         if not result.timeout:
             # Only execute with proxies if the test case doesn't time out.
             # There is no need to stall another thread.
+            callables = self._called_callables(test_case)
+            if not self._should_trace(callables):
+                self._skipped_proxied_executions += 1
+                return result
+            self._type_tracing_observer.changed_callables.clear()
             with self._delegate.temporarily_add_observer(self._type_tracing_observer):
                 with tt.shim_isinstance():
                     # TODO(fk) Do we record wrong stuff, i.e., type checks from
                     #  observers?
                     #  Make use of type errors?
                     self._delegate.execute(test_case)
+            if self._adaptive:
+                self._update_tracing_probabilities(callables)
         return result
 
+    def execute_many(self, test_cases: list[tc.TestCase]) -> list[ExecutionResult]:
+        """Executes the given test cases.
+
+        The regular executions and the executions with proxies are passed to the
+        delegate as one batch each, such that it can, e.g., distribute them onto
+        worker processes.  With adaptive type tracing, the knowledge about the
+        callables is updated by the changes of the whole batch.
+
+        Args:
+            test_cases: the test cases that should be executed.
+
+        Returns:
+            The results of the executions, in the order of the given test cases
+        """
+        with self._delegate.temporarily_add_observer(self._return_type_observer):
+            results = self._delegate.execute_many(test_cases)
+        traced: list[tc.TestCase] = []
+        traced_callables: list[OrderedSet[gao.GenericCallableAccessibleObject]] = []
+        for test_case, result in zip(test_cases, results, strict=True):
+            # Only execute with proxies if the test case doesn't time out.
+            if result.timeout:
+                continue
+            callables = self._called_callables(test_case)
+            if not self._should_trace(callables):
+                self._skipped_proxied_executions += 1
+                continue
+            traced.append(test_case)
+            traced_callables.append(callables)
+        if not traced:
+            return results
+        self._type_tracing_observer.changed_callables.clear()
+        with self._delegate.temporarily_add_observer(self._type_tracing_observer):
+            with tt.shim_isinstance():
+                self._delegate.execute_many(traced)
+        if self._adaptive:
+            for callables in traced_callables:
+                self._update_tracing_probabilities(callables)
+        return results
+
+    @staticmethod
+    def _called_callables(
+        test_case: tc.TestCase,
+    ) -> OrderedSet[gao.GenericCallableAccessibleObject]:
+        # Only the arguments of parametrized statements are wrapped in proxies.
+        callables: OrderedSet[gao.GenericCallableAccessibleObject] = OrderedSet()
+        for statement in test_case.statements:
+            if isinstance(statement, stmt.ParametrizedStatement) and statement.args:
+                callables.add(
+                    cast(
+                        gao.GenericCallableAccessibleObject,
+                        statement.accessible_object(),
+                    )
+                )
+        return callables
+
+    def _should_trace(
+        self, callables: OrderedSet[gao.GenericCallableAccessibleObject]
+    ) -> bool:
+        if not self._adaptive:
+            return True
+        return any(
+            randomness.next_float() < self._tracing_probabilities.get(callable_, 1.0)
+            for callable_ in callables
+        )
+
+    def _update_tracing_probabilities(
+        self, callables: OrderedSet[gao.GenericCallableAccessibleObject]
+    ) -> None:
+        changed = self._type_tracing_observer.changed_callables
+        for callable_ in callables:
+            if callable_ in changed:
+                self._tracing_probabilities.pop(callable_, None)
+            else:
+                self._tracing_probabilities[callable_] = max(
+                    self._min_probability,
+                    self._tracing_probabilities.get(callable_, 1.0)
+                    * self._probability_decay,
+                )
+
 
 class TypeTracingObserver(ExecutionObserver):
     """An execution observer which wraps parameters in proxies in order to make better
@@ -2369,9 +3671,14 @@ class TypeTracingObserver(ExecutionObserver):
     def __init__(self, cluster: module.TestCluster):
         self._local_state = TypeTracingObserver.TypeTracingLocalState()
         self._cluster = cluster
+        # The callables whose parameter knowledge was changed by the observed
+        # executions.
+        self.changed_callables: OrderedSet[
+            gao.GenericCallableAccessibleObject
+        ] = OrderedSet()
 
     def before_test_case_execution(self, test_case: tc.TestCase):
-        pass
+        self._local_state.proxies = {}
 
     def after_test_case_execution_inside_thread(
         self, test_case: tc.TestCase, result: ExecutionResult
@@ -2387,13 +3694,13 @@ class TypeTracingObserver(ExecutionObserver):
         for (stmt_pos, arg_name), knowledge in result.proxy_knowledge.items():
             statement = test_case.get_statement(stmt_pos)
             assert isinstance(statement, stmt.ParametrizedStatement)
-            self._cluster.update_parameter_knowledge(
-                cast(
-                    gao.GenericCallableAccessibleObject, statement.accessible_object()
-                ),
-                arg_name,
-                knowledge,
+            accessible = cast(
+                gao.GenericCallableAccessibleObject, statement.accessible_object()
             )
+            if self._cluster.update_parameter_knowledge(
+                accessible, arg_name, knowledge
+            ):
+                self.changed_callables.add(accessible)
 
     def before_statement_execution(
         self, statement: stmt.Statement, node: ast.stmt, exec_ctx: ExecutionContext
@@ -458,6 +458,7 @@ class AssignmentStatement(Statement):
         return refs
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self._lhs == old:
             self._lhs = new
         else:
@@ -526,6 +527,8 @@ class CollectionStatement(Generic[T], VariableCreatingStatement):
             < config.configuration.search_algorithm.test_insert_probability
         ):
             changed |= self._random_insertion()
+        if changed:
+            self._test_case.invalidate_cached_hash()
         return changed
 
     def _random_deletion(self) -> bool:
@@ -639,7 +642,9 @@ class ListStatement(NonDictCollection):
         return references
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self.ret_val == old:
+            self._test_case.invalidate_type_index()
             self.ret_val = new
         self._elements = [new if arg == old else arg for arg in self._elements]
 
@@ -668,7 +673,9 @@ class SetStatement(NonDictCollection):
         return references
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self.ret_val == old:
+            self._test_case.invalidate_type_index()
             self.ret_val = new
         self._elements = [new if arg == old else arg for arg in self._elements]
 
@@ -697,7 +704,9 @@ class TupleStatement(NonDictCollection):
         return references
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self.ret_val == old:
+            self._test_case.invalidate_type_index()
             self.ret_val = new
         self._elements = [new if arg == old else arg for arg in self._elements]
 
@@ -738,7 +747,9 @@ class DictStatement(
         return references
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self.ret_val == old:
+            self._test_case.invalidate_type_index()
             self.ret_val = new
         self._elements = [
             (new if elem[0] == old else elem[0], new if elem[1] == old else elem[1])
@@ -853,6 +864,7 @@ class FieldStatement(VariableCreatingStatement):
             new_source: The new variable to access
         """
         self._source = new_source
+        self._test_case.invalidate_cached_hash()
 
     def accessible_object(self) -> gao.GenericAccessibleObject | None:
         return self._field
@@ -898,11 +910,13 @@ class FieldStatement(VariableCreatingStatement):
         return refs
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self._source == old:
             self._source = new
         else:
             self._source.replace_variable_reference(old, new)
         if self.ret_val == old:
+            self._test_case.invalidate_type_index()
             self.ret_val = new
 
     def structural_eq(
@@ -962,6 +976,7 @@ class ParametrizedStatement(
     @args.setter
     def args(self, args: dict[str, vr.VariableReference]):
         self._args = args
+        self._test_case.invalidate_cached_hash()
 
     @property
     def raised_exceptions(self) -> set[str]:
@@ -979,7 +994,9 @@ class ParametrizedStatement(
         return references
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self.ret_val == old:
+            self._test_case.invalidate_type_index()
             self.ret_val = new
         for key, value in self._args.items():
             if value == old:
@@ -1011,6 +1028,7 @@ class ParametrizedStatement(
             p_per_param = 1.0 / mutable_param_count
             changed |= self._mutate_special_parameters(p_per_param)
             changed |= self._mutate_parameters(p_per_param)
+        self._test_case.invalidate_cached_hash()
         return changed
 
     def _mutable_argument_count(self) -> int:
@@ -1292,6 +1310,7 @@ class MethodStatement(ParametrizedStatement):
             new_callee: Sets a new callee
         """
         self._callee = new_callee
+        self._test_case.invalidate_cached_hash()
 
     def clone(
         self,
@@ -1396,6 +1415,7 @@ class PrimitiveStatement(Generic[T], VariableCreatingStatement):
     @value.setter
     def value(self, value: T) -> None:
         self._value = value
+        self._test_case.invalidate_cached_hash()
 
     def accessible_object(self) -> gao.GenericAccessibleObject | None:
         return None
@@ -1410,13 +1430,16 @@ class PrimitiveStatement(Generic[T], VariableCreatingStatement):
                 self.randomize_value()
             else:
                 self.delta()
+        self._test_case.invalidate_cached_hash()
         return True
 
     def get_variable_references(self) -> set[vr.VariableReference]:
         return {self.ret_val}
 
     def replace(self, old: vr.VariableReference, new: vr.VariableReference) -> None:
+        self._test_case.invalidate_cached_hash()
         if self.ret_val == old:
+            self._test_case.invalidate_type_index()
             self.ret_val = new
 
     @abstractmethod
@@ -7,25 +7,39 @@
 """Provides an implementation for a test case."""
 from __future__ import annotations
 
+import bisect
+
 from abc import ABCMeta
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
+import pynguin.testcase.variablereference as vr
+
 from pynguin.utils import randomness
 from pynguin.utils.exceptions import ConstructionFailedException
 from pynguin.utils.orderedset import OrderedSet
 
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     import pynguin.assertion.assertion as ass
     import pynguin.testcase.statement as stmt
     import pynguin.testcase.testcasevisitor as tcv
-    import pynguin.testcase.variablereference as vr
 
     from pynguin.analyses.module import TestCluster
     from pynguin.analyses.typesystem import ProperType
 
 
+def _type_key(variable: vr.VariableReference) -> Hashable:
+    # The type of a call-based variable follows the return type of its callable,
+    # which may change over time, thus such variables are grouped by their callable.
+    # All variables with the same key have the same type.
+    if isinstance(variable, vr.CallBasedVariableReference):
+        return variable.generic_callable
+    return variable.type
+
+
 # pylint: disable=too-many-public-methods
 class TestCase(metaclass=ABCMeta):
     """An abstract base implementation for a test case.
@@ -43,6 +57,13 @@ class TestCase(metaclass=ABCMeta):
         """
         self._statements: list[stmt.Statement] = []
         self.test_cluster: TestCluster = test_cluster
+        # The structural hash of this test case, if it was computed since the last
+        # modification.
+        self._cached_hash: int | None = None
+        # Groups the positions of the statements that create a variable by the type
+        # of the variable, see _get_type_index.  It is built on demand and maintained
+        # by the subclasses when statements are added or removed.
+        self._type_index: dict[Hashable, list[int]] | None = None
 
     @property
     def statements(self) -> list[stmt.Statement]:
@@ -53,6 +74,81 @@ class TestCase(metaclass=ABCMeta):
         """
         return self._statements
 
+    def invalidate_cached_hash(self) -> None:
+        """Invalidate the cached hash of this test case.
+
+        Has to be called whenever a statement of this test case is modified.
+        """
+        self._cached_hash = None
+
+    def invalidate_type_index(self) -> None:
+        """Invalidate the index of the variable types of this test case.
+
+        Has to be called whenever a statement of this test case is modified such
+        that it creates a different variable.
+        """
+        self._type_index = None
+
+    def _get_type_index(self) -> dict[Hashable, list[int]]:
+        """Provides the positions of the statements grouped by their variable types.
+
+        Returns:
+            A mapping from the keys of the variable types to the ascending positions of
+            the statements that create variables of these types
+        """
+        if self._type_index is None:
+            self._type_index = {}
+            for position, statement in enumerate(self._statements):
+                if (variable := statement.ret_val) is not None:
+                    self._type_index.setdefault(_type_key(variable), []).append(
+                        position
+                    )
+        return self._type_index
+
+    def _index_statement(self, statement: stmt.Statement, position: int) -> None:
+        """Adds the variable created by the statement to the type index.
+
+        Args:
+            statement: The statement
+            position: The position of the statement
+        """
+        if self._type_index is None or (variable := statement.ret_val) is None:
+            return
+        bisect.insort(self._type_index.setdefault(_type_key(variable), []), position)
+
+    def _unindex_statement(self, statement: stmt.Statement, position: int) -> None:
+        """Removes the variable created by the statement from the type index.
+
+        Args:
+            statement: The statement
+            position: The position of the statement
+        """
+        if self._type_index is None or (variable := statement.ret_val) is None:
+            return
+        key = _type_key(variable)
+        positions = self._type_index.get(key, [])
+        index = bisect.bisect_left(positions, position)
+        if index == len(positions) or positions[index] != position:
+            # The variable was replaced without notifying the test case.
+            self._type_index = None
+            return
+        del positions[index]
+        if not positions:
+            del self._type_index[key]
+
+    def _shift_type_index(self, position: int, delta: int) -> None:
+        """Shifts the indexed positions from the given position on.
+
+        Args:
+            position: The first position that is shifted
+            delta: The value that is added to the shifted positions
+        """
+        if self._type_index is None:
+            return
+        for positions in self._type_index.values():
+            for index in range(bisect.bisect_left(positions, position), len(positions)):
+                positions[index] += delta
+
     @abstractmethod
     def accept(self, visitor: tcv.TestCaseVisitor) -> None:
         """Handles a test visitor.
@@ -249,16 +345,22 @@ class TestCase(metaclass=ABCMeta):
         Returns:
             A list of variable references satisfying the parameter type
         """
-        variables: list[vr.VariableReference] = []
         bound = min(len(self._statements), position)
-        for i in range(bound):
-            statement = self._statements[i]
-            var = statement.ret_val
-            if var is None:
+        candidates: list[int] = []
+        for positions in self._get_type_index().values():
+            if positions[0] >= bound:
                 continue
+            # All variables of a group have the same type
+            var = self._statements[positions[0]].ret_val
+            assert var is not None
             if self.test_cluster.type_system.is_maybe_subtype(var.type, parameter_type):
-                variables.append(var)
-
+                candidates.extend(positions[: bisect.bisect_left(positions, bound)])
+        candidates.sort()
+        variables: list[vr.VariableReference] = []
+        for i in candidates:
+            var = self._statements[i].ret_val
+            assert var is not None
+            variables.append(var)
         return variables
 
     def get_all_objects(self, position: int) -> list[vr.VariableReference]:
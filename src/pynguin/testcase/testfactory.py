@@ -608,12 +608,11 @@ class TestFactory:
         """
         candidates: list[vr.VariableReference] = [
             var
-            for var in test_case.get_all_objects(position)
-            if not var.is_primitive()
-            and not isinstance(
-                test_case.get_statement(var.get_statement_position()),
-                stmt.NoneStatement,
-            )
+            for statement in test_case.statements[:position]
+            if (var := statement.ret_val) is not None
+            and not var.is_none_type()
+            and not var.is_primitive()
+            and not isinstance(statement, stmt.NoneStatement)
         ]
 
         if len(candidates) == 0:
@@ -260,6 +260,15 @@ class CallBasedVariableReference(VariableReference):
         super().__init__(test_case, NoneType())  # dummy
         self._callable = generic_callable
 
+    @property
+    def generic_callable(self) -> gao.GenericCallableAccessibleObject:
+        """Provides the callable on which this variable is based.
+
+        Returns:
+            The callable on which this variable is based
+        """
+        return self._callable
+
     @property
     def type(self) -> ProperType:
         # Dynamically look up type instead of using fixed type given at
@@ -0,0 +1,176 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a set of non-negative integers that is backed by the bits of an integer."""
+from __future__ import annotations
+
+import sys
+
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import MutableSet
+from typing import Any
+
+
+class BitSet(MutableSet[int]):
+    """A set of non-negative integers, which are stored as the bits of an integer.
+
+    The ids that Pynguin assigns, e.g., to lines or code objects, are dense, thus a
+    bit set stores them compactly.  Operations between bit sets, e.g., merging the
+    covered lines of execution traces, work on whole integers instead of single
+    elements.  The elements are iterated in ascending order.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, iterable: Iterable[int] | None = None) -> None:
+        self._bits = 0 if iterable is None else self._bits_of(iterable)
+
+    @classmethod
+    def _from_bits(cls, bits: int) -> BitSet:
+        bit_set = cls()
+        bit_set._bits = bits
+        return bit_set
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[int]) -> BitSet:
+        return cls(it)
+
+    @staticmethod
+    def _bits_of(iterable: Iterable[int]) -> int:
+        if isinstance(iterable, BitSet):
+            return iterable._bits
+        bits = 0
+        for value in iterable:
+            bits |= 1 << value
+        return bits
+
+    def __contains__(self, value: Any) -> bool:
+        return isinstance(value, int) and value >= 0 and (self._bits >> value) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        bits = self._bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BitSet):
+            return self._bits == other._bits
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __copy__(self) -> BitSet:
+        return self._from_bits(self._bits)
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + sys.getsizeof(self._bits)
+
+    def __or__(self, other: Iterable[Any]) -> BitSet:
+        return self.union(other)
+
+    def __and__(self, other: Iterable[Any]) -> BitSet:
+        return self.intersection(other)
+
+    def __sub__(self, other: Iterable[Any]) -> BitSet:
+        return self.difference(other)
+
+    def __ior__(self, other: Iterable[Any]) -> BitSet:
+        self.update(other)
+        return self
+
+    def add(self, value: int) -> None:
+        """Add the given value to this set.
+
+        Args:
+            value: the non-negative integer to add
+        """
+        self._bits |= 1 << value
+
+    def discard(self, value: int) -> None:
+        if value in self:
+            self._bits ^= 1 << value
+
+    def clear(self) -> None:
+        self._bits = 0
+
+    def update(self, *others: Iterable[int]) -> None:
+        """Add the elements of the given iterables to this set.
+
+        Args:
+            *others: The iterables whose elements are added
+        """
+        for other in others:
+            self._bits |= self._bits_of(other)
+
+    def union(self, *others: Iterable[int]) -> BitSet:
+        """Provides the elements that are in this set or in one of the others.
+
+        Args:
+            *others: The iterables to union with
+
+        Returns:
+            A new set containing the union.
+        """
+        bits = self._bits
+        for other in others:
+            bits |= self._bits_of(other)
+        return self._from_bits(bits)
+
+    def intersection(self, *others: Iterable[Any]) -> BitSet:
+        """Provides the elements that are in this set and in all the others.
+
+        Args:
+            *others: The iterables to intersect with
+
+        Returns:
+            A new set containing the intersection.
+        """
+        bits = self._bits
+        for other in others:
+            if isinstance(other, BitSet):
+                bits &= other._bits
+            else:
+                bits &= self._bits_of(value for value in other if value in self)
+        return self._from_bits(bits)
+
+    def difference(self, *others: Iterable[Any]) -> BitSet:
+        """Provides the elements that are in this set but not in the others.
+
+        Args:
+            *others: The iterables whose elements are removed
+
+        Returns:
+            A new set containing the difference.
+        """
+        bits = self._bits
+        for other in others:
+            if isinstance(other, BitSet):
+                bits &= ~other._bits
+            else:
+                bits &= ~self._bits_of(value for value in other if value in self)
+        return self._from_bits(bits)
+
+    def issubset(self, other: Iterable[Any]) -> bool:
+        """Report whether another set contains this set.
+
+        Args:
+            other: The set to check
+
+        Returns:
+            True, if this is a subset of other.
+        """
+        if isinstance(other, BitSet):
+            return self._bits & ~other._bits == 0
+        return self.difference(other)._bits == 0
@@ -7,6 +7,7 @@
 """Provides abstract factories for output variables."""
 from __future__ import annotations
 
+import bisect
 import time
 import typing
 
@@ -61,10 +62,18 @@ class ChromosomeOutputVariableFactory(Generic[T], metaclass=ABCMeta):
 
 
 class SequenceOutputVariableFactory(Generic[T], metaclass=ABCMeta):
-    """Creates an output variable that represents a sequence of values."""
+    """Creates an output variable that represents a sequence of values.
+
+    The values are only reported at the end of each timeline interval, which only
+    depends on the last value before and the first value at or after the end of the
+    interval.  Thus, only the first and the last value that are recorded in each
+    interval are kept, which bounds the stored values by the number of intervals
+    instead of the number of updates.
+    """
 
     def __init__(self, variable: stat.RuntimeVariable) -> None:
         self._variable = variable
+        # The recorded time stamps are ascending
         self._time_stamps: list[int] = []
         self._values: list[T] = []
         self._start_time: int = 0
@@ -94,8 +103,7 @@ class SequenceOutputVariableFactory(Generic[T], metaclass=ABCMeta):
         Args:
             individual: The individual
         """
-        self._time_stamps.append(time.time_ns() - self._start_time)
-        self._values.append(self.get_value(individual))
+        self._record(self.get_value(individual))
 
     @overload
     def update_value(self, value: int) -> None:
@@ -111,8 +119,27 @@ class SequenceOutputVariableFactory(Generic[T], metaclass=ABCMeta):
         Args:
             value: The value
         """
-        self._time_stamps.append(time.time_ns() - self._start_time)
-        self._values.append(value)
+        self._record(value)
+
+    def _record(self, value: T) -> None:
+        # Do not rely on the wall clock being monotonic
+        time_stamp = time.time_ns() - self._start_time
+        if self._time_stamps:
+            time_stamp = max(time_stamp, self._time_stamps[-1])
+        interval = config.configuration.statistics_output.timeline_interval
+        bucket = time_stamp // interval
+        if (
+            len(self._time_stamps) >= 2
+            and self._time_stamps[-2] // interval == bucket
+            and self._time_stamps[-1] // interval == bucket
+        ):
+            # The interval already holds its first and its last value, replace the
+            # last one
+            self._time_stamps[-1] = time_stamp
+            self._values[-1] = value
+        else:
+            self._time_stamps.append(time_stamp)
+            self._values.append(value)
 
     def get_variable_names_indices(self) -> list[tuple[int, str]]:
         """Provides a list of variable names.
@@ -144,14 +171,12 @@ class SequenceOutputVariableFactory(Generic[T], metaclass=ABCMeta):
             return 0
         interval = config.configuration.statistics_output.timeline_interval
         preferred_time = interval * index
-        # pylint:disable=consider-using-enumerate
-        for i in range(len(self._time_stamps)):
-            # find the first stamp that is following the time we would like to get
-            # the value for
-            stamp = self._time_stamps[i]
-            if stamp < preferred_time:
-                continue
-
+        # find the first stamp that is following the time we would like to get
+        # the value for
+        for i in range(
+            bisect.bisect_left(self._time_stamps, preferred_time),
+            len(self._time_stamps),
+        ):
             if i == 0:
                 # it is the first element, just use it as value
                 return self._values[i]
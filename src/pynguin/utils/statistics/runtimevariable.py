@@ -109,6 +109,14 @@ class RuntimeVariable(str, enum.Enum):
     # The mutation score
     MutationScore = "MutationScore"
 
+    # The number of executions of tests on mutants that were skipped, because the
+    # test does not reach the mutated lines
+    NumberOfSkippedMutantExecutions = "NumberOfSkippedMutantExecutions"
+
+    # The number of executions of test cases with proxies for type tracing that were
+    # skipped by adaptive type tracing
+    SkippedTypeTracingExecutions = "SkippedTypeTracingExecutions"
+
     # Store JSON serialized information about the signatures in the SUT, i.e.,
     # annotated and guessed parameter types as well as annotated and recorded
     # return types. Also store which types are base type matches of other types.
@@ -184,5 +192,21 @@ class RuntimeVariable(str, enum.Enum):
     # they do not increase the resulting checked coverage
     DeletedAssertions = "DeletedAssertions"
 
+    # The number of executed statements and assertions, whose compiled code was
+    # found in the code cache of the executor
+    CodeCacheHits = "CodeCacheHits"
+
+    # The number of executed statements and assertions, whose code had to be
+    # compiled, because it was not found in the code cache of the executor
+    CodeCacheMisses = "CodeCacheMisses"
+
+    # The number of statements whose execution was skipped, because the state after
+    # them was restored from a snapshot of the executor
+    ReusedStatementExecutions = "ReusedStatementExecutions"
+
+    # The ratio of test case executions that reused a result from the result cache of
+    # the executor instead of executing the module under test
+    ResultCacheHitRate = "ResultCacheHitRate"
+
     def __repr__(self):
         return f"{self.name}"
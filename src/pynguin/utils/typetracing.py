@@ -138,18 +138,29 @@ class UsageTraceNode:
         """
         return obj._self_usage_trace_node
 
-    def merge(self, other: UsageTraceNode) -> None:
+    def merge(self, other: UsageTraceNode) -> bool:
         """Merge the knowledge from the other proxy into this one.
 
         Args:
             other: The knowledge that should be merged into this one.
+
+        Returns:
+            Whether the knowledge of this node changed.
         """
         assert self.name == other.name
         assert self.depth == other.depth
+        changed = any(
+            self.arg_types.get(position) != types
+            for position, types in other.arg_types.items()
+        )
         self.arg_types.update(other.arg_types)
+        number_of_type_checks = len(self.type_checks)
         self.type_checks.update(other.type_checks)
+        changed |= len(self.type_checks) != number_of_type_checks
         for attr, knowledge in other.children.items():
-            self.children[attr].merge(knowledge)
+            changed |= attr not in self.children
+            changed |= self.children[attr].merge(knowledge)
+        return changed
 
 
 class DepthDefaultDict(dict[str, UsageTraceNode]):
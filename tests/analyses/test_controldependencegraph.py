@@ -84,3 +84,16 @@ def test_get_control_dependencies_asserts(node):
     cdg = list(tracer.get_subject_properties().existing_code_objects.values())[0].cdg
     with pytest.raises(AssertionError):
         cdg.get_control_dependencies(node)
+
+
+def test_compute_predicate_distances():
+    tracer = ExecutionTracer()
+    adapter = BranchCoverageInstrumentation(tracer)
+    transformer = InstrumentationTransformer(tracer, [adapter])
+    transformer.instrument_module(small_fixture.__code__)
+    meta_data = list(tracer.get_subject_properties().existing_code_objects.values())[0]
+    # Predicate 3 is x <= y, which controls x == y (1) and x > 0 (2), the latter
+    # controls y == 17 (0).
+    expected = {0: ((1, 2), (2, 3)), 1: ((1, 3),), 2: ((1, 3),), 3: ()}
+    assert meta_data.cdg.compute_predicate_distances() == expected
+    assert meta_data.predicate_distances == expected
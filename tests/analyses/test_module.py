@@ -5,6 +5,7 @@
 #  SPDX-License-Identifier: MIT
 #
 import importlib
+import inspect
 import itertools
 
 from logging import Logger
@@ -24,6 +25,7 @@ from pynguin.analyses.module import generate_test_cluster
 from pynguin.analyses.module import parse_module
 from pynguin.analyses.typesystem import ANY
 from pynguin.analyses.typesystem import AnyType
+from pynguin.analyses.typesystem import InferredSignature
 from pynguin.analyses.typesystem import ProperType
 from pynguin.analyses.typesystem import TypeInfo
 from pynguin.analyses.typesystem import UnionType
@@ -552,3 +554,90 @@ def test__add_or_make_union_2(type_system):
     assert ModuleTestCluster._add_or_make_union(
         ANY, type_system.convert_type_hint(int)
     ) == UnionType((type_system.convert_type_hint(int),))
+
+
+def test_generators_for_invalidated_by_add_generator(module_test_cluster):
+    from tests.fixtures.cluster.inheritance import Bar
+    from tests.fixtures.cluster.inheritance import Foo
+
+    type_system = module_test_cluster.type_system
+    type_system.add_subclass_edge(
+        super_class=type_system.to_type_info(Foo),
+        sub_class=type_system.to_type_info(Bar),
+    )
+    foo_type = type_system.convert_type_hint(Foo)
+    bar_type = type_system.convert_type_hint(Bar)
+    int_type = type_system.convert_type_hint(int)
+    foo_generator = MagicMock(GenericConstructor)
+    foo_generator.generated_type.return_value = foo_type
+    module_test_cluster.add_generator(foo_generator)
+    int_generators = module_test_cluster.get_generators_for(int_type)
+    assert module_test_cluster.get_generators_for(int_type) is int_generators
+    assert module_test_cluster.get_generators_for(foo_type) == (
+        OrderedSet([foo_generator]),
+        False,
+    )
+
+    bar_generator = MagicMock(GenericConstructor)
+    bar_generator.generated_type.return_value = bar_type
+    module_test_cluster.add_generator(bar_generator)
+    assert module_test_cluster.get_generators_for(int_type) is int_generators
+    assert module_test_cluster.get_generators_for(foo_type) == (
+        OrderedSet([foo_generator, bar_generator]),
+        False,
+    )
+    assert module_test_cluster.get_generators_for(ANY) == (
+        OrderedSet([foo_generator, bar_generator]),
+        False,
+    )
+
+
+def test_generators_for_invalidated_by_update_return_type(module_test_cluster):
+    from tests.fixtures.cluster.inheritance import Bar
+    from tests.fixtures.cluster.inheritance import Foo
+
+    type_system = module_test_cluster.type_system
+    type_system.add_subclass_edge(
+        super_class=type_system.to_type_info(Foo),
+        sub_class=type_system.to_type_info(Bar),
+    )
+    foo_type = type_system.convert_type_hint(Foo)
+    bar_type = type_system.convert_type_hint(Bar)
+    int_type = type_system.convert_type_hint(int)
+    foo_generator = MagicMock(GenericConstructor)
+    foo_generator.generated_type.return_value = foo_type
+    module_test_cluster.add_generator(foo_generator)
+    function = GenericFunction(
+        function=MagicMock(),
+        inferred_signature=InferredSignature(
+            signature=inspect.Signature(),
+            original_return_type=foo_type,
+            original_parameters={},
+            type_system=type_system,
+        ),
+    )
+    module_test_cluster.add_generator(function)
+    types = [foo_type, bar_type, int_type, ANY]
+    for typ in types:
+        module_test_cluster.get_generators_for(typ)
+    int_generators = module_test_cluster.get_generators_for(int_type)
+
+    module_test_cluster.update_return_type(function, bar_type)
+    assert module_test_cluster.get_generators_for(int_type) is int_generators
+    for typ in types:
+        assert module_test_cluster.get_generators_for(
+            typ
+        ) == module_test_cluster._ModuleTestCluster__compute_generators_for(typ)
+    assert function in module_test_cluster.get_generators_for(bar_type)[0]
+
+
+def test_modifiers_for_invalidated_by_add_modifier():
+    cluster = generate_test_cluster("tests.fixtures.cluster.inheritance")
+    from tests.fixtures.cluster.inheritance import Bar
+
+    bar_type = cluster.type_system.convert_type_hint(Bar)
+    modifiers = cluster.get_modifiers_for(bar_type)
+    assert cluster.get_modifiers_for(bar_type) is modifiers
+    modifier = MagicMock(GenericMethod)
+    cluster.add_modifier(bar_type.type, modifier)
+    assert set(cluster.get_modifiers_for(bar_type)) == {*modifiers, modifier}
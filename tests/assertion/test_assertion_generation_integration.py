@@ -262,6 +262,7 @@ def test_mutation_analysis_integration_full(
 ):
     config.configuration.module_name = module
     module_name = config.configuration.module_name
+    threads = set(threading.enumerate())
     tracer = ExecutionTracer()
     tracer.current_thread_identifier = threading.current_thread().ident
     with install_import_hook(module_name, tracer):
@@ -275,10 +276,10 @@ def test_mutation_analysis_integration_full(
         suite = tsc.TestSuiteChromosome()
         suite.add_test_case_chromosome(chromosome)
 
-        gen = ag.MutationAnalysisAssertionGenerator(
-            TestCaseExecutor(tracer), testing=True
-        )
+        executor = TestCaseExecutor(tracer)
+        gen = ag.MutationAnalysisAssertionGenerator(executor, testing=True)
         suite.accept(gen)
+        executor.shutdown()
 
         summary = gen._testing_mutation_summary
         kills = {k.mut_num for k in summary.get_killed()}
@@ -301,7 +302,47 @@ def test_mutation_analysis_integration_full(
             )
         )
         assert source == test_case_str_with_assertions
-        for thread in threading.enumerate():
-            if "_execute_test_case" in thread.name:
-                thread.join()
-        assert len(threading.enumerate()) == 1  # Only main thread should be alive.
+        for thread in set(threading.enumerate()) - threads:
+            thread.join()
+        # No thread started by the executors should be alive.
+        assert set(threading.enumerate()) <= threads
+
+
+def test_mutation_analysis_skips_tests_not_reaching_mutant():
+    config.configuration.module_name = "tests.fixtures.mutation.uncovered"
+    module_name = config.configuration.module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        importlib.reload(importlib.import_module(module_name))
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(
+            ast.parse(
+                "def test_case_0():\n    int_0 = 1\n    int_1 = module_0.covered(int_0)"
+            )
+        )
+        suite = tsc.TestSuiteChromosome()
+        suite.add_test_case_chromosome(tcc.TestCaseChromosome(transformer.testcases[0]))
+
+        executor = TestCaseExecutor(tracer)
+        gen = ag.MutationAnalysisAssertionGenerator(executor, testing=True)
+        suite.accept(gen)
+        executor.shutdown()
+
+    summary = gen._testing_mutation_summary
+    not_reached = {
+        idx
+        for idx, mutant in enumerate(gen._testing_created_mutants)
+        if "OFFSET = 1" in mutant and "return value + OFFSET" in mutant
+    }
+    # Mutants of the global variable are reached by every test.
+    assert not_reached
+    assert {
+        info.mut_num for info in summary.mutant_information if info.not_covered_by
+    } == not_reached
+    assert summary.get_skipped_executions() == len(not_reached)
+    assert {info.mut_num for info in summary.get_killed()}.isdisjoint(not_reached)
+    assert len(summary.get_killed()) == len(gen._testing_created_mutants) - len(
+        not_reached
+    )
@@ -32,3 +32,15 @@ def test_mutation_score(created, killed, timeout, score):
 )
 def test_compute_metrics(inp, result):
     assert ag._MutationSummary(inp).get_metrics() == result
+
+
+def test_skipped_executions():
+    summary = ag._MutationSummary(
+        [
+            ag._MutantInfo(0, [], [1], [0, 2]),
+            ag._MutantInfo(1, [], [], [0, 1, 2]),
+            ag._MutantInfo(2, [0], [], []),
+        ]
+    )
+    assert summary.get_skipped_executions() == 5
+    assert [info.mut_num for info in summary.get_survived()] == [1]
@@ -395,3 +395,34 @@ def _get_empty_test() -> tcc.TestCaseChromosome:
     cluster = ModuleTestCluster(0)
     test_case = dtc.DefaultTestCase(cluster)
     return tcc.TestCaseChromosome(test_case=test_case)
+
+
+def test_coverage_goal_index_get_covered(executor_mock):
+    branchless = bg.BranchCoverageTestFitness(
+        executor_mock, bg.BranchlessCodeObjectGoal(1)
+    )
+    branch_true = bg.BranchCoverageTestFitness(executor_mock, bg.BranchGoal(0, 2, True))
+    branch_false = bg.BranchCoverageTestFitness(
+        executor_mock, bg.BranchGoal(0, 2, False)
+    )
+    line = bg.LineCoverageTestFitness(executor_mock, bg.LineCoverageGoal(0, 3))
+    checked = bg.StatementCheckedCoverageTestFitness(
+        executor_mock, bg.CheckedCoverageGoal(0, 3)
+    )
+    index = bg.CoverageGoalIndex()
+    for fitness_function in (branchless, branch_true, branch_false, line, checked):
+        assert index.add(fitness_function)
+
+    trace = ExecutionTrace()
+    trace.executed_code_objects.update((0, 1))
+    trace.executed_predicates[2] = 1
+    trace.true_distances[2] = 0.0
+    trace.false_distances[2] = 1.0
+    trace.covered_line_ids.update((3, 4))
+    result = ExecutionResult()
+    result.execution_trace = trace
+    assert index.get_covered(result) == [branchless, branch_true, line]
+
+
+def test_coverage_goal_index_add_other(executor_mock):
+    assert not bg.CoverageGoalIndex().add(MagicMock())
@@ -15,7 +15,10 @@ from hypothesis import assume
 from hypothesis import given
 
 from pynguin.coverage.controlflowdistance import ControlFlowDistance
+from pynguin.coverage.controlflowdistance import get_non_root_control_flow_distance
 from pynguin.coverage.controlflowdistance import get_root_control_flow_distance
+from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
+from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.testcase.execution import ExecutionResult
 from pynguin.testcase.execution import ExecutionTrace
 from pynguin.testcase.execution import ExecutionTracer
@@ -143,3 +146,58 @@ def test_calculate_control_flow_distance_for_root(
     assert distance == ControlFlowDistance(
         approach_level=approach_level, branch_distance=0.0
     )
+
+
+def _nested_fixture(x, y):  # pragma: no cover
+    if x <= y:
+        if x == y:
+            y = x
+        if x > 0:
+            if y == 17:
+                return True
+    return False
+
+
+@pytest.mark.parametrize(
+    "true_distances, false_distances, expected",
+    [
+        pytest.param({}, {}, None, id="none"),
+        pytest.param(
+            {3: 0.0},
+            {3: 2.0},
+            ControlFlowDistance(approach_level=2, branch_distance=2.0),
+            id="outer",
+        ),
+        pytest.param(
+            {3: 0.0, 1: 1.0, 2: 2.0},
+            {3: 2.0, 1: 0.0, 2: 0.0},
+            ControlFlowDistance(approach_level=1, branch_distance=2.0),
+            id="closest",
+        ),
+    ],
+)
+def test_calculate_control_flow_distance_for_non_root(
+    true_distances, false_distances, expected
+):
+    tracer = ExecutionTracer()
+    transformer = InstrumentationTransformer(
+        tracer, [BranchCoverageInstrumentation(tracer)]
+    )
+    transformer.instrument_module(_nested_fixture.__code__)
+    # Predicate 0 is the innermost predicate, 3 the outermost one.
+    trace = ExecutionTrace()
+    trace.executed_code_objects.add(0)
+    for predicate_id in true_distances:
+        trace.executed_predicates[predicate_id] = 1
+    trace.true_distances.update(true_distances)
+    trace.false_distances.update(false_distances)
+    result = ExecutionResult()
+    result.execution_trace = trace
+    if expected is None:
+        # The diameter of the CFG is the upper bound.
+        expected = ControlFlowDistance(
+            approach_level=tracer.get_subject_properties()
+            .existing_code_objects[0]
+            .cfg.diameter
+        )
+    assert get_non_root_control_flow_distance(result, 0, True, tracer) == expected
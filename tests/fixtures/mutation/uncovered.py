@@ -0,0 +1,15 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+OFFSET = 1
+
+
+def covered(value):
+    return value + OFFSET
+
+
+def uncovered(value):
+    return value * 2
@@ -0,0 +1,93 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import random
+import sys
+
+import pytest
+
+from pynguin.ga.operators.ranking.crowdingdistance import (
+    fast_epsilon_dominance_assignment,
+)
+from pynguin.utils.orderedset import OrderedSet
+
+
+# Turn this up for more precise measurements.
+BENCHMARK_REPETITIONS = 1
+
+
+class _Solution:
+    def __init__(self, fitness: dict):
+        self.get_fitness_for = fitness.__getitem__
+        self.distance = 0.0
+
+
+def _reference_assignment(front, goals) -> None:
+    # The assignment before it used the fitness matrix.
+    for test in front:
+        test.distance = 0
+
+    for goal in goals:
+        minimum = sys.float_info.max
+        min_set = []
+        maximum = 0.0
+        for test in front:
+            value = test.get_fitness_for(goal)
+            if value < minimum:
+                minimum = value
+                min_set.clear()
+                min_set.append(test)
+            elif value == minimum:
+                min_set.append(test)
+
+            if value > maximum:
+                maximum = value
+
+        if maximum == minimum:
+            continue
+
+        for test in min_set:
+            numerator = len(front) - len(min_set)
+            denominator = len(front)
+            test.distance = max(test.distance, numerator / denominator)
+
+
+@pytest.fixture(scope="module", params=[(50, 100), (50, 5000), (500, 100), (500, 5000)])
+def benchmark_front(request):
+    """Create a front of solutions, whose fitness values for the goals often tie,
+    together with their distances."""
+    population, number_of_goals = request.param
+    rng = random.Random(42)
+    goals = OrderedSet(object() for _ in range(number_of_goals))
+    values = [0.0, 0.0, 0.5, 1.0, 2.0]
+    front = [
+        _Solution({goal: rng.choice(values) for goal in goals})
+        for _ in range(population)
+    ]
+    _reference_assignment(front, goals)
+    return front, goals, [test.distance for test in front]
+
+
+def test_benchmark_reference_assignment(benchmark_front):
+    front, goals, expected = benchmark_front
+    for _ in range(BENCHMARK_REPETITIONS):
+        _reference_assignment(front, goals)
+    assert [test.distance for test in front] == expected
+
+
+def test_benchmark_fast_epsilon_dominance_assignment(benchmark_front):
+    front, goals, expected = benchmark_front
+    for _ in range(BENCHMARK_REPETITIONS):
+        fast_epsilon_dominance_assignment(front, goals)
+    assert [test.distance for test in front] == expected
+
+
+def test_benchmark_fast_epsilon_dominance_assignment_with_fitness(benchmark_front):
+    front, goals, expected = benchmark_front
+    fitness = [tuple(test.get_fitness_for(goal) for goal in goals) for test in front]
+    for _ in range(BENCHMARK_REPETITIONS):
+        fast_epsilon_dominance_assignment(front, goals, fitness)
+    assert [test.distance for test in front] == expected
@@ -0,0 +1,64 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.ga.chromosome as chrom
+
+from pynguin.ga.operators.ranking.crowdingdistance import (
+    fast_epsilon_dominance_assignment,
+)
+from pynguin.ga.operators.ranking.crowdingdistance import select_by_distance
+from pynguin.utils.orderedset import OrderedSet
+
+
+def _chromosome(fitness: dict):
+    chromosome = MagicMock(chrom.Chromosome)
+    chromosome.get_fitness_for.side_effect = fitness.__getitem__
+    return chromosome
+
+
+@pytest.fixture
+def goals():
+    return OrderedSet([MagicMock(), MagicMock(), MagicMock()])
+
+
+@pytest.fixture
+def front(goals):
+    goal_1, goal_2, goal_3 = goals
+    return [
+        _chromosome({goal_1: 0.0, goal_2: 1.0, goal_3: 1.0}),
+        _chromosome({goal_1: 0.0, goal_2: 2.0, goal_3: 1.0}),
+        _chromosome({goal_1: 1.0, goal_2: 0.5, goal_3: 1.0}),
+        _chromosome({goal_1: 2.0, goal_2: 3.0, goal_3: 1.0}),
+    ]
+
+
+def test_fast_epsilon_dominance_assignment(front, goals):
+    fast_epsilon_dominance_assignment(front, goals)
+    assert [test.distance for test in front] == [0.5, 0.5, 0.75, 0.0]
+
+
+def test_fast_epsilon_dominance_assignment_with_fitness(front, goals):
+    fitness = [tuple(test.get_fitness_for(goal) for goal in goals) for test in front]
+    for test in front:
+        test.get_fitness_for.reset_mock()
+    fast_epsilon_dominance_assignment(front, goals, fitness)
+    assert [test.distance for test in front] == [0.5, 0.5, 0.75, 0.0]
+    for test in front:
+        test.get_fitness_for.assert_not_called()
+
+
+def test_fast_epsilon_dominance_assignment_no_goals(front):
+    fast_epsilon_dominance_assignment(front, OrderedSet())
+    assert [test.distance for test in front] == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_select_by_distance():
+    front = [MagicMock(distance=distance) for distance in (0.5, 0.0, 0.75, 0.5)]
+    assert select_by_distance(front, 3) == [front[2], front[0], front[3]]
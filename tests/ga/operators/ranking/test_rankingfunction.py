@@ -4,6 +4,9 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import random
+
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
@@ -11,9 +14,14 @@ import pytest
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
 
+from pynguin.ga.comparators.dominancecomparator import DominanceComparator
+from pynguin.ga.comparators.preferencesortingcomparator import (
+    PreferenceSortingComparator,
+)
 from pynguin.ga.operators.ranking.rankingfunction import RankBasedPreferenceSorting
 from pynguin.ga.operators.ranking.rankingfunction import RankedFronts
 from pynguin.ga.operators.ranking.rankingfunction import RankingFunction
+from pynguin.utils.orderedset import OrderedSet
 
 
 @pytest.fixture
@@ -40,6 +48,19 @@ def test_get_sub_front(fronts, rank, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "fitness, rank, expected",
+    [
+        pytest.param(None, 0, None),
+        pytest.param([[(1.0,)]], 0, [(1.0,)]),
+        pytest.param([[(1.0,)]], 1, []),
+    ],
+)
+def test_get_sub_front_fitness(fitness, rank, expected):
+    ranked_fronts = RankedFronts(fronts=[[chromosome_mock]], fitness=fitness)
+    assert ranked_fronts.get_sub_front_fitness(rank) == expected
+
+
 def test_get_number_of_sub_fronts_when_none():
     ranked_fronts = RankedFronts(fronts=None)
     with pytest.raises(AssertionError):
@@ -61,7 +82,10 @@ def test_compute_ranking_assignment(ranking_function):
     chromosome_2 = MagicMock(chrom.Chromosome)
     chromosome_3 = MagicMock(chrom.Chromosome)
     solutions = [chromosome_1, chromosome_2, chromosome_3]
-    expected = RankedFronts(fronts=[[chromosome_1], [chromosome_2, chromosome_3]])
+    expected = RankedFronts(
+        fronts=[[chromosome_1], [chromosome_2, chromosome_3]],
+        fitness=[[()], [(), ()]],
+    )
 
     def _get_zero_front(sol, _):
         return sol[:1]
@@ -71,3 +95,117 @@ def test_compute_ranking_assignment(ranking_function):
 
     result = ranking_function.compute_ranking_assignment(solutions, set())
     assert result == expected
+
+
+def _chromosome(fitness: dict, length: int = 1):
+    chromosome = MagicMock(chrom.Chromosome)
+    chromosome.get_fitness_for.side_effect = fitness.__getitem__
+    chromosome.length.return_value = length
+    return chromosome
+
+
+def test_get_zero_front(ranking_function):
+    goal_1 = MagicMock()
+    goal_2 = MagicMock()
+    chromosome_1 = _chromosome({goal_1: 0.0, goal_2: 2.0}, 3)
+    chromosome_2 = _chromosome({goal_1: 0.0, goal_2: 1.0}, 2)
+    chromosome_3 = _chromosome({goal_1: 1.0, goal_2: 1.0}, 1)
+    solutions = [chromosome_1, chromosome_2, chromosome_3]
+    zero_front = ranking_function._get_zero_front(
+        solutions,
+        [
+            (solution.get_fitness_for(goal_1), solution.get_fitness_for(goal_2))
+            for solution in solutions
+        ],
+    )
+    assert zero_front == [chromosome_2, chromosome_3]
+    assert chromosome_2.rank == 0
+
+
+def _greedy_non_dominated_fronts(solutions, goals, limit):
+    # The previous implementation, which compares the solutions of a front again
+    # for each front.
+    comparator = DominanceComparator(goals=goals)
+    remaining = list(solutions)
+    fronts = []
+    while sum(len(front) for front in fronts) < limit and remaining:
+        front = []
+        for solution in remaining:
+            dominated = [
+                best for best in front if comparator.compare(solution, best) < 0
+            ]
+            if any(comparator.compare(solution, best) > 0 for best in front):
+                continue
+            front = [best for best in front if best not in dominated] + [solution]
+        fronts.append(front)
+        remaining = [solution for solution in remaining if solution not in front]
+    return fronts
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_get_non_dominated_fronts(seed):
+    rng = random.Random(seed)
+    goals = OrderedSet(MagicMock() for _ in range(3))
+    solutions = [
+        _chromosome({goal: float(rng.randint(0, 3)) for goal in goals})
+        for _ in range(30)
+    ]
+    fitness = [
+        tuple(solution.get_fitness_for(goal) for goal in goals)
+        for solution in solutions
+    ]
+    for limit in (1, 10, 30):
+        fronts = RankBasedPreferenceSorting._get_non_dominated_fronts(fitness, limit)
+        assert [
+            [solutions[index] for index in front] for front in fronts
+        ] == _greedy_non_dominated_fronts(solutions, goals, limit)
+
+
+def test_compute_ranking_assignment_keeps_equal_solutions(ranking_function):
+    goal = MagicMock()
+    chromosome_1 = _chromosome({goal: 0.0})
+    chromosome_2 = _chromosome({goal: 1.0})
+    chromosome_3 = _chromosome({goal: 1.0})
+    # All chromosomes are equal, but only the best is in the zero front.
+    chromosome_1.__eq__ = chromosome_2.__eq__ = chromosome_3.__eq__ = lambda *_: True
+    config.configuration.search_algorithm.population = 3
+    result = ranking_function.compute_ranking_assignment(
+        [chromosome_2, chromosome_1, chromosome_3], OrderedSet([goal])
+    )
+    assert result.fronts == [[chromosome_1], [chromosome_2, chromosome_3]]
+    assert (chromosome_1.rank, chromosome_2.rank, chromosome_3.rank) == (0, 1, 1)
+    assert result.fitness == [[(0.0,)], [(1.0,), (1.0,)]]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_get_zero_front_selects_like_preference_sorting(seed):
+    rng = random.Random(seed)
+    goals = OrderedSet(MagicMock() for _ in range(4))
+    solutions = [
+        _chromosome(
+            {goal: float(rng.randint(0, 2)) for goal in goals}, rng.randint(1, 2)
+        )
+        for _ in range(20)
+    ]
+    fitness = [
+        tuple(solution.get_fitness_for(goal) for goal in goals)
+        for solution in solutions
+    ]
+    expected = OrderedSet()
+    with mock.patch("pynguin.utils.randomness.next_bool") as next_bool:
+        next_bool.side_effect = [True, False] * 100
+        for goal in goals:
+            comparator = PreferenceSortingComparator(goal)
+            best = None
+            for solution in solutions:
+                flag = comparator.compare(solution, best)
+                if flag < 0 or (flag == 0 and next_bool()):
+                    best = solution
+            expected.add(best)
+        expected_draws = next_bool.call_count
+        next_bool.reset_mock(side_effect=True)
+        next_bool.side_effect = [True, False] * 100
+        assert RankBasedPreferenceSorting._get_zero_front(solutions, fitness) == list(
+            expected
+        )
+        assert next_bool.call_count == expected_draws
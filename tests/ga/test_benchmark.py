@@ -0,0 +1,66 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.configuration as config
+import pynguin.ga.testcasechromosome as tcc
+import pynguin.ga.testsuitechromosome as tsc
+import pynguin.testcase.defaulttestcase as dtc
+import pynguin.testcase.statement as stmt
+
+from pynguin.analyses.module import ModuleTestCluster
+
+
+# Number of primitive statements of each test case.
+NUMBER_OF_STATEMENTS = 30
+
+# Turn this up for more precise measurements.
+BENCHMARK_REPETITIONS = 2
+
+
+@pytest.fixture
+def benchmark_suite():
+    """Create a test suite with several test cases of many statements."""
+    test_factory = MagicMock()
+    test_factory.has_call_on_sut.return_value = True
+    suite = tsc.TestSuiteChromosome(test_case_chromosome_factory=MagicMock())
+    for _ in range(10):
+        test_case = dtc.DefaultTestCase(ModuleTestCluster(0))
+        for value in range(NUMBER_OF_STATEMENTS):
+            test_case.add_statement(stmt.IntPrimitiveStatement(test_case, value))
+        suite.add_test_case_chromosome(
+            tcc.TestCaseChromosome(test_case, test_factory=test_factory)
+        )
+    return suite
+
+
+def test_benchmark_clone_and_mutate_test_case(benchmark_suite):
+    # Only change statements, as the test factory is mocked.
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 0.0
+    parent = benchmark_suite.get_test_case_chromosome(0)
+    for _ in range(BENCHMARK_REPETITIONS):
+        offspring = parent.clone()
+        offspring.mutate()
+        assert offspring.size() == NUMBER_OF_STATEMENTS
+    assert [statement.value for statement in parent.test_case.statements] == list(
+        range(NUMBER_OF_STATEMENTS)
+    )
+
+
+def test_benchmark_clone_and_mutate_test_suite(benchmark_suite):
+    config.configuration.search_algorithm.test_insertion_probability = 0.0
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 0.0
+    expected = benchmark_suite.clone()
+    for _ in range(BENCHMARK_REPETITIONS):
+        offspring = benchmark_suite.clone()
+        offspring.mutate()
+        assert offspring.size() == benchmark_suite.size()
+    assert benchmark_suite == expected
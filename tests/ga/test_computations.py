@@ -166,7 +166,7 @@ def test_run_test_suite_chromosome():
     result0 = MagicMock()
     result1 = MagicMock()
     result2 = MagicMock()
-    executor.execute.side_effect = [result0, result1]
+    executor.execute_many.return_value = [result0, result1]
     ff = DummyTestSuiteChromosomeComputation(executor)
     indiv = tsc.TestSuiteChromosome()
     test_case0 = tcc.TestCaseChromosome(MagicMock())
@@ -182,6 +182,9 @@ def test_run_test_suite_chromosome():
     assert ff._run_test_suite_chromosome(indiv) == [result0, result1, result2]
     assert test_case0.get_last_execution_result() == result0
     assert test_case1.get_last_execution_result() == result1
+    executor.execute_many.assert_called_once_with(
+        [test_case0.test_case, test_case1.test_case]
+    )
 
 
 def test_run_test_suite_chromosome_cache():
@@ -189,7 +192,7 @@ def test_run_test_suite_chromosome_cache():
     result0 = MagicMock()
     result1 = MagicMock()
     result2 = MagicMock()
-    executor.execute.side_effect = [result0, result1]
+    executor.execute_many.return_value = [result0, result1]
     func = DummyTestSuiteChromosomeComputation(executor)
     indiv = tsc.TestSuiteChromosome()
     # Executed because it was changed.
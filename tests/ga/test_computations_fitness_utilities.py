@@ -225,8 +225,8 @@ def test_assertion_checked_coverage_half_covered(subject_properties_mock, trace_
     mock_instr_1.lineno = 0
     mock_instr_1.code_object_id = 0
     mock_instr_1.file = "foo"
-    with patch.object(AssertionSlicer, "slice_assertion") as slice_mock:
-        slice_mock.return_value = [mock_instr_1]
+    with patch.object(AssertionSlicer, "slice_assertions") as slice_mock:
+        slice_mock.return_value = [[mock_instr_1]]
         assert (
             ff.compute_assertion_checked_coverage(trace_mock, subject_properties_mock)
             == 0.5
@@ -248,8 +248,8 @@ def test_assertion_checked_coverage_fully_covered(subject_properties_mock, trace
     mock_instr_2.lineno = 1
     mock_instr_2.code_object_id = 0
     mock_instr_2.file = "foo"
-    with patch.object(AssertionSlicer, "slice_assertion") as slice_mock:
-        slice_mock.return_value = [mock_instr_1, mock_instr_2]
+    with patch.object(AssertionSlicer, "slice_assertions") as slice_mock:
+        slice_mock.return_value = [[mock_instr_1, mock_instr_2]]
         assert (
             ff.compute_assertion_checked_coverage(trace_mock, subject_properties_mock)
             == 1
@@ -274,10 +274,10 @@ def test_statement_checked_coverage_half_covered(subject_properties_mock, trace_
     mock_instr_1.file = "foo"
     statement = MagicMock()
     statements = [statement]
-    with patch.object(DynamicSlicer, "slice") as slice_mock:
+    with patch.object(DynamicSlicer, "slice_criteria") as slice_mock:
         with patch.object(statement, "get_position") as position_mock:
             position_mock.return_value = 1
-            slice_mock.return_value = [mock_instr_1]
+            slice_mock.return_value = [[mock_instr_1]]
             assert ff.compute_statement_checked_lines(
                 statements, trace_mock, subject_properties_mock, {1: MagicMock()}
             ) == {0}
@@ -299,10 +299,10 @@ def test_statement_checked_coverage_fully_covered(subject_properties_mock, trace
 
     statement = MagicMock()
     statements = [statement]
-    with patch.object(DynamicSlicer, "slice") as slice_mock:
+    with patch.object(DynamicSlicer, "slice_criteria") as slice_mock:
         with patch.object(statement, "get_position") as position_mock:
             position_mock.return_value = 1
-            slice_mock.return_value = [mock_instr_1, mock_instr_2]
+            slice_mock.return_value = [[mock_instr_1, mock_instr_2]]
             assert ff.compute_statement_checked_lines(
                 statements, trace_mock, subject_properties_mock, {1: MagicMock()}
             ) == {0, 1}
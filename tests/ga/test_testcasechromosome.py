@@ -240,6 +240,23 @@ def test_mutate_chop(test_case_chromosome_with_test):
             assert factory_mock.has_call_on_sut.call_count == 1
 
 
+def test_mutate_chop_shared(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    for i in range(50):
+        test_case.add_statement(IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 0.0
+    with mock.patch.object(clone, "get_last_mutatable_statement") as mut_mock:
+        mut_mock.return_value = 5
+        with mock.patch.object(clone, "_test_factory") as factory_mock:
+            factory_mock.has_call_on_sut.return_value = True
+            clone.mutate()
+    assert clone.size() == 6
+    assert len(test_case.statements) == 50
+
+
 def test_mutate_no_chop(test_case_chromosome_with_test):
     chromosome, test_case = test_case_chromosome_with_test
     for i in range(50):
@@ -284,6 +301,74 @@ def test_mutate_all(test_case_chromosome, func, rand, result):
                 mock_func.assert_called_once()
 
 
+def test_clone_shares_test_case(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    assert clone._test_case is test_case
+    assert clone == chromosome
+    assert clone.test_case is not test_case
+    assert clone.test_case == test_case
+    # The origin is the last chromosome that holds the test case.
+    assert chromosome.test_case is test_case
+
+
+def test_read_only_test_case_is_not_cloned(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    clone = chromosome.clone()
+    with mock.patch.object(test_case, "clone") as clone_mock:
+        assert clone.read_only_test_case is test_case
+        assert chromosome.read_only_test_case is test_case
+        clone_mock.assert_not_called()
+    assert clone._test_case_owners.count == 2
+
+
+def test_last_holder_does_not_clone(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    clones = [chromosome.clone(), chromosome.clone()]
+    for clone in clones:
+        clone.test_case.add_statement(IntPrimitiveStatement(clone.test_case, 5))
+    with mock.patch.object(test_case, "clone") as clone_mock:
+        assert chromosome.test_case is test_case
+        clone_mock.assert_not_called()
+    assert test_case.size() == 0
+    assert [clone.size() for clone in clones] == [1, 1]
+
+
+def test_mutate_clone_copies_test_case(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 1.0
+    with mock.patch.object(clone, "_test_factory") as factory_mock:
+        factory_mock.has_call_on_sut.return_value = True
+        with mock.patch.object(test_case, "clone", wraps=test_case.clone) as clone_mock:
+            clone.mutate()
+            # The shared test case serves as backup.
+            clone_mock.assert_called_once_with()
+    assert clone.changed
+    assert test_case.statements[0].value == 5
+    assert clone._test_case.statements[0].value != 5
+
+
+def test_mutate_restores_shared_backup(test_case_chromosome_with_test):
+    chromosome, test_case = test_case_chromosome_with_test
+    test_case.add_statement(IntPrimitiveStatement(test_case, 5))
+    clone = chromosome.clone()
+    config.configuration.search_algorithm.test_insert_probability = 0.0
+    config.configuration.search_algorithm.test_delete_probability = 0.0
+    config.configuration.search_algorithm.test_change_probability = 1.0
+    with mock.patch.object(clone, "_test_factory") as factory_mock:
+        factory_mock.has_call_on_sut.return_value = False
+        factory_mock.insert_random_statement.return_value = -1
+        clone.mutate()
+    assert clone._test_case is not test_case
+    assert clone._test_case == test_case
+    assert clone._test_case_owners.count == 1
+
+
 def test_crossover_wrong_type(test_case_chromosome):
     with pytest.raises(AssertionError):
         test_case_chromosome.cross_over(MagicMock(), 0, 0)
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+import pynguin.coverage.branchgoals as bg
 import pynguin.ga.computations as ff
 import pynguin.ga.testcasechromosome as tcc
 
@@ -16,6 +17,8 @@ from pynguin.generation.algorithms.archive import CoverageArchive
 from pynguin.generation.algorithms.archive import MIOArchive
 from pynguin.generation.algorithms.archive import MIOPopulation
 from pynguin.generation.algorithms.archive import MIOPopulationPair
+from pynguin.testcase.execution import ExecutionResult
+from pynguin.testcase.execution import ExecutionTrace
 from pynguin.utils.orderedset import OrderedSet
 
 
@@ -73,6 +76,67 @@ def test_update_solution(objectives, chromosomes):
     assert chromosomes[1].get_is_covered.call_count == 4
 
 
+def _line_chromosome(size: int, line_ids) -> tcc.TestCaseChromosome:
+    chromosome = MagicMock(tcc.TestCaseChromosome)
+    chromosome.size.return_value = size
+    chromosome.changed = False
+    trace = ExecutionTrace()
+    trace.covered_line_ids.update(line_ids)
+    result = ExecutionResult()
+    result.execution_trace = trace
+    chromosome.get_last_execution_result.return_value = result
+    chromosome.get_is_covered.side_effect = lambda objective: (
+        objective.goal.line_id in line_ids
+    )
+    return chromosome
+
+
+def test_update_indexed_objectives():
+    executor = MagicMock()
+    objectives = OrderedSet(
+        bg.LineCoverageTestFitness(executor, bg.LineCoverageGoal(0, line_id))
+        for line_id in range(4)
+    )
+    archive = CoverageArchive(objectives)
+    covered = []
+    archive.add_on_target_covered(covered.append)
+    long_chromosome = _line_chromosome(3, {3, 1})
+    short_chromosome = _line_chromosome(2, {1, 2})
+    other_chromosome = _line_chromosome(2, {2})
+    assert archive.update([long_chromosome, short_chromosome, other_chromosome])
+    # The covered objectives are looked up in the execution traces.
+    long_chromosome.get_is_covered.assert_not_called()
+    objective_0, objective_1, objective_2, objective_3 = objectives
+    assert covered == [objective_1, objective_2, objective_3]
+    assert archive.uncovered_goals == OrderedSet([objective_0])
+    assert archive.solutions == OrderedSet([short_chromosome, long_chromosome])
+
+    assert not archive.update([_line_chromosome(2, {1, 2})])
+    newest_chromosome = _line_chromosome(1, {0, 3})
+    assert archive.update([newest_chromosome])
+    assert covered == [objective_1, objective_2, objective_3, objective_0]
+    assert archive.solutions == OrderedSet([short_chromosome, newest_chromosome])
+
+
+def test_update_indexed_objectives_changed_solution():
+    objective = bg.LineCoverageTestFitness(MagicMock(), bg.LineCoverageGoal(0, 0))
+    archive = CoverageArchive(OrderedSet([objective]))
+    chromosome = _line_chromosome(1, {0})
+    chromosome.changed = True
+    assert archive.update([chromosome])
+    chromosome.get_is_covered.assert_called_with(objective)
+
+
+def test_reset_indexed_objectives():
+    objective = bg.LineCoverageTestFitness(MagicMock(), bg.LineCoverageGoal(0, 0))
+    archive = CoverageArchive(OrderedSet([objective]))
+    archive.update([_line_chromosome(1, {0})])
+    archive.reset()
+    chromosome = _line_chromosome(2, {0})
+    assert archive.update([chromosome])
+    assert archive.solutions == OrderedSet([chromosome])
+
+
 def test_population_pair():
     pair = MIOPopulationPair(0.5, MagicMock())
     assert pair == pair
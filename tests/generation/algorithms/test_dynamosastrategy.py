@@ -4,17 +4,21 @@
 #
 #  SPDX-License-Identifier: MIT
 import importlib
+import random
 
 from unittest.mock import MagicMock
 
 import pytest
 
 import pynguin.coverage.branchgoals as bg
+import pynguin.ga.testcasechromosome as tcc
 import pynguin.generation.algorithms.dynamosastrategy as dyna
 
+from pynguin.generation.algorithms.archive import CoverageArchive
 from pynguin.instrumentation.instrumentation import BranchCoverageInstrumentation
 from pynguin.instrumentation.instrumentation import InstrumentationTransformer
 from pynguin.testcase.execution import ExecutionTracer
+from pynguin.utils.orderedset import OrderedSet
 
 
 @pytest.fixture
@@ -78,3 +82,81 @@ def test_fitness_graph_nested(subject_properties_nested):
         bg.BranchlessCodeObjectGoal(0),
         bg.BranchlessCodeObjectGoal(1),
     }
+
+
+def _solution(covered_goals):
+    solution = MagicMock(tcc.TestCaseChromosome)
+    solution.changed = True
+    solution.size.return_value = 1
+    solution.get_is_covered.side_effect = lambda fitness: fitness.goal in covered_goals
+    return solution
+
+
+def _update_goals(graph, archive, current_goals, solutions):
+    # The update of the goals manager, which walks all current goals again as
+    # long as new goals are added.
+    new_goals_added = True
+    while new_goals_added:
+        archive.update(solutions)
+        covered = archive.covered_goals
+        new_goals = OrderedSet()
+        new_goals_added = False
+        for old_goal in current_goals:
+            if old_goal in covered:
+                for child in graph.get_structural_children(old_goal):
+                    if child not in current_goals and child not in covered:
+                        new_goals.add(child)
+                        new_goals_added = True
+            else:
+                new_goals.add(old_goal)
+        current_goals = new_goals
+        archive.add_goals(current_goals)
+    return current_goals
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_goals_manager_update(subject_properties, seed):
+    rng = random.Random(seed)
+    pool = bg.BranchGoalPool(subject_properties)
+    ffs = bg.create_branch_coverage_fitness_functions(MagicMock(), pool)
+    goals = [ff.goal for ff in ffs]
+    manager = dyna._GoalsManager(ffs, CoverageArchive(OrderedSet()), subject_properties)
+    graph = dyna._BranchFitnessGraph(ffs, subject_properties)
+    archive = CoverageArchive(OrderedSet())
+    current_goals = graph.root_branches
+    archive.add_goals(current_goals)
+    for _ in range(4):
+        solutions = [_solution(set(rng.sample(goals, 2))) for _ in range(2)]
+        manager.update(solutions)
+        current_goals = _update_goals(graph, archive, current_goals, solutions)
+        assert list(manager.current_goals) == list(current_goals)
+
+
+def test_goals_manager_update_without_new_coverage(subject_properties):
+    pool = bg.BranchGoalPool(subject_properties)
+    ffs = bg.create_branch_coverage_fitness_functions(MagicMock(), pool)
+    manager = dyna._GoalsManager(ffs, CoverageArchive(OrderedSet()), subject_properties)
+    current_goals = manager.current_goals
+    manager.update([_solution(set())])
+    assert manager.current_goals is current_goals
+
+
+def test_goals_manager_update_adds_children(subject_properties):
+    pool = bg.BranchGoalPool(subject_properties)
+    ffs = bg.create_branch_coverage_fitness_functions(MagicMock(), pool)
+    archive = CoverageArchive(OrderedSet())
+    manager = dyna._GoalsManager(ffs, archive, subject_properties)
+    # Covers the children of the true branch of predicate 3 as well.
+    manager.update([_solution({bg.BranchGoal(0, 3, True), bg.BranchGoal(0, 2, True)})])
+    assert [ff.goal for ff in manager.current_goals] == [
+        bg.BranchGoal(0, 1, True),
+        bg.BranchGoal(0, 1, False),
+        bg.BranchGoal(0, 0, True),
+        bg.BranchGoal(0, 0, False),
+        bg.BranchGoal(0, 2, False),
+        bg.BranchGoal(0, 3, False),
+    ]
+    assert [ff.goal for ff in archive.covered_goals] == [
+        bg.BranchGoal(0, 3, True),
+        bg.BranchGoal(0, 2, True),
+    ]
@@ -11,6 +11,7 @@ from pynguin.generation.algorithms.testgenerationstrategy import TestGenerationS
 from pynguin.generation.stoppingconditions.stoppingcondition import (
     MaxStatementExecutionsStoppingCondition,
 )
+from pynguin.testcase.execution import ExecutionResult
 
 
 class DummyTestStrategy(TestGenerationStrategy):
@@ -22,7 +23,9 @@ def test_progress():
     strategy = DummyTestStrategy()
     stopping = MaxStatementExecutionsStoppingCondition(100)
     stopping.set_limit(10)
-    stopping.before_statement_execution(None, None, None)
+    result = ExecutionResult()
+    result.executed_statements = 1
+    stopping.after_test_case_execution_outside_thread(MagicMock(), result)
     strategy.stopping_conditions = [stopping]
     assert strategy.progress() == 0.1
 
@@ -4,11 +4,14 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+from unittest.mock import MagicMock
+
 import pytest
 
 from pynguin.generation.stoppingconditions.stoppingcondition import (
     MaxStatementExecutionsStoppingCondition,
 )
+from pynguin.testcase.execution import ExecutionResult
 
 
 @pytest.fixture
@@ -20,14 +23,20 @@ def test_current_value(stopping_condition):
     assert stopping_condition.current_value() == 0
 
 
+def _result(executed_statements: int) -> ExecutionResult:
+    result = ExecutionResult()
+    result.executed_statements = executed_statements
+    return result
+
+
 def test_current_value_reset(stopping_condition):
-    stopping_condition.before_statement_execution(None, None, None)
+    stopping_condition.after_test_case_execution_outside_thread(MagicMock(), _result(1))
     stopping_condition.reset()
     assert stopping_condition.current_value() == 0
 
 
 def test_before_search_start(stopping_condition):
-    stopping_condition.before_statement_execution(None, None, None)
+    stopping_condition.after_test_case_execution_outside_thread(MagicMock(), _result(1))
     stopping_condition.before_search_start(None)
     assert stopping_condition.current_value() == 0
 
@@ -43,7 +52,17 @@ def test_is_not_fulfilled(stopping_condition):
 
 def test_is_fulfilled(stopping_condition):
     stopping_condition.set_limit(3)
-    stopping_condition.before_statement_execution(None, None, None)
-    stopping_condition.before_statement_execution(None, None, None)
-    stopping_condition.before_statement_execution(None, None, None)
+    stopping_condition.after_test_case_execution_outside_thread(MagicMock(), _result(3))
     assert stopping_condition.is_fulfilled()
+
+
+def test_counts_executed_statements(stopping_condition):
+    stopping_condition.after_test_case_execution_outside_thread(MagicMock(), _result(2))
+    assert stopping_condition.current_value() == 2
+
+
+def test_does_not_count_reused_result(stopping_condition):
+    result = _result(3)
+    result.reused = True
+    stopping_condition.after_test_case_execution_outside_thread(MagicMock(), result)
+    assert stopping_condition.current_value() == 0
@@ -9,6 +9,7 @@ import pytest
 from pynguin.generation.stoppingconditions.stoppingcondition import (
     MaxTestExecutionsStoppingCondition,
 )
+from pynguin.testcase.execution import ExecutionResult
 
 
 @pytest.fixture
@@ -28,6 +29,13 @@ def test_is_not_fulfilled(stopping_condition):
 
 def test_is_fulfilled(stopping_condition):
     stopping_condition.set_limit(1)
-    stopping_condition.before_test_case_execution(None)
-    stopping_condition.before_test_case_execution(None)
+    stopping_condition.after_test_case_execution_outside_thread(None, ExecutionResult())
+    stopping_condition.after_test_case_execution_outside_thread(None, ExecutionResult())
     assert stopping_condition.is_fulfilled()
+
+
+def test_does_not_count_reused_result(stopping_condition):
+    result = ExecutionResult()
+    result.reused = True
+    stopping_condition.after_test_case_execution_outside_thread(None, result)
+    assert stopping_condition.current_value() == 0
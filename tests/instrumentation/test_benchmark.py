@@ -0,0 +1,46 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import pytest
+
+from pynguin.instrumentation.instrumentation import InstrumentationTransformer
+from pynguin.instrumentation.instrumentation import LineCoverageInstrumentation
+from pynguin.testcase.execution import ExecutionTracer
+
+
+# Turn this up for more precise measurements, e.g., to 200 for a module with 20,000
+# lines.  Each repetition adds a function with 100 lines, including its definition.
+BENCHMARK_REPETITIONS = 2
+NUMBER_OF_LINES = 100 * BENCHMARK_REPETITIONS
+
+
+@pytest.fixture(scope="module")
+def large_module_code():
+    """Compile a synthetic module with many lines."""
+    functions = []
+    for function in range(NUMBER_OF_LINES // 100):
+        body = "".join(f"    var_{line} = {line}\n" for line in range(98))
+        functions.append(f"def function_{function}():\n{body}    return var_0\n")
+    return compile("".join(functions), "large_module.py", "exec")
+
+
+def test_benchmark_register_lines(large_module_code):
+    tracer = ExecutionTracer()
+    transformer = InstrumentationTransformer(
+        tracer, [LineCoverageInstrumentation(tracer)]
+    )
+    transformer.instrument_module(large_module_code)
+    existing_lines = tracer.get_subject_properties().existing_lines
+    assert len(existing_lines) == NUMBER_OF_LINES
+    # Registering the lines again, e.g., when instrumenting a mutant, reuses their ids.
+    for line_id, line_meta in list(existing_lines.items()):
+        assert (
+            tracer.register_line(
+                line_meta.code_object_id, line_meta.file_name, line_meta.line_number
+            )
+            == line_id
+        )
+    assert len(existing_lines) == NUMBER_OF_LINES
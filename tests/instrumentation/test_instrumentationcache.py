@@ -0,0 +1,113 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import asyncio
+import importlib
+import threading
+
+from unittest import mock
+
+import pytest
+
+import pynguin.configuration as config
+
+from pynguin.instrumentation.instrumentation import InstrumentationTransformer
+from pynguin.instrumentation.instrumentationcache import InstrumentationCache
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import ExecutionTrace
+from pynguin.testcase.execution import ExecutionTracer
+from tests.instrumentation.test_machinery import run_async_generator
+
+
+MODULE_NAME = "tests.fixtures.instrumentation.mixed"
+
+
+def _import_mixed(cache_dir, coverage_metrics=None) -> tuple[ExecutionTracer, object]:
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(
+        MODULE_NAME,
+        tracer,
+        coverage_metrics=coverage_metrics,
+        instrumentation_cache_dir=str(cache_dir),
+    ):
+        mixed = importlib.reload(importlib.import_module(MODULE_NAME))
+    return tracer, mixed
+
+
+def _execute_mixed(tracer, mixed) -> ExecutionTrace:
+    tracer.init_trace()
+    inst = mixed.TestClass(5)
+    inst.method(5)
+    inst.method_with_nested(5)
+    mixed.function(5)
+    sum(mixed.generator())
+    asyncio.run(mixed.coroutine(5))
+    asyncio.run(run_async_generator(mixed.async_generator()))
+    return tracer.get_trace()
+
+
+@pytest.mark.parametrize(
+    "coverage_metrics",
+    [
+        {config.CoverageMetric.BRANCH},
+        {config.CoverageMetric.LINE, config.CoverageMetric.CHECKED},
+    ],
+)
+def test_cached_instrumentation(tmp_path, coverage_metrics):
+    instrumented_tracer, mixed = _import_mixed(tmp_path, coverage_metrics)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    instrumented_trace = _execute_mixed(instrumented_tracer, mixed)
+    with mock.patch.object(
+        InstrumentationTransformer,
+        "instrument_module",
+        side_effect=AssertionError("Must use the cached instrumentation"),
+    ):
+        tracer, mixed = _import_mixed(tmp_path, coverage_metrics)
+
+    instrumented = instrumented_tracer.get_subject_properties()
+    cached = tracer.get_subject_properties()
+    assert (
+        cached.existing_code_objects.keys() == instrumented.existing_code_objects.keys()
+    )
+    assert cached.existing_predicates == instrumented.existing_predicates
+    assert cached.existing_lines == instrumented.existing_lines
+    assert cached.line_ids == instrumented.line_ids
+    assert cached.branch_less_code_objects == instrumented.branch_less_code_objects
+    # The cached code reports to the new tracer.
+    instrumented_tracer.init_trace()
+    trace = _execute_mixed(tracer, mixed)
+    assert trace.executed_code_objects == instrumented_trace.executed_code_objects
+    assert trace.executed_predicates == instrumented_trace.executed_predicates
+    assert trace.covered_line_ids == instrumented_trace.covered_line_ids
+    assert len(trace.executed_instructions) == len(
+        instrumented_trace.executed_instructions
+    )
+    assert instrumented_tracer.get_trace().executed_code_objects == (
+        instrumented_tracer.import_trace.executed_code_objects
+    )
+
+
+def test_cache_entry_depends_on_coverage_metrics(tmp_path):
+    tracer = ExecutionTracer()
+    source = b"x = 1"
+    branch = InstrumentationCache(tmp_path, tracer, {config.CoverageMetric.BRANCH})
+    line = InstrumentationCache(tmp_path, tracer, {config.CoverageMetric.LINE})
+    assert branch.entry_path("foo", source) != line.entry_path("foo", source)
+    assert branch.entry_path("foo", source) != branch.entry_path("foo", b"x = 2")
+    assert branch.entry_path("foo", source) != branch.entry_path("bar", source)
+
+
+def test_invalid_cache_entry_is_ignored(tmp_path):
+    _import_mixed(tmp_path)
+    (entry,) = tmp_path.glob("*.pickle")
+    entry.write_bytes(b"invalid")
+    tracer, mixed = _import_mixed(tmp_path)
+    assert len(tracer.get_subject_properties().existing_code_objects) > 0
+    assert len(_execute_mixed(tracer, mixed).executed_code_objects) == 10
+    # The invalid entry was replaced.
+    assert entry.read_bytes() != b"invalid"
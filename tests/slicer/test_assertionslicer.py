@@ -339,6 +339,37 @@ def test_slicing_after_test_execution(
         assert checked_lines == expected_lines
 
 
+def test_slice_assertions_equals_single_slices(full_cover_plus_three_test):
+    module_name = "tests.fixtures.linecoverage.plus"
+    config.configuration.statistics_output.coverage_metrics = [
+        config.CoverageMetric.CHECKED
+    ]
+
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer)
+        executor.add_observer(AssertionExecutionObserver(tracer))
+        result = executor.execute(full_cover_plus_three_test)
+
+    trace = result.execution_trace
+    assert len(trace.executed_assertions) == 3
+    assertion_slicer = AssertionSlicer(
+        tracer.get_subject_properties().existing_code_objects
+    )
+    expected = [
+        assertion_slicer.slice_assertion(assertion, trace)
+        for assertion in trace.executed_assertions
+    ]
+    assert assertion_slicer.slice_assertions(trace.executed_assertions, trace) == (
+        expected
+    )
+
+
 @pytest.mark.parametrize(
     "module_name, test_suite_name, expected_coverage",
     [
@@ -0,0 +1,135 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import copy
+import pickle
+import sys
+
+import pytest
+
+from pynguin.slicer.executedinstruction import ExecutedAttributeInstruction
+from pynguin.slicer.executedinstruction import ExecutedCallInstruction
+from pynguin.slicer.executedinstruction import ExecutedControlInstruction
+from pynguin.slicer.executedinstruction import ExecutedInstruction
+from pynguin.slicer.executedinstruction import ExecutedInstructionLog
+from pynguin.slicer.executedinstruction import ExecutedMemoryInstruction
+from pynguin.slicer.executedinstruction import ExecutedReturnInstruction
+
+
+@pytest.fixture
+def instructions() -> list[ExecutedInstruction]:
+    return [
+        ExecutedInstruction("foo.py", 0, 1, 100, None, 3, 4),
+        ExecutedMemoryInstruction("foo.py", 0, 1, 90, "x", 3, 6, 0x7F00, True, False),
+        ExecutedMemoryInstruction("bar.py", 1, 2, 101, None, 5, 8, 0, False, True),
+        ExecutedAttributeInstruction(
+            "bar.py", 1, 2, 106, "attr", 6, 10, 0x7F10, -1, False
+        ),
+        ExecutedControlInstruction("foo.py", 0, 3, 114, 12, 7, 12),
+        ExecutedCallInstruction("foo.py", 0, 3, 171, 2, 8, 14),
+        ExecutedReturnInstruction("bar.py", 1, 4, 83, None, 9, 16),
+    ]
+
+
+def test_log_materialises_instructions(instructions):
+    log = ExecutedInstructionLog(instructions)
+    assert len(log) == len(instructions)
+    assert list(log) == instructions
+    assert [type(instr) for instr in log] == [type(instr) for instr in instructions]
+    assert list(reversed(log)) == instructions[::-1]
+    assert log[-1] == instructions[-1]
+    assert log[1:3] == instructions[1:3]
+
+
+def test_log_equals_list(instructions):
+    log = ExecutedInstructionLog(instructions)
+    assert log == instructions
+    assert instructions == log
+    assert log != instructions[:-1]
+
+
+@pytest.mark.parametrize("index", [7, -8])
+def test_log_index_out_of_range(instructions, index):
+    log = ExecutedInstructionLog(instructions)
+    with pytest.raises(IndexError):
+        log[index]  # pylint: disable=pointless-statement
+
+
+def test_log_keeps_irregular_instructions(instructions):
+    irregular = [
+        ExecutedInstruction("foo.py", 0, 1, 2, 3, 4, 5),
+        ExecutedInstruction("foo.py", 0, 1, 2, None, None, 5),  # type: ignore[arg-type]
+        ExecutedMemoryInstruction(
+            "foo.py", 0, 1, 90, "x", 3, 6, None, True, False  # type: ignore[arg-type]
+        ),
+    ]
+    log = ExecutedInstructionLog(irregular + instructions)
+    assert list(log) == irregular + instructions
+    assert log.opcode(1) == 2
+    assert log.node_id(2) == 1
+
+
+def test_log_add_matches_append(instructions):
+    log = ExecutedInstructionLog()
+    log.add(
+        ExecutedAttributeInstruction,
+        "bar.py",
+        1,
+        2,
+        106,
+        "attr",
+        6,
+        10,
+        arg_address=-1,
+        src_address=0x7F10,
+    )
+    assert log == [instructions[3]]
+
+
+def test_log_extend_log(instructions):
+    log = ExecutedInstructionLog(instructions[:3])
+    other = ExecutedInstructionLog(instructions[3:])
+    other.append(ExecutedInstruction("baz.py", 2, 0, 1, 2, 3, 4))
+    log.extend(other)
+    assert log == instructions + [ExecutedInstruction("baz.py", 2, 0, 1, 2, 3, 4)]
+
+
+def test_log_extend_itself(instructions):
+    log = ExecutedInstructionLog(instructions)
+    log.extend(log)
+    assert log == instructions + instructions
+
+
+def test_log_column_accessors(instructions):
+    log = ExecutedInstructionLog(instructions)
+    assert [log.code_object_id(i) for i in range(len(log))] == [
+        instr.code_object_id for instr in instructions
+    ]
+    assert [log.node_id(i) for i in range(len(log))] == [
+        instr.node_id for instr in instructions
+    ]
+    assert [log.opcode(i) for i in range(len(log))] == [
+        instr.opcode for instr in instructions
+    ]
+
+
+def test_log_rindex_opcode(instructions):
+    log = ExecutedInstructionLog(instructions)
+    assert log.rindex_opcode(114) == 4
+    assert log.rindex_opcode(1) == -1
+
+
+def test_log_copy_and_pickle(instructions):
+    log = ExecutedInstructionLog(instructions)
+    assert copy.deepcopy(log) == instructions
+    assert pickle.loads(pickle.dumps(log)) == instructions
+
+
+def test_log_size(instructions):
+    log = ExecutedInstructionLog()
+    empty_size = sys.getsizeof(log)
+    log.extend(instructions * 100)
+    assert sys.getsizeof(log) > empty_size
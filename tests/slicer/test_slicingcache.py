@@ -0,0 +1,117 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import dis
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pynguin.instrumentation.instrumentation import CheckedCoverageInstrumentation
+from pynguin.instrumentation.instrumentation import InstrumentationTransformer
+from pynguin.slicer.dynamicslicer import DynamicSlicer
+from pynguin.slicer.dynamicslicer import SlicingCriterion
+from pynguin.slicer.executionflowbuilder import UniqueInstruction
+from pynguin.slicer.slicingcache import SlicingCache
+from pynguin.slicer.slicingcache import SlicingCacheStatistics
+from pynguin.testcase.execution import ExecutionTrace
+from pynguin.testcase.execution import ExecutionTracer
+from pynguin.utils.exceptions import InstructionNotFoundException
+
+
+def _sliced_function():
+    values = [1, 2]
+    total = 0
+    for value in values:
+        if value > 1:
+            total += value
+    return total
+
+
+def test_locate_in_disassembly():
+    cache = SlicingCache()
+    code_object = _sliced_function.__code__
+    for dis_instr in dis.get_instructions(code_object):
+        assert (
+            cache.locate_in_disassembly(code_object, dis_instr.opcode, dis_instr.offset)
+            == dis_instr
+        )
+    assert cache.statistics.indexed_code_objects == 1
+    assert cache.statistics.reused_disassemblies > 0
+
+
+def test_locate_in_disassembly_not_found():
+    cache = SlicingCache()
+    with pytest.raises(InstructionNotFoundException):
+        cache.locate_in_disassembly(_sliced_function.__code__, dis.opmap["NOP"], 1)
+
+
+def test_get_last_instruction_memoised():
+    cache = SlicingCache()
+    trace = ExecutionTrace()
+    reconstruct = MagicMock()
+    first = cache.get_last_instruction(trace, (0, 1), reconstruct)
+    second = cache.get_last_instruction(trace, (0, 1), reconstruct)
+    assert first is second
+    reconstruct.assert_called_once()
+    assert cache.statistics == SlicingCacheStatistics(
+        reconstructed_instructions=1, reused_reconstructed_instructions=1
+    )
+
+
+def test_get_last_instruction_other_trace():
+    cache = SlicingCache()
+    reconstruct = MagicMock()
+    cache.get_last_instruction(ExecutionTrace(), (0, 1), reconstruct)
+    cache.get_last_instruction(ExecutionTrace(), (0, 1), reconstruct)
+    assert reconstruct.call_count == 2
+
+
+def test_slicing_reuses_reconstructed_execution_flow():
+    tracer = ExecutionTracer()
+    instrumentation = CheckedCoverageInstrumentation(tracer)
+    transformer = InstrumentationTransformer(tracer, [instrumentation])
+
+    def func():
+        values = [1, 2]
+        total = 0
+        for value in values:
+            if value > 1:
+                total += value
+        return total
+
+    func.__code__ = transformer.instrument_module(func.__code__)
+    tracer.current_thread_identifier = threading.current_thread().ident
+    func()
+
+    trace = tracer.get_trace()
+    known_code_objects = tracer.get_subject_properties().existing_code_objects
+    last_traced_instr = trace.executed_instructions[-1]
+    slicing_criterion = SlicingCriterion(
+        UniqueInstruction(
+            last_traced_instr.file,
+            last_traced_instr.name,
+            last_traced_instr.code_object_id,
+            last_traced_instr.node_id,
+            known_code_objects[last_traced_instr.code_object_id],
+            last_traced_instr.offset,
+            lineno=last_traced_instr.lineno,
+        ),
+        len(trace.executed_instructions) - 2,
+    )
+    expected = DynamicSlicer(known_code_objects).slice(trace, slicing_criterion)
+
+    cache = SlicingCache()
+    slicer = DynamicSlicer(known_code_objects, cache)
+    assert slicer.slice(trace, slicing_criterion) == expected
+    reconstructed = cache.statistics.reconstructed_instructions
+    assert reconstructed > 0
+    assert cache.statistics.reused_reconstructed_instructions == 0
+
+    assert slicer.slice(trace, slicing_criterion) == expected
+    assert cache.statistics.reconstructed_instructions == reconstructed
+    assert cache.statistics.reused_reconstructed_instructions == reconstructed
@@ -308,6 +308,40 @@ def test_getter_after_setter(setter_getter_test):
         )
 
 
+def test_slice_criteria_equals_single_slices(setter_getter_test):
+    module_name = "tests.fixtures.linecoverage.setter_getter"
+    config.configuration.statistics_output.coverage_metrics = [
+        config.CoverageMetric.CHECKED,
+    ]
+
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executed = {}
+
+    class CollectingObserver(StatementSlicingObserver):
+        def after_test_case_execution_inside_thread(self, test_case, result):
+            executed["trace"] = result.execution_trace
+            executed["slicing_criteria"] = list(
+                self._slicing_local_state.slicing_criteria.values()
+            )
+
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer)
+        executor.add_observer(CollectingObserver(tracer))
+        executor.execute(setter_getter_test)
+
+    trace = executed["trace"]
+    slicing_criteria = executed["slicing_criteria"]
+    assert len(slicing_criteria) == setter_getter_test.size()
+    slicer = DynamicSlicer(tracer.get_subject_properties().existing_code_objects)
+    expected = [slicer.slice(trace, criterion) for criterion in slicing_criteria]
+    assert slicer.slice_criteria(trace, slicing_criteria) == expected
+    assert slicer.slice_criteria(trace, slicing_criteria[::-1]) == expected[::-1]
+
+
 def test_get_line_id_by_instruction_throws_error():
     instruction_mock = MagicMock(
         code_object_id=0,
@@ -0,0 +1,101 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import ast
+import importlib
+import threading
+
+import pytest
+
+import pynguin.configuration as config
+
+from pynguin.analyses.constants import EmptyConstantProvider
+from pynguin.analyses.module import generate_test_cluster
+from pynguin.analyses.seeding import AstToTestCaseTransformer
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import ExecutionTracer
+from pynguin.testcase.execution import TestCaseExecutor
+
+
+# Turn this up for more precise measurements.  Each repetition executes an offspring
+# of a test case, which changes one of its last statements.
+BENCHMARK_REPETITIONS = 2
+
+# The number of statements of each test case, i.e., the default chromosome length.
+CHROMOSOME_LENGTH = config.SearchAlgorithmConfiguration.chromosome_length
+
+# The number of last statements of the test case that the offspring change.
+MUTATED_STATEMENTS = 10
+
+# The statements that replace the changed ones.
+CHANGED_STATEMENTS = (
+    "bool_changed = queue_0.full()",
+    "bool_changed = queue_0.empty()",
+    "int_changed = queue_0.dequeue()",
+)
+
+
+def _test_case_source(name: str, offspring: int | None) -> str:
+    statements = ["int_0 = 2", "queue_0 = module_0.Queue(int_0)"]
+    for idx in range(CHROMOSOME_LENGTH - 2):
+        if idx % 2 == 0:
+            statements.append(f"bool_{idx} = queue_0.enqueue(int_0)")
+        else:
+            statements.append(f"int_{idx} = queue_0.dequeue()")
+    if offspring is not None:
+        position = CHROMOSOME_LENGTH - MUTATED_STATEMENTS
+        position += offspring % MUTATED_STATEMENTS
+        statements[position] = CHANGED_STATEMENTS[
+            offspring // MUTATED_STATEMENTS % len(CHANGED_STATEMENTS)
+        ]
+    return f"def {name}():\n" + "".join(f"    {line}\n" for line in statements)
+
+
+@pytest.fixture(scope="module")
+def mutated_test_cases():
+    """Create a test case of the default chromosome length and its offspring."""
+    module_name = "tests.fixtures.examples.queue"
+    config.configuration.module_name = module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+        cluster = generate_test_cluster(module_name)
+    transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+    sources = [_test_case_source("test_parent", None)]
+    sources.extend(
+        _test_case_source(f"test_offspring_{repetition}", repetition)
+        for repetition in range(BENCHMARK_REPETITIONS)
+    )
+    transformer.visit(ast.parse("\n".join(sources)))
+    return tracer, transformer.testcases
+
+
+@pytest.mark.parametrize("prefix_snapshot_cache_size", [0, 100])
+def test_benchmark_execute_mutated_test_cases(
+    mutated_test_cases, prefix_snapshot_cache_size
+):
+    tracer, test_cases = mutated_test_cases
+    assert all(
+        len(test_case.statements) == CHROMOSOME_LENGTH for test_case in test_cases
+    )
+    config.configuration.execution.prefix_snapshot_cache_size = (
+        prefix_snapshot_cache_size
+    )
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    results = [executor.execute(test_case) for test_case in test_cases]
+    executor.shutdown()
+
+    executed = [result.executed_statements for result in results]
+    if prefix_snapshot_cache_size == 0:
+        assert executed == [CHROMOSOME_LENGTH] * (BENCHMARK_REPETITIONS + 1)
+    else:
+        # The first offspring finds out where it diverges from its parent, the
+        # others reuse the state before the changed statements.
+        assert executed[:2] == [CHROMOSOME_LENGTH, CHROMOSOME_LENGTH]
+        assert all(count <= MUTATED_STATEMENTS for count in executed[2:])
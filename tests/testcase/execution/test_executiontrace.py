@@ -4,6 +4,7 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+from math import inf
 from unittest.mock import MagicMock
 
 from pynguin.slicer.executedinstruction import ExecutedInstruction
@@ -82,3 +83,13 @@ def test_merge_min():
     dict1 = {0: 0.3, 1: 0.6}
     ExecutionTrace._merge_min(dict0, dict1)
     assert dict0 == {0: 0.3, 1: 0.2}
+
+
+def test_merge_infinite_distance():
+    trace0 = ExecutionTrace()
+    trace1 = ExecutionTrace()
+    trace1.true_distances[0] = inf
+    trace1.false_distances[0] = 0.0
+    trace0.merge(trace1)
+    assert trace0.true_distances == {0: inf}
+    assert trace0.false_distances == {0: 0.0}
@@ -0,0 +1,191 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Integration tests for the parallel executor."""
+import ast
+import importlib
+import threading
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.assertion.assertion as ass
+import pynguin.configuration as config
+import pynguin.testcase.defaulttestcase as dtc
+import pynguin.testcase.statement as stmt
+
+from pynguin.analyses.constants import EmptyConstantProvider
+from pynguin.analyses.module import generate_test_cluster
+from pynguin.analyses.seeding import AstToTestCaseTransformer
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import ExecutionResult
+from pynguin.testcase.execution import ExecutionTracer
+from pynguin.testcase.execution import ParallelTestCaseExecutor
+from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.testcase.execution import _loads
+from pynguin.testcase.execution import _serialize_result
+
+
+def _create_test_cases(module_name: str, source: str):
+    cluster = generate_test_cluster(module_name)
+    transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+    transformer.visit(ast.parse(source))
+    return transformer.testcases
+
+
+@pytest.fixture
+def triangle_executor():
+    config.configuration.module_name = "tests.fixtures.examples.triangle"
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(config.configuration.module_name, tracer):
+        module = importlib.import_module(config.configuration.module_name)
+        importlib.reload(module)
+        executor = ParallelTestCaseExecutor(TestCaseExecutor(tracer), 2)
+        yield executor
+        executor.shutdown()
+
+
+@pytest.fixture
+def triangle_test_cases():
+    return _create_test_cases(
+        "tests.fixtures.examples.triangle",
+        """def test_case_0():
+    int_0 = 1
+    str_0 = module_0.triangle(int_0, int_0, int_0)
+
+def test_case_1():
+    int_0 = 1
+    int_1 = 2
+    str_0 = module_0.triangle(int_0, int_0, int_1)
+
+def test_case_2():
+    int_0 = 1
+    int_1 = 2
+    int_2 = 3
+    str_0 = module_0.triangle(int_0, int_1, int_2)
+""",
+    )
+
+
+def test_execute_many_matches_sequential(triangle_executor, triangle_test_cases):
+    results = triangle_executor.execute_many(triangle_test_cases)
+    expected = [
+        triangle_executor.execute(test_case) for test_case in triangle_test_cases
+    ]
+    assert [result.execution_trace for result in results] == [
+        result.execution_trace for result in expected
+    ]
+    assert results[0].execution_trace != results[2].execution_trace
+
+
+def test_execute_many_notifies_observers_in_order(
+    triangle_executor, triangle_test_cases
+):
+    observer = MagicMock()
+    triangle_executor.add_observer(observer)
+    results = triangle_executor.execute_many(triangle_test_cases)
+    assert observer.after_test_case_execution_outside_thread.call_args_list == [
+        ((test_case, result),)
+        for test_case, result in zip(triangle_test_cases, results)
+    ]
+    # The other events happen within the worker processes.
+    observer.before_test_case_execution.assert_not_called()
+
+
+def test_execute_many_single_test_case_in_process(
+    triangle_executor, triangle_test_cases
+):
+    triangle_executor.execute_many(triangle_test_cases[:1])
+    assert not triangle_executor._workers
+
+
+def test_observer_change_restarts_workers(triangle_executor, triangle_test_cases):
+    triangle_executor.execute_many(triangle_test_cases)
+    processes = [process for process, _ in triangle_executor._workers]
+    triangle_executor.execute_many(triangle_test_cases)
+    assert [process for process, _ in triangle_executor._workers] == processes
+    triangle_executor.add_observer(MagicMock())
+    triangle_executor.execute_many(triangle_test_cases)
+    assert all(process not in processes for process, _ in triangle_executor._workers)
+    assert all(not process.is_alive() for process in processes)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_execute_many_timeout():
+    module_name = "tests.fixtures.examples.loop"
+    config.configuration.module_name = module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+        executor = ParallelTestCaseExecutor(
+            TestCaseExecutor(tracer, maximum_test_execution_timeout=1), 2
+        )
+        test_cases = _create_test_cases(
+            module_name,
+            """def test_case_0():
+    anything = module_0.loop_with_condition()
+
+def test_case_1():
+    int_0 = 3
+    bool_0 = module_0.here_goes_the_loop(int_0)
+""",
+        )
+        try:
+            executor.execute_many(test_cases)
+            processes = [process for process, _ in executor._workers]
+            results = executor.execute_many(test_cases)
+            # The worker that experienced the timeout was replaced.
+            assert not processes[0].is_alive()
+            assert executor._workers[0][0] is not processes[0]
+            assert executor._workers[1][0] is processes[1]
+        finally:
+            executor.shutdown()
+    assert [result.timeout for result in results] == [True, False]
+
+
+def test_serialize_result_unpicklable_exception():
+    class LocalError(Exception):
+        pass
+
+    result = ExecutionResult()
+    result.report_new_thrown_exception(3, LocalError("foo"))
+    result.raw_return_types[0] = LocalError
+    result.raw_return_types[1] = int
+    loaded = _loads(_serialize_result(result, {}), {})
+    assert isinstance(loaded.exceptions[3], RuntimeError)
+    assert loaded.exceptions[3].args == ("LocalError",)
+    assert loaded.raw_return_types == {1: int}
+
+
+def test_serialize_result_unpicklable_assertion():
+    test_case = dtc.DefaultTestCase(MagicMock())
+    int_stmt = stmt.IntPrimitiveStatement(test_case, 5)
+    test_case.add_statement(int_stmt)
+    result = ExecutionResult(timeout=True)
+    result.report_new_thrown_exception(0, ValueError("foo"))
+    result.execution_trace.covered_line_ids.add(42)
+    result.assertion_trace.add_entry(
+        0, ass.ObjectAssertion(int_stmt.ret_val, threading.Lock())
+    )
+    loaded = _loads(_serialize_result(result, {}), {})
+    assert loaded.timeout
+    assert isinstance(loaded.exceptions[0], ValueError)
+    assert loaded.exceptions[0].args == ("foo",)
+    assert loaded.execution_trace.covered_line_ids == {42}
+    assert not loaded.assertion_trace.get_all_assertions()
+
+
+def test_serialize_result_shared_objects():
+    shared = object()
+    result = ExecutionResult()
+    result.proxy_knowledge[(0, "foo")] = shared  # type: ignore[assignment]
+    shared_objects = {id(shared): shared}
+    loaded = _loads(_serialize_result(result, shared_objects), shared_objects)
+    assert loaded.proxy_knowledge[(0, "foo")] is shared
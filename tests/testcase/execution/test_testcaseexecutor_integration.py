@@ -18,12 +18,22 @@ import pynguin.configuration as config
 from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.analyses.module import generate_test_cluster
 from pynguin.analyses.seeding import AstToTestCaseTransformer
+from pynguin.generation.stoppingconditions.stoppingcondition import (
+    MaxStatementExecutionsStoppingCondition,
+)
+from pynguin.generation.stoppingconditions.stoppingcondition import (
+    MaxTestExecutionsStoppingCondition,
+)
+from pynguin.generator import _reload_instrumentation_loader
 from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import ExecutionResult
 from pynguin.testcase.execution import ExecutionTracer
 from pynguin.testcase.execution import ModuleProvider
 from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.testcase.execution import _LRUCache
 from pynguin.testcase.statement import IntPrimitiveStatement
 from pynguin.testcase.statement import MethodStatement
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
 def test_simple_execution(default_test_case):
@@ -120,6 +130,7 @@ def test_module_provider():
 def test_killing_endless_loop():
     config.configuration.module_name = "tests.fixtures.examples.loop"
     module_name = config.configuration.module_name
+    threads = set(threading.enumerate())
     tracer = ExecutionTracer()
     tracer.current_thread_identifier = threading.current_thread().ident
     with install_import_hook(module_name, tracer):
@@ -139,8 +150,449 @@ def test_killing_endless_loop():
         )
         test_case = transformer.testcases[0]
         executor.execute(test_case)
+        executor.shutdown()
         # Running this with a debugger may break these assertions
-        for thread in threading.enumerate():
-            if "_execute_test_case" in thread.name:
-                thread.join()
-        assert len(threading.enumerate()) == 1  # Only main thread should be alive.
+        for thread in set(threading.enumerate()) - threads:
+            thread.join()
+        # No thread started by the executor should be alive.
+        assert set(threading.enumerate()) <= threads
+
+
+def test_execute_many_observers(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    observer = MagicMock()
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    executor.add_observer(observer)
+    results = executor.execute_many([short_test_case, short_test_case])
+    assert len(results) == 2
+    assert results[0] is not results[1]
+    assert observer.before_test_case_execution.call_count == 2
+    assert observer.before_statement_execution.call_count == 4
+    assert observer.after_test_case_execution_inside_thread.call_count == 2
+    assert observer.after_test_case_execution_outside_thread.call_args_list == [
+        ((short_test_case, results[0]),),
+        ((short_test_case, results[1]),),
+    ]
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_execute_many_continues_after_timeout():
+    config.configuration.module_name = "tests.fixtures.examples.loop"
+    module_name = config.configuration.module_name
+    threads = set(threading.enumerate())
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+
+        executor = TestCaseExecutor(tracer, maximum_test_execution_timeout=1)
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(
+            ast.parse(
+                """def test_case_0():
+    int_0 = 3
+    bool_0 = module_0.here_goes_the_loop(int_0)
+
+def test_case_1():
+    anything = module_0.loop_with_condition()
+
+def test_case_2():
+    int_0 = 3
+    bool_0 = module_0.here_goes_the_loop(int_0)
+"""
+            )
+        )
+        results = executor.execute_many(transformer.testcases)
+        assert [result.timeout for result in results] == [False, True, False]
+        # Only the statements that started executing are counted.
+        assert [result.executed_statements for result in results] == [2, 1, 2]
+        assert results[2].execution_trace.executed_code_objects
+        executor.shutdown()
+        for thread in set(threading.enumerate()) - threads:
+            thread.join()
+
+
+def test_execution_thread_is_reused(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    observer = MagicMock()
+    observer.before_test_case_execution.side_effect = lambda _: idents.append(
+        threading.current_thread().ident
+    )
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    idents: list[int | None] = []
+    executor.add_observer(observer)
+    executor.execute(short_test_case)
+    executor.execute_many([short_test_case, short_test_case])
+    assert len(set(idents)) == 1
+    assert threading.current_thread().ident not in idents
+
+
+def test_shutdown_stops_execution_thread(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.execute(short_test_case)
+    thread = executor._execution_thread.thread
+    finalizer = executor._execution_thread.finalizer
+    executor.shutdown()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not finalizer.alive
+    assert not executor.execute(short_test_case).timeout
+
+
+def test_abandoned_execution_thread_detaches_finalizer():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    execution_thread = executor._get_execution_thread()
+    executor._abandon_execution_thread()
+    execution_thread.thread.join(timeout=5)
+    assert not execution_thread.finalizer.alive
+    assert executor._get_execution_thread().finalizer.alive
+    executor.shutdown()
+
+
+def test_code_cache_hits(short_test_case):
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.set_instrument(True)
+    executor.execute(short_test_case)
+    executor.execute(short_test_case)
+    tracked = {}
+    executor.track_statistics_values(tracked.__setitem__)
+    assert tracked == {
+        RuntimeVariable.CodeCacheHits: 2,
+        RuntimeVariable.CodeCacheMisses: 2,
+    }
+
+
+def test_code_cache_disabled(short_test_case):
+    config.configuration.execution.code_cache_size = 0
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.execute(short_test_case)
+    tracked = {}
+    executor.track_statistics_values(tracked.__setitem__)
+    assert not tracked
+
+
+def test_code_cache_cleared_on_reset():
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    executor.set_instrument(True)
+    node = ast.Module(body=[ast.parse("x = 1").body[0]], type_ignores=[])
+    code = executor.compile_ast(node)
+    assert executor.compile_ast(node) is code
+    tracer.reset()
+    assert executor.compile_ast(node) is not code
+    assert len(tracer.get_subject_properties().existing_code_objects) == 1
+
+
+def test_lru_cache_evicts_by_size():
+    cache = _LRUCache(10, max_bytes=5, size_of=len)
+    cache.put("a", "xx")
+    cache.put("b", "xx")
+    cache.put("c", "xx")
+    assert cache.get("a") is None
+    assert cache.size_in_bytes == 4
+    cache.put("d", "xxxxxx")
+    assert cache.get("d") is None
+    assert cache.get("b") == "xx"
+    cache.clear()
+    assert cache.size_in_bytes == 0
+
+
+def test_code_cache_evicts_least_recently_used():
+    cache = _LRUCache(2)
+    code = compile("x = 1", "<ast>", "exec")
+    cache.put("a", code)
+    cache.put("b", code)
+    assert cache.get("a") is code
+    cache.put("c", code)
+    assert cache.get("b") is None
+    assert cache.get("a") is code
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def _execute_queue_test_cases(source: str, observes_statements: bool = True):
+    module_name = "tests.fixtures.examples.queue"
+    config.configuration.module_name = module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(ast.parse(source))
+        executor = TestCaseExecutor(tracer)
+        observer = MagicMock()
+        observer.before_statement_execution.side_effect = lambda x, y, z: y
+        observer.observes_statements = observes_statements
+        executor.add_observer(observer)
+        return executor.execute_many(transformer.testcases), observer, executor
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        """def test_case_0():
+    int_0 = 2
+    queue_0 = module_0.Queue(int_0)
+    bool_0 = queue_0.enqueue(int_0)
+    int_1 = queue_0.dequeue()
+""",
+        """def test_case_0():
+    int_0 = 2
+    queue_0 = module_0.Queue(int_0)
+    int_1 = 0
+    queue_1 = module_0.Queue(int_1)
+    bool_0 = queue_0.enqueue(int_0)
+""",
+    ],
+)
+def test_compile_whole_test_cases(source):
+    expected, expected_observer, _ = _execute_queue_test_cases(source)
+    config.configuration.execution.compile_whole_test_cases = True
+    results, observer, _ = _execute_queue_test_cases(source)
+    assert [result.execution_trace for result in results] == [
+        result.execution_trace for result in expected
+    ]
+    assert [
+        {pos: type(ex) for pos, ex in result.exceptions.items()} for result in results
+    ] == [
+        {pos: type(ex) for pos, ex in result.exceptions.items()} for result in expected
+    ]
+    assert [
+        (call.args[0].get_position(), call.args[3] is None)
+        for call in observer.after_statement_execution.call_args_list
+    ] == [
+        (call.args[0].get_position(), call.args[3] is None)
+        for call in expected_observer.after_statement_execution.call_args_list
+    ]
+
+
+def test_compile_whole_test_cases_exception_position():
+    config.configuration.execution.compile_whole_test_cases = True
+    results, observer, _ = _execute_queue_test_cases(
+        """def test_case_0():
+    int_0 = 2
+    queue_0 = module_0.Queue(int_0)
+    int_1 = 0
+    queue_1 = module_0.Queue(int_1)
+    bool_0 = queue_0.enqueue(int_0)
+"""
+    )
+    assert list(results[0].exceptions) == [3]
+    assert isinstance(results[0].exceptions[3], AssertionError)
+    assert observer.after_statement_execution.call_count == 4
+    assert isinstance(
+        observer.after_statement_execution.call_args.args[3], AssertionError
+    )
+
+
+def test_compile_whole_test_cases_observer_failure(short_test_case):
+    config.configuration.execution.compile_whole_test_cases = True
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    observer = MagicMock()
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    observer.after_statement_execution.side_effect = ValueError()
+    executor.add_observer(observer)
+    with pytest.raises(ValueError):
+        executor._execute_test_case(short_test_case, MagicMock())
+    assert observer.after_statement_execution.call_count == 1
+
+
+_PREFIX_SOURCE = """def test_case_0():
+    int_0 = 2
+    queue_0 = module_0.Queue(int_0)
+    bool_0 = queue_0.enqueue(int_0)
+
+def test_case_1():
+    int_0 = 2
+    queue_0 = module_0.Queue(int_0)
+    bool_0 = queue_0.enqueue(int_0)
+    int_1 = queue_0.dequeue()
+    int_2 = queue_0.dequeue()
+
+def test_case_2():
+    int_0 = 2
+    queue_0 = module_0.Queue(int_0)
+    int_1 = queue_0.dequeue()
+
+def test_case_3():
+    int_0 = 2
+    queue_0 = module_0.Queue(int_0)
+    bool_0 = queue_0.full()
+"""
+
+
+def test_prefix_snapshots():
+    expected, _, _ = _execute_queue_test_cases(_PREFIX_SOURCE, False)
+    config.configuration.execution.prefix_snapshot_cache_size = 100
+    results, observer, executor = _execute_queue_test_cases(_PREFIX_SOURCE, False)
+    assert [result.execution_trace for result in results] == [
+        result.execution_trace for result in expected
+    ]
+    # Only the statements after the reused prefix are executed.  The third test case
+    # diverges from the first two after two statements, which were not stored in a
+    # snapshot before, but are reused by the fourth one.
+    assert observer.after_statement_execution.call_count == 3 + 2 + 3 + 1
+    assert [result.executed_statements for result in results] == [3, 2, 3, 1]
+    tracked = {}
+    executor.track_statistics_values(tracked.__setitem__)
+    assert tracked[RuntimeVariable.ReusedStatementExecutions] == 3 + 2
+
+
+def test_prefix_snapshots_discarded_on_reinstrumentation():
+    config.configuration.execution.prefix_snapshot_cache_size = 100
+    module_name = "tests.fixtures.examples.queue"
+    config.configuration.module_name = module_name
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    with install_import_hook(module_name, tracer, {config.CoverageMetric.BRANCH}):
+        module = importlib.import_module(module_name)
+        importlib.reload(module)
+        cluster = generate_test_cluster(module_name)
+        transformer = AstToTestCaseTransformer(cluster, False, EmptyConstantProvider())
+        transformer.visit(ast.parse(_PREFIX_SOURCE))
+        executor = TestCaseExecutor(tracer)
+        executor.execute_many(transformer.testcases)
+        # Re-instrument the module, like the final metrics of the generation.
+        _reload_instrumentation_loader({config.CoverageMetric.LINE}, None, tracer)
+        results = executor.execute_many(transformer.testcases)
+    assert all(result.execution_trace.covered_line_ids for result in results)
+    tracked = {}
+    executor.track_statistics_values(tracked.__setitem__)
+    assert tracked[RuntimeVariable.ReusedStatementExecutions] == 2 * (3 + 2)
+
+
+def test_prefix_snapshots_discarded_on_instrument_change():
+    config.configuration.execution.prefix_snapshot_cache_size = 100
+    _, _, executor = _execute_queue_test_cases(_PREFIX_SOURCE, False)
+    executor._prefix_snapshots.put(42, MagicMock())
+    executor.set_instrument(True)
+    assert executor._prefix_snapshots.get(42) is None
+
+
+def test_prefix_snapshots_not_used_when_observing_statements():
+    config.configuration.execution.prefix_snapshot_cache_size = 100
+    _, observer, executor = _execute_queue_test_cases(_PREFIX_SOURCE)
+    assert observer.after_statement_execution.call_count == 3 + 5 + 3 + 3
+    tracked = {}
+    executor.track_statistics_values(tracked.__setitem__)
+    assert tracked[RuntimeVariable.ReusedStatementExecutions] == 0
+
+
+def _result_cache_executor(observes_statements: bool = False):
+    config.configuration.execution.result_cache_size = 100
+    tracer = ExecutionTracer()
+    tracer.current_thread_identifier = threading.current_thread().ident
+    executor = TestCaseExecutor(tracer)
+    observer = MagicMock(observes_statements=observes_statements)
+    observer.before_statement_execution.side_effect = lambda x, y, z: y
+    executor.add_observer(observer)
+    return executor, observer
+
+
+def _result_cache_hit_rate(executor: TestCaseExecutor) -> float:
+    tracked = {}
+    executor.track_statistics_values(tracked.__setitem__)
+    return tracked[RuntimeVariable.ResultCacheHitRate]
+
+
+def test_result_cache(short_test_case):
+    executor, observer = _result_cache_executor()
+    results = [executor.execute(short_test_case.clone()) for _ in range(3)]
+    # The second execution confirms the result of the first one.
+    assert observer.before_test_case_execution.call_count == 2
+    assert observer.after_test_case_execution_outside_thread.call_count == 3
+    assert results[2] is not results[0]
+    assert results[2].execution_trace == results[0].execution_trace
+    assert list(results[2].exceptions) == list(results[0].exceptions)
+    assert _result_cache_hit_rate(executor) == pytest.approx(1 / 3)
+
+
+def test_result_cache_hits_are_not_counted_as_executions(short_test_case):
+    executor, _ = _result_cache_executor()
+    max_tests = MaxTestExecutionsStoppingCondition(100)
+    max_statements = MaxStatementExecutionsStoppingCondition(100)
+    executor.add_observer(max_tests)
+    executor.add_observer(max_statements)
+    results = [executor.execute(short_test_case) for _ in range(3)]
+    assert [result.reused for result in results] == [False, False, True]
+    assert max_tests.current_value() == 2
+    assert max_statements.current_value() == 4
+
+
+def test_result_cache_distinguishes_test_cases(short_test_case):
+    executor, observer = _result_cache_executor()
+    other = short_test_case.clone()
+    other.statements[0].value = 6
+    executor.execute_many([short_test_case, short_test_case, other])
+    executor.execute(other)
+    executor.execute(short_test_case)
+    assert observer.before_test_case_execution.call_count == 4
+    assert _result_cache_hit_rate(executor) == pytest.approx(1 / 5)
+
+
+def test_result_cache_keeps_key_of_mutated_test_case(short_test_case):
+    executor, observer = _result_cache_executor()
+    test_case = short_test_case.clone()
+    executor.execute_many([test_case, test_case])
+    test_case.statements[0].value = 6
+    executor.execute(test_case)
+    executor.execute(short_test_case)
+    assert observer.before_test_case_execution.call_count == 3
+    assert _result_cache_hit_rate(executor) == pytest.approx(1 / 4)
+
+
+def test_result_cache_nondeterministic_test_case(short_test_case):
+    executor, _ = _result_cache_executor()
+    failing = ExecutionResult()
+    failing.report_new_thrown_exception(1, ValueError())
+    executor._execute_in_thread = MagicMock(
+        side_effect=[[ExecutionResult()], [failing], [ExecutionResult()]]
+    )
+    for _ in range(3):
+        executor.execute(short_test_case)
+    assert executor._execute_in_thread.call_count == 3
+    assert _result_cache_hit_rate(executor) == 0.0
+
+
+def test_result_cache_not_used_when_observing_statements(short_test_case):
+    executor, observer = _result_cache_executor(observes_statements=True)
+    for _ in range(3):
+        executor.execute(short_test_case)
+    assert observer.before_test_case_execution.call_count == 3
+    assert _result_cache_hit_rate(executor) == 0.0
+
+
+def test_result_cache_cleared_on_reset(short_test_case):
+    executor, observer = _result_cache_executor()
+    executor.execute(short_test_case)
+    executor.execute(short_test_case)
+    executor.tracer.reset()
+    executor.execute(short_test_case)
+    assert observer.before_test_case_execution.call_count == 3
+
+
+def test_prefix_snapshot_of_uncopyable_state():
+    tracer = ExecutionTracer()
+    executor = TestCaseExecutor(tracer)
+    assert (
+        executor._copy_state({"lock": threading.Lock()}, tracer.get_trace(), ()) is None
+    )
+    assert not tracer.is_disabled()
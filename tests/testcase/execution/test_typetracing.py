@@ -7,15 +7,19 @@
 import ast
 
 from typing import cast
+from unittest import mock
 
 import pytest
 
+import pynguin.configuration as config
+
 from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.analyses.module import generate_test_cluster
 from pynguin.analyses.seeding import AstToTestCaseTransformer
 from pynguin.analyses.typesystem import NoneType
 from pynguin.analyses.typesystem import UnionType
 from pynguin.testcase.execution import ExecutionTracer
+from pynguin.testcase.execution import ParallelTestCaseExecutor
 from pynguin.testcase.execution import ReturnTypeObserver
 from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.testcase.execution import TypeTracingObserver
@@ -23,6 +27,7 @@ from pynguin.testcase.execution import TypeTracingTestCaseExecutor
 from pynguin.utils.generic.genericaccessibleobject import (
     GenericCallableAccessibleObject,
 )
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 
 @pytest.mark.parametrize(
@@ -93,3 +98,72 @@ def test_type_tracing_test_case_executor_integration():
     assert "__rmul__" in acc.inferred_signature.usage_trace["a"].children
     assert int in acc.inferred_signature.usage_trace["a"].type_checks
     assert acc.inferred_signature.return_type == UnionType((NoneType(),))
+
+
+def test_type_tracing_test_case_executor_batches():
+    test_cluster = generate_test_cluster("tests.fixtures.type_tracing.guess_params")
+    visitor = AstToTestCaseTransformer(test_cluster, False, EmptyConstantProvider())
+    visitor.visit(
+        ast.parse(
+            "def test_case():\n"
+            "    int_0 = 0\n"
+            "    var_0 = module_0.foo(int_0, int_0, int_0)"
+        )
+    )
+    test_case = visitor.testcases[0]
+    executor = ParallelTestCaseExecutor(TestCaseExecutor(ExecutionTracer()), 2)
+    t_executor = TypeTracingTestCaseExecutor(executor, test_cluster)
+    try:
+        with mock.patch.object(
+            executor, "execute", wraps=executor.execute
+        ) as execute_mock, mock.patch.object(
+            executor, "execute_many", wraps=executor.execute_many
+        ) as execute_many_mock:
+            results = t_executor.execute_many([test_case, test_case.clone()])
+    finally:
+        executor.shutdown()
+    assert not any(result.timeout for result in results)
+    execute_mock.assert_not_called()
+    assert [len(call.args[0]) for call in execute_many_mock.call_args_list] == [2, 2]
+    acc = cast(
+        GenericCallableAccessibleObject,
+        test_cluster.accessible_objects_under_test[0],
+    )
+    assert "__rmul__" in acc.inferred_signature.usage_trace["a"].children
+    assert int in acc.inferred_signature.usage_trace["a"].type_checks
+
+
+@pytest.mark.parametrize("adaptive,proxied_executions", [(False, 4), (True, 2)])
+def test_adaptive_type_tracing(adaptive, proxied_executions):
+    config.configuration.type_inference.adaptive_type_tracing = adaptive
+    config.configuration.type_inference.type_tracing_probability_decay = 0.0
+    config.configuration.type_inference.type_tracing_min_probability = 0.0
+    test_cluster = generate_test_cluster("tests.fixtures.type_tracing.guess_params")
+    visitor = AstToTestCaseTransformer(test_cluster, False, EmptyConstantProvider())
+    visitor.visit(
+        ast.parse(
+            "def test_case():\n"
+            "    int_0 = 0\n"
+            "    var_0 = module_0.foo(int_0, int_0, int_0)"
+        )
+    )
+    test_case = visitor.testcases[0]
+    executor = TestCaseExecutor(ExecutionTracer())
+    t_executor = TypeTracingTestCaseExecutor(executor, test_cluster)
+    with mock.patch.object(executor, "execute", wraps=executor.execute) as execute_mock:
+        for _ in range(4):
+            t_executor.execute(test_case)
+    assert execute_mock.call_count == 4 + proxied_executions
+    acc = cast(
+        GenericCallableAccessibleObject,
+        test_cluster.accessible_objects_under_test[0],
+    )
+    assert "__rmul__" in acc.inferred_signature.usage_trace["a"].children
+    tracking_fun = mock.MagicMock()
+    t_executor.track_statistics_values(tracking_fun)
+    if adaptive:
+        tracking_fun.assert_called_once_with(
+            RuntimeVariable.SkippedTypeTracingExecutions, 2
+        )
+    else:
+        tracking_fun.assert_not_called()
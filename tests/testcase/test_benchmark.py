@@ -9,8 +9,10 @@ import pytest
 import pynguin.assertion.assertion as ass
 import pynguin.testcase.defaulttestcase as dtc
 import pynguin.testcase.statement as stmt
+import pynguin.testcase.testfactory as tf
 
 from pynguin.analyses.module import ModuleTestCluster
+from pynguin.analyses.module import generate_test_cluster
 
 
 @pytest.fixture
@@ -62,3 +64,26 @@ def test_benchmark_clone(benchmark_test_case):
     for i in range(BENCHMARK_REPETITIONS):
         cloned = cloned.clone()
     assert cloned == benchmark_test_case
+
+
+@pytest.fixture
+def insertion_test_cases():
+    """Create test cases with 100 statements that use the classes of a module."""
+    cluster = generate_test_cluster("tests.fixtures.examples.queue")
+    factory = tf.TestFactory(cluster)
+    test_cases = []
+    for _ in range(5):
+        test_case = dtc.DefaultTestCase(cluster)
+        while test_case.size() < 100:
+            factory.insert_random_statement(test_case, test_case.size())
+        test_cases.append(test_case)
+    return factory, test_cases
+
+
+def test_benchmark_insert_random_statement(insertion_test_cases):
+    factory, test_cases = insertion_test_cases
+    for test_case in test_cases:
+        cloned = test_case.clone()
+        for _ in range(25 * BENCHMARK_REPETITIONS):
+            factory.insert_random_statement(cloned, cloned.size())
+        assert cloned.size() > test_case.size()
@@ -15,6 +15,8 @@ import pynguin.testcase.variablereference as vr
 
 from pynguin.analyses.module import ModuleTestCluster
 from pynguin.analyses.typesystem import AnyType
+from pynguin.analyses.typesystem import Instance
+from pynguin.analyses.typesystem import TypeInfo
 from pynguin.utils.orderedset import OrderedSet
 
 
@@ -143,6 +145,52 @@ def test_hash(default_test_case):
     assert default_test_case.__hash__()
 
 
+def _structural_hash(test_case):
+    memo = {
+        statement.ret_val: idx
+        for idx, statement in enumerate(test_case.statements)
+        if statement.ret_val is not None
+    }
+    return hash(tuple(s.structural_hash(memo) for s in test_case.statements))
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        lambda tc: tc.add_statement(st.IntPrimitiveStatement(tc, 3)),
+        lambda tc: tc.add_statement(st.IntPrimitiveStatement(tc, 3), 0),
+        lambda tc: tc.remove(1),
+        lambda tc: tc.chop(0),
+        lambda tc: tc.set_statement(st.FloatPrimitiveStatement(tc, 1.5), 1),
+        lambda tc: setattr(tc.statements[0], "value", 42),
+        lambda tc: tc.statements[2].replace(
+            tc.statements[0].ret_val, tc.statements[1].ret_val
+        ),
+    ],
+)
+def test_hash_invalidated_on_modification(short_test_case, modify):
+    short_test_case.add_statement(st.FloatPrimitiveStatement(short_test_case, 2.5), 1)
+    before = hash(short_test_case)
+    assert short_test_case._cached_hash == before
+    modify(short_test_case)
+    assert hash(short_test_case) == _structural_hash(short_test_case)
+    assert hash(short_test_case) != before
+
+
+def test_hash_invalidated_on_mutation(short_test_case):
+    before = hash(short_test_case)
+    short_test_case.statements[0].mutate()
+    assert hash(short_test_case) == _structural_hash(short_test_case)
+    assert hash(short_test_case) != before
+
+
+def test_clone_keeps_cached_hash(short_test_case):
+    expected = hash(short_test_case)
+    clone = short_test_case.clone()
+    assert clone._cached_hash == expected
+    assert short_test_case.clone(1)._cached_hash is None
+
+
 @pytest.mark.parametrize(
     "test_case,other,result",
     [
@@ -316,3 +364,75 @@ def test_get_assertions_multiple_statements(default_test_case_with_assertions):
 def test_get_size_with_assertions(default_test_case_with_assertions):
     test_case, assertions = default_test_case_with_assertions
     assert test_case.size_with_assertions() == 6  # 3 stmts + 3 assertions
+
+
+def _assert_type_index_consistent(test_case):
+    index = test_case._get_type_index()
+    test_case.invalidate_type_index()
+    assert test_case._get_type_index() == index
+    for typ in (Instance(TypeInfo(int)), Instance(TypeInfo(float)), AnyType()):
+        for position in range(test_case.size() + 1):
+            assert test_case.get_objects(typ, position) == [
+                statement.ret_val
+                for statement in test_case.statements[:position]
+                if test_case.test_cluster.type_system.is_maybe_subtype(
+                    statement.ret_val.type, typ
+                )
+            ]
+
+
+def test_type_index_consistent(default_test_case, function_mock):
+    test_case = default_test_case
+    for value in range(4):
+        test_case.add_statement(st.IntPrimitiveStatement(test_case, value))
+        test_case.add_statement(st.FloatPrimitiveStatement(test_case, value))
+    assert test_case.get_objects(AnyType(), test_case.size())
+    _assert_type_index_consistent(test_case)
+
+    float_stmt = st.FloatPrimitiveStatement(test_case, 42.0)
+    test_case.add_statement(float_stmt, 3)
+    _assert_type_index_consistent(test_case)
+    test_case.add_variable_creating_statement(
+        st.FunctionStatement(test_case, function_mock, {"z": float_stmt.ret_val}), 5
+    )
+    _assert_type_index_consistent(test_case)
+    int_stmt = st.IntPrimitiveStatement(test_case, 5)
+    test_case.add_statements([int_stmt, st.FloatPrimitiveStatement(test_case)])
+    _assert_type_index_consistent(test_case)
+    test_case.remove(1)
+    _assert_type_index_consistent(test_case)
+    test_case.remove_statement(int_stmt)
+    _assert_type_index_consistent(test_case)
+    test_case.set_statement(st.IntPrimitiveStatement(test_case, 23), 0)
+    _assert_type_index_consistent(test_case)
+    test_case.append_test_case(test_case.clone(4))
+    _assert_type_index_consistent(test_case)
+    test_case.chop(6)
+    _assert_type_index_consistent(test_case)
+    _assert_type_index_consistent(test_case.clone())
+
+
+def test_type_index_follows_return_type(default_test_case, function_mock):
+    float_stmt = st.FloatPrimitiveStatement(default_test_case, 42.0)
+    default_test_case.add_statement(float_stmt)
+    function_stmt = st.FunctionStatement(
+        default_test_case, function_mock, {"z": float_stmt.ret_val}
+    )
+    default_test_case.add_statement(function_stmt)
+    int_type = Instance(TypeInfo(int))
+    assert default_test_case.get_objects(int_type, 2) == []
+    function_mock.inferred_signature.return_type = int_type
+    assert default_test_case.get_objects(int_type, 2) == [function_stmt.ret_val]
+
+
+def test_type_index_invalidated_on_replace(default_test_case):
+    int_0 = st.IntPrimitiveStatement(default_test_case, 0)
+    float_0 = st.FloatPrimitiveStatement(default_test_case, 1.0)
+    default_test_case.add_statements([int_0, float_0])
+    float_type = Instance(TypeInfo(float))
+    assert default_test_case.get_objects(float_type, 2) == [float_0.ret_val]
+    int_0.replace(int_0.ret_val, float_0.ret_val)
+    assert default_test_case.get_objects(float_type, 2) == [
+        float_0.ret_val,
+        float_0.ret_val,
+    ]
@@ -145,3 +145,40 @@ def test_get_time_line_value_no_interpolation(sequence_factory):
     sequence_factory._time_stamps = [start_time + i for i in range(3)]
     sequence_factory._values = [i for i in range(3)]
     assert sequence_factory._get_time_line_value(start_time + 1) == 0
+
+
+def _full_time_line_value(time_stamps, values, preferred_time, interpolation):
+    for i, stamp in enumerate(time_stamps):
+        if stamp < preferred_time:
+            continue
+        if i == 0:
+            return values[i]
+        if not interpolation:
+            return values[i - 1]
+        time_delta = stamp - time_stamps[i - 1]
+        if time_delta > 0:
+            ratio = (float(values[i]) - float(values[i - 1])) / time_delta
+            return float(values[i - 1]) + (preferred_time - time_stamps[i - 1]) * ratio
+    return values[-1]
+
+
+@pytest.mark.parametrize("interpolation", [True, False])
+def test_sequence_factory_keeps_values_per_interval(
+    factory, monkeypatch, interpolation
+):
+    config.configuration.statistics_output.timeline_interval = 10
+    config.configuration.statistics_output.timeline_interpolation = interpolation
+    config.configuration.stopping.maximum_search_time = 100 / 1_000_000_000
+    time_stamps = [3 * i + (i % 4) for i in range(300)]
+    values = [(i * 7) % 23 for i in range(300)]
+    clock = iter(time_stamps)
+    monkeypatch.setattr(time, "time_ns", lambda: next(clock))
+    factory.set_start_time(0)
+    for value in values:
+        factory.update_value(value)
+
+    assert len(factory._time_stamps) <= 2 * (max(time_stamps) // 10 + 1)
+    assert [variable.value for variable in factory.get_output_variables()] == [
+        _full_time_line_value(time_stamps, values, 10 * index, interpolation)
+        for index in range(1, 11)
+    ]
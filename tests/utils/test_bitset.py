@@ -0,0 +1,88 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2023 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import copy
+import pickle
+import sys
+
+import pytest
+
+from pynguin.utils.bitset import BitSet
+from pynguin.utils.orderedset import OrderedSet
+
+
+@pytest.mark.parametrize("length, iterable", [(0, []), (3, [1, 2, 3]), (2, [1, 2, 2])])
+def test_bitset_len(length, iterable):
+    assert len(BitSet(iterable)) == length
+
+
+@pytest.mark.parametrize("element, result", [(0, False), (3, True), (-1, False)])
+def test_bitset_contains(element, result):
+    assert (element in BitSet([1, 2, 3])) == result
+
+
+def test_bitset_iter_ascending():
+    assert list(BitSet([70, 3, 0, 3])) == [0, 3, 70]
+
+
+def test_bitset_add_discard():
+    bit_set = BitSet()
+    bit_set.add(5)
+    bit_set.add(5)
+    bit_set.discard(6)
+    assert bit_set == BitSet([5])
+    bit_set.discard(5)
+    assert not bit_set
+
+
+def test_bitset_negative():
+    with pytest.raises(ValueError):
+        BitSet([-1])
+
+
+@pytest.mark.parametrize(
+    "other", [BitSet([2, 3, 4]), OrderedSet([2, 3, 4]), {2, 3, 4, -1, "foo"}]
+)
+def test_bitset_set_operations(other):
+    bit_set = BitSet([1, 2, 3])
+    assert bit_set.intersection(other) == {2, 3}
+    assert bit_set.difference(other) == {1}
+    assert bit_set & other == {2, 3}
+    assert bit_set - other == {1}
+    assert not bit_set.issubset(other)
+    assert BitSet([2, 3]).issubset(other)
+
+
+def test_bitset_union_update():
+    bit_set = BitSet([1])
+    assert bit_set.union(BitSet([2]), [3]) == {1, 2, 3}
+    bit_set |= BitSet([2])
+    bit_set.update([3], OrderedSet([4]))
+    assert bit_set == BitSet([1, 2, 3, 4])
+
+
+def test_bitset_eq():
+    assert BitSet([1, 2]) == OrderedSet([2, 1])
+    assert OrderedSet([1, 2]) == BitSet([1, 2])
+    assert BitSet([1, 2]) != BitSet([1])
+    assert BitSet() != [1]
+
+
+def test_bitset_copy():
+    bit_set = BitSet([1, 100])
+    copied = copy.copy(bit_set)
+    copied.add(2)
+    assert bit_set == BitSet([1, 100])
+    assert copy.deepcopy(bit_set) == bit_set
+    assert pickle.loads(pickle.dumps(bit_set)) == bit_set
+
+
+def test_bitset_repr():
+    assert repr(BitSet([2, 1])) == "BitSet([1, 2])"
+
+
+def test_bitset_size():
+    assert sys.getsizeof(BitSet([10_000])) > sys.getsizeof(BitSet([1]))
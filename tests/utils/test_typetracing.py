@@ -191,6 +191,20 @@ def test_merge():
     assert str in knowledge1.type_checks
 
 
+def test_merge_reports_change():
+    proxy = tt.ObjectProxy(42)
+    assert proxy + 3
+    with tt.shim_isinstance():
+        assert isinstance(proxy, int)
+    knowledge = tt.UsageTraceNode.from_proxy(proxy)
+    merged = tt.UsageTraceNode(knowledge.name)
+    assert merged.merge(knowledge)
+    assert not merged.merge(knowledge)
+    proxy2 = tt.ObjectProxy(42)
+    assert proxy2 + 3.0
+    assert merged.merge(tt.UsageTraceNode.from_proxy(proxy2))
+
+
 @pytest.mark.parametrize(
     "op,name",
     [